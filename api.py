@@ -1,72 +1,367 @@
-"""
-Sports API client: fetch raw game data with retries and cache.
-Delegates processing to games_processor.
-"""
-import asyncio
-import ssl
-import wifi
-import socketpool
-import adafruit_requests
-from games_processor import process_games
-
-REQUEST_TIMEOUT = 15  # seconds; avoid hanging fetches on slow/unreachable API
-
-
-class SportsAPI:
-    """Facade: fetches raw games from API and returns processed game list."""
-
-    def __init__(self, api_key):
-        self.api_key = api_key
-        self.pool = socketpool.SocketPool(wifi.radio)
-        self.session = adafruit_requests.Session(self.pool, ssl.create_default_context())
-        self.base_url = "https://sports-slim-api.vercel.app/api"
-        self._cache = {}
-
-    async def get_games(self, sport="NFL"):
-        """Fetch and process games for the specified sport. Returns list of processed game dicts."""
-        max_retries = 3
-        retry_delay = 2
-
-        for attempt in range(max_retries):
-            try:
-                print(f"Fetching {sport} games (attempt {attempt + 1}/{max_retries})")
-                raw = self._get_raw_games(sport)
-                if raw is None:
-                    if attempt < max_retries - 1:
-                        await asyncio.sleep(retry_delay)
-                        retry_delay *= 2
-                        continue
-                    if sport in self._cache:
-                        print(f"Using cached data for {sport}")
-                        return self._cache[sport]
-                    print(f"No cached data available for {sport}")
-                    return []
-                games = process_games(raw, sport)
-                if games:
-                    self._cache[sport] = games
-                    print(f"Successfully fetched {len(games)} {sport} games")
-                return games
-            except Exception as e:
-                print(f"Error fetching {sport} games (attempt {attempt + 1}): {e}")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(retry_delay)
-                    retry_delay *= 2
-                else:
-                    if sport in self._cache:
-                        print(f"Using cached data for {sport}")
-                        return self._cache[sport]
-                    return []
-
-    def _get_raw_games(self, sport):
-        """GET raw games list from API. Returns list of dicts or None on failure."""
-        url = f"{self.base_url}/{sport.lower()}/scores?api_key={self.api_key}"
-        try:
-            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("games", [])
-            print(f"API error: {response.status_code}")
-            return None
-        except Exception as e:
-            print(f"Request failed: {e}")
-            return None
+"""
+Sports API client: fetch raw game data with retries, cache and a per-sport circuit breaker.
+Delegates processing to games_processor. Backends (API_BACKEND):
+  json  - sports API JSON, processed on the board
+  frame - pre-processed binary frames from the companion aggregator (no JSON parsing)
+  fanout - receive-only: games multicast by a hub on the LAN (fanout.py), no upstream requests
+  stream - games pushed over SSE by the relay (push.py); polls like "json" while the stream is down
+  replay - responses recorded with API_CAPTURE, read back from REPLAY_FILE at the RTC time (capture.py)
+With FANOUT_PUBLISH the board also multicasts every fresh fetch as the fleet's hub.
+"""
+import asyncio
+import json
+import ssl
+import time
+import wifi
+import socketpool
+import adafruit_requests
+from games_processor import process_games, get_rtc_now, cap_games
+from circuit_breaker import CircuitBreaker, OPEN, HALF_OPEN, classify_error
+from metrics import METRICS
+from log import LOG
+from compression import BodyTooLarge, accept_encoding, open_body
+from deadline import Deadline, MIN_ATTEMPT_TIMEOUT
+from tracing import span
+from memory_governor import note_error
+from config import (
+    API_COMPRESSION,
+    API_BACKEND,
+    API_CAPTURE,
+    API_URL,
+    FEED_URL,
+    FANOUT_PUBLISH,
+    FANOUT_HUB,
+    FANOUT_WAIT,
+    REFRESH_INTERVAL_IDLE,
+    REPLAY_FILE,
+)
+from capture import CaptureLog, CaptureReplay
+from fanout import FanoutHub, FanoutReceiver
+from push import PushStream
+import score_frame
+
+REQUEST_TIMEOUT = 15  # seconds; avoid hanging fetches on slow/unreachable API
+MAX_BODY_BYTES = 256 * 1024  # wire or decoded bytes; a bigger scores response would exhaust the heap parsing
+# 4xx causes worth retrying (request timeout, rate limit); other client errors would just repeat
+RETRYABLE_4XX = ("http_408", "http_429")
+
+# Payload keys that may carry the upstream data timestamp (epoch seconds)
+DATA_TIMESTAMP_KEYS = ("timestamp", "updated_at", "last_updated")
+
+
+class FetchError(Exception):
+    """A fetch attempt failed; cause is a short tag like 'timeout', 'dns' or 'http_503'."""
+
+    def __init__(self, cause):
+        super().__init__(cause)
+        self.cause = cause
+
+
+class SportsAPI:
+    """Facade: fetches raw games from API and returns processed game list."""
+
+    def __init__(self, api_key, backend=None, feed_url=None):
+        self.api_key = api_key
+        self.backend = backend or API_BACKEND
+        self.feed_url = feed_url or FEED_URL
+        self.pool = socketpool.SocketPool(wifi.radio)
+        self.session = adafruit_requests.Session(self.pool, ssl.create_default_context())
+        self.base_url = API_URL
+        self._cache = {}
+        self._breakers = {}  # sport -> CircuitBreaker
+        # Accept-Encoding to send; dropped for the session if a compressed body fails to decode
+        self._accept_encoding = accept_encoding() if API_COMPRESSION else None
+        self._data_times = {}  # sport -> (data epoch seconds or None, time.monotonic() at receipt)
+        self._fresh = {}  # sport -> True if the last get_games got new data, False if it fell back to the cache
+        self._frames = {}  # sport -> (ETag, games) of the last decoded frame ("frame" backend)
+        self.max_games = None  # games kept per sport; set by the memory governor under pressure
+        self.fanout_hub = None
+        self.fanout_receiver = None
+        self.push = PushStream(self.pool, self.feed_url) if self.backend == "stream" else None
+        if self.backend == "fanout":
+            self.fanout_receiver = FanoutReceiver(self.pool, hub=FANOUT_HUB or None)
+        elif FANOUT_PUBLISH:
+            self.fanout_hub = FanoutHub(self.pool)
+        self.capture = CaptureLog(API_CAPTURE) if API_CAPTURE else None
+        self.replay = CaptureReplay(REPLAY_FILE) if self.backend == "replay" else None
+        self._replayed = {}  # sport -> capture time of the last replayed response
+
+    async def get_games(self, sport="NFL", deadline=None):
+        """
+        Fetch and process games for the specified sport. Returns list of processed game dicts.
+        While the sport's circuit is open, returns cached data (or []) without a request;
+        a half-open circuit gets a single probe attempt. fresh(sport) tells the two apart.
+        With a deadline, each attempt's socket timeout is capped by the remaining budget
+        and retries stop (serving cached data) once the budget can't cover another attempt.
+        4xx answers (other than 408/429) and oversize bodies aren't retried within a call.
+        """
+        max_retries = 3
+        retry_delay = 2
+        breaker = self._breaker(sport)
+        self._fresh[sport] = False
+
+        if not breaker.allow():
+            METRICS.incr("api.short_circuits")
+            LOG.info("%s circuit open (%s); retry in %.0fs", sport, breaker.last_cause, breaker.retry_after())
+            return self._cached(sport)
+        attempts = 1 if breaker.state == HALF_OPEN else max_retries
+
+        for attempt in range(attempts):
+            timeout = REQUEST_TIMEOUT
+            if deadline is not None:
+                timeout = min(timeout, deadline.remaining())
+                if timeout < MIN_ATTEMPT_TIMEOUT:
+                    METRICS.incr("api.deadline_abandoned")
+                    LOG.warning("%s fetch out of time budget", sport)
+                    break
+            try:
+                LOG.debug("Fetching %s games (attempt %d/%d)", sport, attempt + 1, attempts)
+                if self.fanout_receiver is not None:
+                    await self._await_fanout(sport, timeout)
+                games = cap_games(self._fetch_games(sport, timeout), self.max_games)
+                breaker.record_success()
+                self._publish_breaker(sport)
+                self._fresh[sport] = True
+                if games:
+                    self._cache[sport] = games
+                    LOG.debug("Successfully fetched %d %s games", len(games), sport)
+                if self.fanout_hub is not None:
+                    self.fanout_hub.publish(sport, games)
+                return games
+            except FetchError as e:
+                cause = e.cause
+            except Exception as e:
+                LOG.warning("Error fetching %s games (attempt %d): %s", sport, attempt + 1, e)
+                note_error(e)
+                cause = "processing"
+            METRICS.incr(f"api.errors.{cause}")
+            breaker.record_failure(cause)
+            self._publish_breaker(sport)
+            if breaker.state == OPEN or attempt == attempts - 1 or not _retryable(cause):
+                break
+            if deadline is not None and deadline.remaining() < retry_delay + MIN_ATTEMPT_TIMEOUT:
+                METRICS.incr("api.deadline_abandoned")
+                LOG.warning("%s retry skipped: out of time budget", sport)
+                break
+            await asyncio.sleep(retry_delay)
+            retry_delay *= 2
+        return self._cached(sport)
+
+    def _cached(self, sport):
+        """Last good games for sport, or [] if none."""
+        if sport in self._cache:
+            METRICS.incr("api.cache_hits")
+            LOG.info("Using cached data for %s", sport)
+            return self._cache[sport]
+        LOG.warning("No cached data available for %s", sport)
+        return []
+
+    def _breaker(self, sport):
+        breaker = self._breakers.get(sport)
+        if breaker is None:
+            breaker = self._breakers[sport] = CircuitBreaker(sport)
+        return breaker
+
+    def _publish_breaker(self, sport):
+        breaker = self._breakers[sport]
+        METRICS.gauge(f"breaker.{sport}.state", breaker.state)
+        METRICS.gauge(f"breaker.{sport}.last_cause", breaker.last_cause)
+
+    def set_game_cap(self, cap):
+        """Keep at most cap games per sport (None = all); trims the cache and drops decoded frames."""
+        self.max_games = cap
+        if cap:
+            for sport, games in self._cache.items():
+                self._cache[sport] = cap_games(games, cap)
+            self._frames = {}
+
+    def breaker_states(self):
+        """{sport: breaker dict} for every sport fetched so far."""
+        return {sport: b.as_dict() for sport, b in self._breakers.items()}
+
+    def fresh(self, sport):
+        """True if the last get_games for sport got new data; False if it served the cache (or [])."""
+        return self._fresh.get(sport, False)
+
+    def data_time(self, sport):
+        """(upstream data epoch seconds or None, monotonic receive time) of the last good fetch."""
+        return self._data_times.get(sport)
+
+    def service(self):
+        """
+        Non-blocking push housekeeping for the main loop: the fan-out hub answers resyncs
+        and sends heartbeats; a fan-out receiver drains datagrams; the push stream reads
+        (and reconnects). Returns True when new games arrived.
+        """
+        if self.fanout_hub is not None:
+            self.fanout_hub.poll()
+        if self.fanout_receiver is not None:
+            return bool(self.fanout_receiver.receive())
+        if self.push is not None:
+            return bool(self.push.poll())
+        return False
+
+    def _fetch_games(self, sport, timeout):
+        """One attempt through the configured backend. Returns processed games; raises FetchError."""
+        if self.backend == "frame":
+            return self._get_frame_games(sport, timeout)
+        if self.backend == "fanout":
+            return self._get_fanout_games(sport, timeout)
+        if self.backend == "stream":
+            state = self.push.state
+            if self.push.live and state.has(sport):
+                METRICS.incr("push.served")
+                self._data_times[sport] = (None, time.monotonic() - state.age(sport))
+                return state.games(sport)
+            METRICS.incr("push.fallback_polls")
+        if self.backend == "replay":
+            raw_games = self._get_replay_games(sport)
+        else:
+            with span("http"):
+                raw_games = self._get_raw_games(sport, timeout)
+        with span("process_games"):
+            return process_games(raw_games, sport)
+
+    def _get_replay_games(self, sport):
+        """Raw games recorded for sport as of the RTC time ([] before its first record)."""
+        METRICS.incr(f"replay.requests.{sport}")
+        now = get_rtc_now()
+        record = self.replay.lookup(sport, now)
+        if record is None:
+            return []
+        recorded_at, data = record
+        if self._replayed.get(sport) != recorded_at:
+            # First time this response is served: how far behind its capture time the poll landed
+            self._replayed[sport] = recorded_at
+            METRICS.observe("replay.fetch_lag_s", now - recorded_at)
+        # Data time is when it was captured, unless the payload carries its own
+        data_time = _data_timestamp(data) if any(k in data for k in DATA_TIMESTAMP_KEYS) else recorded_at
+        self._data_times[sport] = (data_time, time.monotonic())
+        return data.get("games", [])
+
+    async def _await_fanout(self, sport, timeout):
+        """Drain pending datagrams; with no games for sport yet, ask for a snapshot and wait without blocking the loop."""
+        receiver = self.fanout_receiver
+        receiver.receive()
+        if not receiver.has(sport):
+            receiver.request_resync(sport)
+            await receiver.wait(sport, min(timeout, FANOUT_WAIT))
+
+    def _get_fanout_games(self, sport, timeout=REQUEST_TIMEOUT):
+        """Games for sport as last multicast by the hub (received by _await_fanout)."""
+        receiver = self.fanout_receiver
+        if not receiver.has(sport):
+            raise FetchError("timeout")
+        age = receiver.age(sport)
+        if age > 3 * REFRESH_INTERVAL_IDLE:
+            # The hub heartbeats far more often than this; it's gone
+            raise FetchError("stale")
+        self._data_times[sport] = (None, time.monotonic() - age)
+        return receiver.games(sport)
+
+    def _get_frame_games(self, sport, timeout=REQUEST_TIMEOUT):
+        """GET and decode the sport's binary frame from the aggregator. 304 reuses the last frame."""
+        url = f"{self.feed_url}/{sport.lower()}.bin"
+        previous = self._frames.get(sport)
+        headers = {"If-None-Match": previous[0]} if previous else None
+        started = time.monotonic()
+        try:
+            response = self.session.get(url, headers=headers, timeout=timeout)
+        except Exception as e:
+            LOG.warning("Request failed: %s", e)
+            raise FetchError(classify_error(e))
+        try:
+            if response.status_code == 304 and previous:
+                METRICS.incr("api.not_modified")
+                return previous[1]
+            if response.status_code != 200:
+                LOG.warning("Feed error: %s", response.status_code)
+                raise FetchError(f"http_{response.status_code}")
+            try:
+                frame = response.content
+            except OSError as e:
+                raise FetchError(classify_error(e))
+            try:
+                frame_sport, seq, _, games = score_frame.decode(frame)
+            except (ValueError, IndexError) as e:
+                LOG.warning("Bad frame: %s", e)
+                raise FetchError("parse")
+            if frame_sport != sport:
+                raise FetchError("parse")
+            self._frames[sport] = (response.headers.get("etag") or f'"{seq}"', games)
+            self._data_times[sport] = (get_rtc_now(), time.monotonic())
+            METRICS.incr("api.bytes_received", len(frame))
+            METRICS.observe(f"api.wire_bytes.{sport}", len(frame))
+            air_ms = (time.monotonic() - started) * 1000
+            METRICS.observe(f"api.air_ms.{sport}", air_ms)
+            METRICS.histogram(f"api.air_ms.{sport}", air_ms)
+            return games
+        finally:
+            response.close()
+
+    def _get_raw_games(self, sport, timeout=REQUEST_TIMEOUT):
+        """
+        GET raw games list from API. Returns list of dicts; raises FetchError on failure.
+        Asks for a compressed body when supported and parses the JSON from the
+        (incrementally) decoded stream. Records bytes and time on air per sport.
+        timeout bounds the whole attempt, body included, not just each socket read.
+        """
+        url = f"{self.base_url}/{sport.lower()}/scores?api_key={self.api_key}"
+        headers = {"Accept-Encoding": self._accept_encoding} if self._accept_encoding else None
+        started = time.monotonic()
+        try:
+            response = self.session.get(url, headers=headers, timeout=timeout)
+        except Exception as e:
+            LOG.warning("Request failed: %s", e)
+            raise FetchError(classify_error(e))
+        body = None
+        try:
+            if response.status_code != 200:
+                LOG.warning("API error: %s", response.status_code)
+                raise FetchError(f"http_{response.status_code}")
+            try:
+                body = open_body(response, deadline=Deadline(timeout, started), max_bytes=MAX_BODY_BYTES)
+                data = json.load(body)
+            except BodyTooLarge as e:
+                LOG.warning("Response too large: %s", e)
+                raise FetchError("too_large")
+            except OSError as e:
+                LOG.warning("Response read failed: %s", e)
+                raise FetchError(classify_error(e))
+            except Exception as e:
+                LOG.warning("Bad response body: %s", e)
+                if self._accept_encoding and response.headers.get("content-encoding"):
+                    # Don't keep failing on a broken compressed body; ask for plain JSON from now on
+                    LOG.info("Disabling compressed responses")
+                    self._accept_encoding = None
+                    raise FetchError("decode")
+                raise FetchError("parse")
+            self._data_times[sport] = (_data_timestamp(data), time.monotonic())
+            if self.capture is not None:
+                self.capture.record(sport, data)
+            return data.get("games", [])
+        finally:
+            if body is not None:
+                METRICS.incr("api.bytes_received", body.wire_bytes)
+                METRICS.observe(f"api.wire_bytes.{sport}", body.wire_bytes)
+                air_ms = (time.monotonic() - started) * 1000
+                METRICS.observe(f"api.air_ms.{sport}", air_ms)
+                METRICS.histogram(f"api.air_ms.{sport}", air_ms)
+            response.close()
+
+
+def _retryable(cause):
+    """False for failures an immediate retry would only repeat."""
+    if cause == "too_large":
+        return False
+    return not cause.startswith("http_4") or cause in RETRYABLE_4XX
+
+
+def _data_timestamp(data):
+    """Upstream data time (epoch seconds) from the payload, else RTC time at receipt."""
+    for key in DATA_TIMESTAMP_KEYS:
+        value = data.get(key)
+        if isinstance(value, (int, float)):
+            # Some feeds use milliseconds
+            return value / 1000 if value > 1e10 else value
+    return get_rtc_now()
@@ -6,6 +6,7 @@ Print strings are kept short so boot progress fits on the 64px-wide matrix.
 Set TIMEZONE in settings.toml (e.g. America/New_York) so RTC matches local
 time; otherwise IP-based lookup is used. Sync uses timeapi.io and time.now (worldtimeapi.org is shut down).
 """
+import json
 import os
 import time
 import wifi
@@ -13,6 +14,9 @@ import socketpool
 import ssl
 import rtc
 import adafruit_requests
+from compression import open_body
+from deadline import Deadline
+from metrics import METRICS
 
 WIFI_RETRIES = 3
 WIFI_RETRY_DELAY = 5
@@ -43,7 +47,8 @@ def _build_time_urls():
 TIME_URLS = _build_time_urls()
 TIME_SYNC_ATTEMPTS = 2
 TIME_SYNC_DELAY = 2
-TIME_SYNC_TIMEOUT = 10  # seconds; avoid hanging boot if time API is slow/unreachable
+TIME_SYNC_TIMEOUT = 10  # seconds per attempt, body included; avoid hanging boot if time API is slow/unreachable
+TIME_SYNC_MAX_BYTES = 4096  # a time answer is a few hundred bytes; anything bigger isn't one
 
 
 def _timezone_short():
@@ -129,9 +134,16 @@ def sync_rtc(on_progress=None):
             _boot_notify(on_progress, "Clock", line2)
 
             try:
+                deadline = Deadline(TIME_SYNC_TIMEOUT)
                 response = session.get(url, timeout=TIME_SYNC_TIMEOUT)
-                if response.status_code == 200:
-                    time_data = response.json()
+                try:
+                    status = response.status_code
+                    if status == 200:
+                        body = open_body(response, deadline=deadline, max_bytes=TIME_SYNC_MAX_BYTES)
+                        time_data = json.load(body)
+                finally:
+                    response.close()
+                if status == 200:
                     datetime_str = time_data[key][:19]
                     year = int(datetime_str[0:4])
                     month = int(datetime_str[5:7])
@@ -145,9 +157,9 @@ def sync_rtc(on_progress=None):
                     _boot_notify(on_progress, "Clock", "Set OK")
                     print(f"RTC set via {name} ({step})")
                     return True
-                print(f"Clock sync HTTP {response.status_code} ({name} {step})")
+                print(f"Clock sync HTTP {status} ({name} {step})")
                 _boot_notify(on_progress, "Clock", _sync_display_line2(
-                    url, source_idx, source_count, attempt, str(response.status_code)
+                    url, source_idx, source_count, attempt, str(status)
                 ))
             except Exception as e:
                 print(f"Clock sync err {name} {step}: {e}")
@@ -172,6 +184,7 @@ def check_wifi_reconnect(max_retries=None):
         try:
             wifi.radio.connect(ssid, password)
             print("OK")
+            METRICS.incr("wifi.reconnects")
             return True
         except OSError as e:
             print(f"Fail {attempt + 1}")
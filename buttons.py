@@ -8,10 +8,11 @@ import time
 class ButtonController:
     """Tracks two buttons (UP/DOWN) with debounce and calls into DisplayManager on press."""
 
-    def __init__(self, button_up, button_down, debounce_seconds=0.3):
+    def __init__(self, button_up, button_down, debounce_seconds=0.3, fetch_settle_seconds=0.5):
         self.button_up = button_up
         self.button_down = button_down
         self.debounce = debounce_seconds
+        self.fetch_settle = fetch_settle_seconds
         self._last_up_state = True
         self._last_up_time = 0.0
         self._last_down_state = True
@@ -19,11 +20,14 @@ class ButtonController:
 
     async def check(self, display_manager):
         """
-        Check button states; on valid press, run toggle and update_games.
-        Returns True if display_manager.update_games() was called (caller should reset timers).
+        Check button states; on valid press, run toggle (which draws cached games at once)
+        and, if that data is stale, request a background fetch. Fetches go through the
+        display manager's single-flight coordinator, so rapid presses (or both buttons
+        at once) collapse into one fetch for the final selection.
+        Returns True if a press was handled (caller should reset timers).
         """
         current_time = time.monotonic()
-        fetch_data = False
+        handled = False
 
         # UP: toggle all vs live games
         current_up = self.button_up.value
@@ -32,10 +36,10 @@ class ButtonController:
             and self._last_up_state
             and (current_time - self._last_up_time) > self.debounce
         ):
-            fetch_data = display_manager.toggle_game_display()
-            if fetch_data:
-                self._last_up_time = current_time
-                await display_manager.update_games()
+            handled = True
+            self._last_up_time = current_time
+            if display_manager.toggle_game_display():
+                display_manager.request_update(settle=self.fetch_settle)
         self._last_up_state = current_up
 
         # DOWN: cycle sport
@@ -45,10 +49,10 @@ class ButtonController:
             and self._last_down_state
             and (current_time - self._last_down_time) > self.debounce
         ):
-            fetch_data = display_manager.toggle_sport()
-            if fetch_data:
-                self._last_down_time = current_time
-                await display_manager.update_games()
+            handled = True
+            self._last_down_time = current_time
+            if display_manager.toggle_sport():
+                display_manager.request_update(settle=self.fetch_settle)
         self._last_down_state = current_down
 
-        return fetch_data
+        return handled
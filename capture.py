@@ -0,0 +1,92 @@
+"""
+Record and replay of raw sports API responses, to reproduce a game night later.
+With API_CAPTURE set, every good JSON response is appended to that file as one
+line: {"t": RTC epoch seconds, "sport": "NFL", "data": <response JSON>}.
+API_BACKEND = "replay" answers each request from REPLAY_FILE instead: the latest
+recorded response for the sport at the current RTC time (host/replay.py runs a
+whole captured day against main.py on a virtual clock).
+
+On the board the capture path must be writable, e.g. "/sd/capture.jsonl" with an SD card mounted.
+"""
+import json
+from games_processor import get_rtc_now
+from metrics import METRICS
+
+
+class CaptureLog:
+    """Appends raw responses to a JSON-lines file; stops (once, loudly) if the file can't be written."""
+
+    def __init__(self, path):
+        self.path = path
+        self.enabled = True
+
+    def record(self, sport, data):
+        if not self.enabled:
+            return
+        line = json.dumps({"t": get_rtc_now(), "sport": sport, "data": data})
+        try:
+            with open(self.path, "a") as f:
+                f.write(line)
+                f.write("\n")
+            METRICS.incr("capture.records")
+        except OSError as e:
+            self.enabled = False
+            print(f"Capture disabled ({self.path}): {e}")
+
+
+class CaptureReplay:
+    """Recorded responses per sport, looked up by time."""
+
+    def __init__(self, path):
+        self.path = path
+        self._records = {}  # sport -> [(t, data)] sorted by t
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                    t, sport, data = record["t"], record["sport"], record["data"]
+                except (ValueError, KeyError, TypeError):
+                    METRICS.incr("replay.bad_lines")
+                    continue
+                if t is None:
+                    continue
+                self._records.setdefault(sport, []).append((t, data))
+        for records in self._records.values():
+            records.sort(key=lambda r: r[0])
+
+    @property
+    def sports(self):
+        return sorted(self._records)
+
+    @property
+    def start(self):
+        """Epoch of the first record, or None if the file had none."""
+        times = [records[0][0] for records in self._records.values()]
+        return min(times) if times else None
+
+    @property
+    def end(self):
+        times = [records[-1][0] for records in self._records.values()]
+        return max(times) if times else None
+
+    def count(self, sport=None):
+        if sport is not None:
+            return len(self._records.get(sport, []))
+        return sum(len(records) for records in self._records.values())
+
+    def lookup(self, sport, now):
+        """(t, data) of the latest record for sport at or before now, or None."""
+        records = self._records.get(sport)
+        if not records or now is None or now < records[0][0]:
+            return None
+        lo, hi = 0, len(records)
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if records[mid][0] <= now:
+                lo = mid
+            else:
+                hi = mid
+        return records[lo]
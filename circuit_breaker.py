@@ -0,0 +1,98 @@
+"""
+Per-endpoint circuit breaker: closed -> open after repeated failures, then
+half-open once a cool-down passes so a single probe can close it again.
+Remembers the last failure cause (HTTP status, timeout, DNS, ...).
+"""
+import time
+from log import LOG
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+FAILURE_THRESHOLD = 3   # consecutive failed attempts before opening
+COOLDOWN = 60           # seconds open before the first probe
+MAX_COOLDOWN = 600      # cool-down doubles after each failed probe, up to this
+
+
+def classify_error(error):
+    """Short failure cause for an exception: 'timeout', 'dns', 'connection' or 'error'."""
+    text = str(error).lower()
+    name = type(error).__name__.lower()
+    if "timeout" in name or "timed out" in text or "etimedout" in text:
+        return "timeout"
+    if "gaierror" in name or "getaddrinfo" in text or ("name" in text and "resolv" in text):
+        return "dns"
+    if isinstance(error, OSError):
+        return "connection"
+    return "error"
+
+
+class CircuitBreaker:
+    """Breaker state for one endpoint (one sport)."""
+
+    def __init__(self, name, failure_threshold=FAILURE_THRESHOLD, cooldown=COOLDOWN, max_cooldown=MAX_COOLDOWN):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.state = CLOSED
+        self.failures = 0
+        self.cooldown = cooldown
+        self.opened_at = 0.0
+        self.last_cause = None
+        self.trips = 0
+
+    def allow(self, now=None):
+        """True if a request may go out now (closed, or open long enough to probe)."""
+        if self.state == CLOSED or self.state == HALF_OPEN:
+            return True
+        if now is None:
+            now = time.monotonic()
+        if now - self.opened_at >= self.cooldown:
+            self.state = HALF_OPEN
+            LOG.info("Circuit %s: half-open, probing", self.name)
+            return True
+        return False
+
+    def record_success(self):
+        if self.state != CLOSED:
+            LOG.info("Circuit %s: closed", self.name)
+        self.state = CLOSED
+        self.failures = 0
+        self.cooldown = self.base_cooldown
+
+    def record_failure(self, cause, now=None):
+        """Count a failed attempt. Opens the circuit at the threshold or on a failed probe."""
+        if now is None:
+            now = time.monotonic()
+        self.failures += 1
+        self.last_cause = cause
+        if self.state == HALF_OPEN:
+            self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+            self._open(now)
+        elif self.state == CLOSED and self.failures >= self.failure_threshold:
+            self._open(now)
+
+    def _open(self, now):
+        self.state = OPEN
+        self.opened_at = now
+        self.trips += 1
+        LOG.warning("Circuit %s: open for %ss (%s)", self.name, self.cooldown, self.last_cause)
+
+    def retry_after(self, now=None):
+        """Seconds until the next probe is allowed (0 unless open)."""
+        if self.state != OPEN:
+            return 0
+        if now is None:
+            now = time.monotonic()
+        return max(0, self.cooldown - (now - self.opened_at))
+
+    def as_dict(self):
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "last_cause": self.last_cause,
+            "trips": self.trips,
+            "retry_after": self.retry_after(),
+        }
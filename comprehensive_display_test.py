@@ -9,8 +9,8 @@ import displayio
 import terminalio
 from adafruit_display_text.label import Label
 from display_manager import DisplayManager
-from config import DISPLAY_WIDTH, DISPLAY_HEIGHT
-from mock_games import MOCK_GAMES_BY_SPORT, STATUS_TEST_LABELS, create_status_mock_game
+from config import DISPLAY_WIDTH, DISPLAY_HEIGHT, BIT_DEPTH
+from mock_games import MOCK_GAMES_BY_SPORT, STATUS_TEST_LABELS, EDGE_CASE_GAMES, create_status_mock_game
 
 # Random game data for comprehensive pass (broader status coverage)
 RANDOM_TEAMS = {
@@ -98,7 +98,7 @@ class ComprehensiveDisplayTest:
                     display_data = self.display_manager.create_game_text(game)
                     
                     # Display on matrix
-                    await self.display_manager.display_scoreboard(display_data)
+                    self.display_manager.display_scoreboard(display_data)
                     
                     # Show for appropriate time based on status
                     if game['status'] in ['Scheduled', 'Postponed']:
@@ -118,46 +118,7 @@ class ComprehensiveDisplayTest:
         print("\n🔍 Testing Edge Cases")
         print("=" * 40)
         
-        edge_cases = [
-            # Zero scores
-            {
-                "home_team": "TEAM1", "away_team": "TEAM2", "home_score": 0, "away_score": 0,
-                "status": "In Progress", "period": "1Q", "clock": "15:00",
-                "home_record": "0-0", "away_record": "0-0"
-            },
-            # Very high scores
-            {
-                "home_team": "TEAM3", "away_team": "TEAM4", "home_score": 200, "away_score": 198,
-                "status": "In Progress", "period": "4Q", "clock": "00:01",
-                "home_record": "50-0", "away_record": "49-1"
-            },
-            # Long team names
-            {
-                "home_team": "LONGNAME", "away_team": "VERYLONG", "home_score": 5, "away_score": 3,
-                "status": "Final", "period": "F", "clock": "0:00",
-                "home_record": "45-35", "away_record": "42-38"
-            },
-            # Empty records
-            {
-                "home_team": "TEAM5", "away_team": "TEAM6", "home_score": 10, "away_score": 8,
-                "status": "In Progress", "period": "2Q", "clock": "12:30",
-                "home_record": "", "away_record": ""
-            },
-            # Empty period/clock (Scheduled)
-            {
-                "home_team": "TEAM5", "away_team": "TEAM6", "home_score": 0, "away_score": 0,
-                "status": "Scheduled", "period": "", "clock": "",
-                "home_record": "0-0", "away_record": "0-0"
-            },
-            # Special characters in team names
-            {
-                "home_team": "TEAM#", "away_team": "TEAM&", "home_score": 5, "away_score": 3,
-                "status": "Final", "period": "F", "clock": "0:00",
-                "home_record": "45-35", "away_record": "42-38"
-            },
-        ]
-        
-        for i, game in enumerate(edge_cases):
+        for i, game in enumerate(EDGE_CASE_GAMES):
             print(f"  Edge Case {i+1}: {game['away_team']} vs {game['home_team']} - {game['status']}")
             
             try:
@@ -165,7 +126,7 @@ class ComprehensiveDisplayTest:
                 display_data = self.display_manager.create_game_text(game)
                 
                 # Display on matrix
-                await self.display_manager.display_scoreboard(display_data)
+                self.display_manager.display_scoreboard(display_data)
                 await asyncio.sleep(2)
                 
                 print(f"    ✅ Edge case {i+1} successful")
@@ -185,7 +146,7 @@ class ComprehensiveDisplayTest:
         
         try:
             display_data = self.display_manager.create_game_text(test_game)
-            await self.display_manager.display_scoreboard(display_data)
+            self.display_manager.display_scoreboard(display_data)
             await asyncio.sleep(2)
             print("    ✅ ALL mode successful")
         except Exception as e:
@@ -198,7 +159,7 @@ class ComprehensiveDisplayTest:
         
         try:
             display_data = self.display_manager.create_game_text(test_game)
-            await self.display_manager.display_scoreboard(display_data)
+            self.display_manager.display_scoreboard(display_data)
             await asyncio.sleep(2)
             print("    ✅ LIVE mode successful")
         except Exception as e:
@@ -231,7 +192,7 @@ class ComprehensiveDisplayTest:
                 display_data = self.display_manager.create_game_text(test_game)
                 
                 # Display on matrix
-                await self.display_manager.display_scoreboard(display_data)
+                self.display_manager.display_scoreboard(display_data)
                 await asyncio.sleep(1.5)
                 
                 print(f"    ✅ {sport} transition successful")
@@ -250,7 +211,7 @@ class ComprehensiveDisplayTest:
                 game = self._create_random_game(sport, status)
                 try:
                     display_data = self.display_manager.create_game_text(game)
-                    await self.display_manager.display_scoreboard(display_data)
+                    self.display_manager.display_scoreboard(display_data)
                     await asyncio.sleep(1.5)
                     print(f"  ✅ {sport} {status}: {game['away_team']} @ {game['home_team']}")
                 except Exception as e:
@@ -266,7 +227,7 @@ class ComprehensiveDisplayTest:
             game = self._create_random_game("MLB", status)
             try:
                 display_data = self.display_manager.create_game_text(game)
-                await self.display_manager.display_scoreboard(display_data)
+                self.display_manager.display_scoreboard(display_data)
                 await asyncio.sleep(1)
                 print(f"  ✅ {status}")
             except Exception as e:
@@ -305,7 +266,7 @@ class ComprehensiveDisplayTest:
                 self.display_manager.display_static_text(sport)
                 await asyncio.sleep(0.5)
                 display_data = self.display_manager.create_game_text(test_game)
-                await self.display_manager.display_scoreboard(display_data)
+                self.display_manager.display_scoreboard(display_data)
                 await asyncio.sleep(2)
             print("\n✅ Quick test completed!")
         except Exception as e:
@@ -331,7 +292,7 @@ async def _test_one_status(status, display_manager):
     mock_game = create_status_mock_game(status)
     try:
         display_data = display_manager.create_game_text(mock_game)
-        await display_manager.display_scoreboard(display_data)
+        display_manager.display_scoreboard(display_data)
         print(f"✅ Status '{status}' displayed successfully")
     except Exception as e:
         print(f"❌ Error displaying status '{status}': {e}")
@@ -376,7 +337,7 @@ async def run_comprehensive_display_test(display_manager, test_type="comprehensi
 if __name__ == "__main__":
     import board
     from adafruit_matrixportal.matrix import Matrix
-    matrix = Matrix(width=DISPLAY_WIDTH, height=DISPLAY_HEIGHT, bit_depth=6)
+    matrix = Matrix(width=DISPLAY_WIDTH, height=DISPLAY_HEIGHT, bit_depth=BIT_DEPTH)
     display = matrix.display
 
     class MockAPI:
@@ -0,0 +1,255 @@
+"""
+Response body decoding for gzip/deflate-compressed API payloads.
+Bodies are read from response.iter_content in WINDOW-sized chunks and, where the
+runtime allows, inflated incrementally so the JSON parser pulls decompressed
+bytes chunk by chunk instead of buffering the whole payload:
+  - CPython: zlib.decompressobj
+  - MicroPython-style firmware: deflate.DeflateIO
+  - CircuitPython with only zlib.decompress: whole-body inflate (still fewer bytes on air)
+Without any of these the client doesn't advertise compression at all.
+Socket timeouts only bound each read, so a server dripping bytes could hold a
+request open indefinitely; an optional Deadline bounds the whole body, and a byte
+cap applies to both the wire bytes and the decoded size (padding inflates ~1000x).
+"""
+import errno
+try:
+    import zlib
+except ImportError:
+    zlib = None
+try:
+    import deflate
+except ImportError:
+    deflate = None
+
+WINDOW = 512  # bytes per network read and per inflate step
+GZIP_WBITS = 31   # gzip header
+ZLIB_WBITS = 15   # zlib header (HTTP "deflate")
+RAW_WBITS = -15   # headerless deflate some servers send for "deflate"
+
+
+class BodyTooLarge(ValueError):
+    """The body passed the byte cap given to open_body."""
+
+
+def supported():
+    """True if this runtime can inflate gzip/deflate bodies."""
+    return zlib is not None or deflate is not None
+
+
+def accept_encoding():
+    """Accept-Encoding header value to send, or None if compression isn't supported."""
+    return "gzip, deflate" if supported() else None
+
+
+def streaming():
+    """True if bodies are inflated incrementally rather than buffered whole."""
+    return (zlib is not None and hasattr(zlib, "decompressobj")) or deflate is not None
+
+
+class WireReader:
+    """
+    File-like view of the raw response body that counts bytes received.
+    Raises OSError(ETIMEDOUT) once deadline expires and BodyTooLarge past max_bytes.
+    """
+
+    def __init__(self, response, chunk_size=WINDOW, deadline=None, max_bytes=None):
+        self._chunks = response.iter_content(chunk_size=chunk_size)
+        self._buf = b""
+        self._pos = 0
+        self.wire_bytes = 0
+        self.eof = False
+        self.deadline = deadline
+        self.max_bytes = max_bytes
+
+    def _fill(self):
+        while self._pos >= len(self._buf) and not self.eof:
+            if self.deadline is not None and self.deadline.expired():
+                raise OSError(errno.ETIMEDOUT, "body read timed out")
+            try:
+                chunk = next(self._chunks)
+            except StopIteration:
+                self.eof = True
+                return
+            self.wire_bytes += len(chunk)
+            _check_size(self.wire_bytes, self.max_bytes)
+            self._buf = chunk
+            self._pos = 0
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            parts = []
+            while True:
+                part = self.read(WINDOW)
+                if not part:
+                    return b"".join(parts)
+                parts.append(part)
+        self._fill()
+        if self._pos >= len(self._buf):
+            return b""
+        end = min(len(self._buf), self._pos + size)
+        out = self._buf[self._pos:end]
+        self._pos = end
+        return out
+
+    def readinto(self, buf):
+        data = self.read(len(buf))
+        buf[:len(data)] = data
+        return len(data)
+
+    def peek(self, size):
+        """Return up to size bytes without consuming them."""
+        head = self.read(size)
+        self._buf = head + self._buf[self._pos:]
+        self._pos = 0
+        return head
+
+
+def _check_size(size, max_bytes):
+    """Raise BodyTooLarge if size (wire or decoded bytes) is over max_bytes."""
+    if max_bytes is not None and size > max_bytes:
+        raise BodyTooLarge(f"body over {max_bytes} bytes")
+
+
+class _BufferedBody:
+    """Read-only view over an in-memory decoded body."""
+
+    def __init__(self, data, wire):
+        _check_size(len(data), wire.max_bytes)
+        self._data = data
+        self._pos = 0
+        self._wire = wire
+
+    @property
+    def wire_bytes(self):
+        return self._wire.wire_bytes
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = len(self._data) - self._pos
+        out = self._data[self._pos:self._pos + size]
+        self._pos += len(out)
+        return out
+
+    def readinto(self, buf):
+        data = self.read(len(buf))
+        buf[:len(data)] = data
+        return len(data)
+
+
+class _InflateReader:
+    """Inflates a WireReader incrementally, producing at most WINDOW bytes per step."""
+
+    def __init__(self, wire, wbits):
+        self._wire = wire
+        self._inflater = zlib.decompressobj(wbits)
+        self._inflated = 0
+        self._out = b""
+        self._pos = 0
+        self._done = False
+
+    @property
+    def wire_bytes(self):
+        return self._wire.wire_bytes
+
+    def _step(self):
+        tail = self._inflater.unconsumed_tail
+        data = tail if tail else self._wire.read(WINDOW)
+        if not data:
+            self._out = self._inflater.flush()
+            self._done = True
+        else:
+            self._out = self._inflater.decompress(data, WINDOW)
+        self._inflated += len(self._out)
+        _check_size(self._inflated, self._wire.max_bytes)
+        self._pos = 0
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            parts = []
+            while True:
+                part = self.read(WINDOW)
+                if not part:
+                    return b"".join(parts)
+                parts.append(part)
+        while self._pos >= len(self._out):
+            if self._done:
+                return b""
+            self._step()
+        end = min(len(self._out), self._pos + size)
+        out = self._out[self._pos:end]
+        self._pos = end
+        return out
+
+    def readinto(self, buf):
+        data = self.read(len(buf))
+        buf[:len(data)] = data
+        return len(data)
+
+
+class _StreamBody:
+    """Wraps a firmware decompression stream, keeping the wire byte count visible."""
+
+    def __init__(self, stream, wire):
+        self._stream = stream
+        self._wire = wire
+        self._inflated = 0
+
+    @property
+    def wire_bytes(self):
+        return self._wire.wire_bytes
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            out = self._stream.read()
+        else:
+            out = self._stream.read(size)
+        self._inflated += len(out)
+        _check_size(self._inflated, self._wire.max_bytes)
+        return out
+
+    def readinto(self, buf):
+        n = self._stream.readinto(buf)
+        self._inflated += n or 0
+        _check_size(self._inflated, self._wire.max_bytes)
+        return n
+
+
+def _sniff_deflate_wbits(wire):
+    """HTTP 'deflate' is meant to be zlib-wrapped, but some servers send raw deflate."""
+    head = wire.peek(2)
+    if len(head) == 2 and (head[0] & 0x0F) == 8 and ((head[0] << 8) | head[1]) % 31 == 0:
+        return ZLIB_WBITS
+    return RAW_WBITS
+
+
+def open_body(response, chunk_size=WINDOW, deadline=None, max_bytes=None):
+    """
+    File-like body (read/readinto, wire_bytes) for response, decoded per its
+    Content-Encoding. Raises ValueError for encodings this runtime can't decode.
+    Reads fail with OSError(ETIMEDOUT) after deadline (a Deadline) and with
+    BodyTooLarge once more than max_bytes arrive or are decoded.
+    """
+    encoding = str(response.headers.get("content-encoding", "")).strip().lower()
+    wire = WireReader(response, chunk_size, deadline, max_bytes)
+    if encoding in ("", "identity"):
+        return wire
+    if encoding in ("gzip", "x-gzip"):
+        wbits = GZIP_WBITS
+    elif encoding == "deflate":
+        wbits = _sniff_deflate_wbits(wire)
+    else:
+        raise ValueError(f"unsupported encoding {encoding}")
+
+    if zlib is not None and hasattr(zlib, "decompressobj"):
+        return _InflateReader(wire, wbits)
+    if deflate is not None:
+        if wbits == GZIP_WBITS:
+            fmt = deflate.GZIP
+        elif wbits == ZLIB_WBITS:
+            fmt = deflate.ZLIB
+        else:
+            fmt = deflate.RAW
+        return _StreamBody(deflate.DeflateIO(wire, fmt), wire)
+    if zlib is not None:
+        return _BufferedBody(zlib.decompress(wire.read(), wbits), wire)
+    raise ValueError(f"no decoder for {encoding}")
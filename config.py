@@ -51,17 +51,110 @@ def _bool_env(key, default=False):
     return str(val).lower() in ("1", "true", "yes")
 
 
+def _str_env(key, default=""):
+    """Get env value as a stripped string."""
+    val = os.getenv(key, default)
+    if val is None:
+        return default
+    return str(val).strip()
+
+
+# Color bits per channel for the matrix driver: more bits = smoother colors, lower panel refresh rate
+BIT_DEPTH = _int_env("BIT_DEPTH", 6)
+
 # Intervals (seconds). Override in settings.toml.
 DISPLAY_INTERVAL = _int_env("DISPLAY_INTERVAL", 7)
 REFRESH_INTERVAL_LIVE = _int_env("REFRESH_INTERVAL_LIVE", 30)
 REFRESH_INTERVAL_IDLE = _int_env("REFRESH_INTERVAL_IDLE", 300)
+# Shortest time a game is shown when the rotation compresses to fit a refresh interval
+MIN_DWELL = _int_env("MIN_DWELL", 3)
+# How long the rotation stays on a game after a score change, lead change or final
+EVENT_DWELL = _int_env("EVENT_DWELL", 15)
+# Largest share of screen time score events may take (the rotation keeps the rest); an event still
+# waiting after a refresh interval is dropped
+EVENT_SHARE = 0.33
+
+# Hard ceiling (seconds) for one refresh across all sports, retries and backoff sleeps
+FETCH_DEADLINE = _int_env("FETCH_DEADLINE", 40)
 
 # Button debounce (seconds)
 DEBOUNCE_TIME = 0.3
+# Wait after a button press before fetching, so rapid presses coalesce into one fetch
+FETCH_SETTLE = 0.5
+
+# Where scores come from: "json" = sports API directly; "frame" = binary frames from the
+# companion aggregator (host/aggregator.py) at FEED_URL, e.g. "http://192.168.1.10:8080";
+# "stream" = frames pushed over SSE from FEED_URL/events (polls the API while the stream is down);
+# "replay" = responses recorded with API_CAPTURE, read back from REPLAY_FILE by RTC time (capture.py).
+API_BACKEND = _str_env("API_BACKEND", "json").lower()
+# Sports API root for the "json" and "stream" backends; point it at host/mockapi.py to test against faults
+API_URL = _str_env("API_URL", "https://sports-slim-api.vercel.app/api").rstrip("/")
+FEED_URL = _str_env("FEED_URL", "").rstrip("/")
+API_CAPTURE = _str_env("API_CAPTURE", "")  # append raw API responses here, e.g. "/sd/capture.jsonl"
+REPLAY_FILE = _str_env("REPLAY_FILE", "")
+
+# Layout: "local" builds every scoreboard on the board; "host" blits images pre-rendered by the
+# aggregator (python -m host.aggregator --render) from RENDER_URL (defaults to FEED_URL).
+RENDER_MODE = _str_env("RENDER_MODE", "local").lower()
+RENDER_URL = _str_env("RENDER_URL", "").rstrip("/") or FEED_URL
+
+# Push stream: drop and reconnect if nothing (not even a ping) arrives for this long
+STREAM_IDLE_TIMEOUT = _int_env("STREAM_IDLE_TIMEOUT", 45)
+
+# Fleet fan-out (fanout.py): FANOUT_PUBLISH = true makes this board multicast what it fetches;
+# API_BACKEND = "fanout" makes it receive-only. FANOUT_HUB (optional) ignores all hubs but that address.
+# FANOUT_BROADCAST = true when FANOUT_GROUP is the LAN broadcast address rather than a multicast group.
+FANOUT_PUBLISH = _bool_env("FANOUT_PUBLISH", False)
+FANOUT_GROUP = _str_env("FANOUT_GROUP", "239.255.77.77")
+FANOUT_PORT = _int_env("FANOUT_PORT", 5077)
+FANOUT_HUB = _str_env("FANOUT_HUB", "")
+FANOUT_BROADCAST = _bool_env("FANOUT_BROADCAST", False)
+FANOUT_HEARTBEAT = _int_env("FANOUT_HEARTBEAT", 30)  # seconds between repeated snapshots from the hub
+FANOUT_WAIT = 5  # seconds a receiver waits for a first snapshot before reporting a timeout
+
+# Ask the API for gzip/deflate responses (smaller payloads over WiFi). Set API_COMPRESSION = false to disable.
+API_COMPRESSION = _bool_env("API_COMPRESSION", True)
+
+# Seconds between heap samples on serial (free, allocated, largest free block; warns on steady growth). 0 = off
+HEAP_SAMPLE_INTERVAL = _int_env("HEAP_SAMPLE_INTERVAL", 0)
+
+# Time main-loop phases with tracing spans (tracing.py); TRACE_DUMP_INTERVAL = seconds between
+# p50/p95/max summaries on serial (0 = only when TRACER.dump() is called, e.g. from the REPL)
+TRACE_ENABLED = _bool_env("TRACE_ENABLED", False)
+TRACE_DUMP_INTERVAL = _int_env("TRACE_DUMP_INTERVAL", 600)
+
+# Persistent metrics (metrics_log.py): one record every METRICS_LOG_INTERVAL seconds (0 = off) into a
+# ring of METRICS_LOG_SLOTS records at METRICS_LOG_PATH, written METRICS_LOG_BATCH records at a time.
+# Default: two weeks at 10-minute records, one card write an hour. Needs a writable SD card mount.
+METRICS_LOG_INTERVAL = _int_env("METRICS_LOG_INTERVAL", 0)
+METRICS_LOG_PATH = _str_env("METRICS_LOG_PATH", "/sd/metrics.bin")
+METRICS_LOG_SLOTS = _int_env("METRICS_LOG_SLOTS", 2016)
+METRICS_LOG_BATCH = _int_env("METRICS_LOG_BATCH", 6)
+
+# HTTP status endpoint (status_server.py): JSON health at http://<board-ip>:STATUS_PORT/status; 0 = off.
+# Each connection gets STATUS_BUDGET_MS end to end; documents over STATUS_MAX_BYTES shrink.
+STATUS_PORT = _int_env("STATUS_PORT", 0)
+STATUS_BUDGET_MS = _int_env("STATUS_BUDGET_MS", 2000)
+STATUS_MAX_BYTES = _int_env("STATUS_MAX_BYTES", 4096)
+STATUS_POLL_INTERVAL = 0.05  # seconds between the server's non-blocking steps
+
+# Memory governor (memory_governor.py), checked every MEMORY_CHECK_INTERVAL seconds between rotations:
+# under MEMORY_LOW_FREE bytes free it collects and sheds caches; toward MEMORY_CRITICAL_FREE it also keeps
+# MEMORY_GAME_CAP games per sport and quiets logging and tracing. MEMORY_LOW_FREE = 0 turns it off.
+MEMORY_LOW_FREE = _int_env("MEMORY_LOW_FREE", 32768)
+MEMORY_CRITICAL_FREE = _int_env("MEMORY_CRITICAL_FREE", 12288)
+MEMORY_GAME_CAP = _int_env("MEMORY_GAME_CAP", 8)
+MEMORY_CHECK_INTERVAL = _int_env("MEMORY_CHECK_INTERVAL", 5)
 
 # When True, extra logging (e.g. per-game in get_filtered_games). Set DEBUG_DISPLAY = true in settings.toml.
 DEBUG_DISPLAY = _bool_env("DEBUG_DISPLAY", False)
 
+# Hot-path logging (log.py): "debug" adds per-rotation and per-attempt lines, "warning" / "error" quiet
+# serial further. LOG_BUFFER recent lines are kept for LOG.dump() after a crash; LOG_FLUSH_LINES per print.
+LOG_LEVEL = _str_env("LOG_LEVEL", "debug" if DEBUG_DISPLAY else "info")
+LOG_BUFFER = _int_env("LOG_BUFFER", 64)
+LOG_FLUSH_LINES = _int_env("LOG_FLUSH_LINES", 16)
+
 # Main loop policy
 MAX_CONSECUTIVE_ERRORS = 5
 WIFI_CHECK_INTERVAL = 600  # seconds
@@ -0,0 +1,29 @@
+"""
+Deadline: an absolute time budget for a refresh, split across sports and
+retry attempts. Remaining time is handed down as socket timeouts.
+"""
+import time
+
+MIN_ATTEMPT_TIMEOUT = 2  # seconds; don't start (or back off into) a request with less budget than this
+
+
+class Deadline:
+    """Expires a fixed number of seconds after creation (time.monotonic)."""
+
+    def __init__(self, seconds, now=None):
+        if now is None:
+            now = time.monotonic()
+        self.expires_at = now + seconds
+
+    def remaining(self, now=None):
+        """Seconds left, never negative."""
+        if now is None:
+            now = time.monotonic()
+        return max(0.0, self.expires_at - now)
+
+    def expired(self, now=None):
+        return self.remaining(now) <= 0
+
+    def share(self, parts):
+        """Sub-deadline with an even share of what is left (unused time flows to later parts)."""
+        return Deadline(self.remaining() / max(1, parts))
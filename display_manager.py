@@ -1,3 +1,5 @@
+import time
+import asyncio
 import displayio
 import terminalio
 from adafruit_display_text.label import Label
@@ -5,14 +7,40 @@ from team_colors import BRIGHT_YELLOW
 from config import (
     DISPLAY_WIDTH,
     DISPLAY_HEIGHT,
-    DEBUG_DISPLAY,
+    DISPLAY_INTERVAL,
+    EVENT_DWELL,
+    EVENT_SHARE,
+    FETCH_DEADLINE,
+    REFRESH_INTERVAL_LIVE,
+    REFRESH_INTERVAL_IDLE,
     ACTIVE_STATUSES,
     ROW_Y_TOP,
     ROW_Y_MIDDLE,
     ROW_Y_BOTTOM,
+    RENDER_MODE,
+    RENDER_URL,
 )
 from utils import BLACK, WHITE, DIM_GRAY
 from game_display_builder import GameDisplayBuilder
+from game_clock import GameClock, CLOCK_SPORTS
+from games_processor import game_key, get_rtc_now
+from events import detect_events
+from metrics import METRICS
+from log import LOG, DEBUG
+from rotation import RotationScheduler
+from fetch_coordinator import SingleFlight
+from game_store import GameStore, STORE_SPORTS
+from deadline import Deadline, MIN_ATTEMPT_TIMEOUT
+from render_frame import FrameBlitter, RemoteFrames
+from tracing import span, traced
+from memory_governor import note_error
+from adafruit_ticks import ticks_ms, ticks_diff
+
+ROW_KEYS = ('top_row', 'middle_row', 'bottom_row')
+# _blit_remote results (None: no usable host image, build locally)
+BLITTED = "blitted"  # the host image was drawn
+SHOWING = "showing"  # that exact image is already on screen
+
 
 class DisplayManager:
     def __init__(self, display, api):
@@ -20,9 +48,23 @@ class DisplayManager:
         self.api = api
         self.current_sport = "SPORTS"
         self.show_all_games = True  # True = show all games, False = show only active games
-        self.games = []
-        self.current_game_index = 0
+        self.store = GameStore()  # Latest games per sport; self.games is a view of it
+        self.current_game_index = 0  # Index (in get_filtered_games) of the game last shown
+        self.current_dwell = DISPLAY_INTERVAL  # Seconds the current game should stay up
+        self._rotation = RotationScheduler()
+        self._fetcher = SingleFlight()
+        self.needs_display = False  # Set when fresh data should be shown before the dwell ends
         self.supported_sports = ["NFL", "NBA", "NHL", "MLB", "SPORTS"]  # "SPORTS" instead of "ALL"
+        self._scene = None  # What display_scoreboard last put on screen (for in-place patches)
+        self._clocks = {}  # game key -> GameClock for live games with a countdown clock
+        self._event_queue = []  # Pending/showing score events: {"kind", "key", "game", "until", "queued", "data_time"}
+        self._event_credit = EVENT_DWELL  # Seconds of event airtime earned by the rotation (EVENT_SHARE)
+        # RENDER_MODE "host": blit pre-rendered images, building locally only when one is missing
+        self._remote_frames = None
+        self._blitter = None
+        self.lean = False  # Set by the memory governor: no frame bundles or blitter
+        if RENDER_MODE == "host" and hasattr(api, "session"):
+            self._remote_frames = RemoteFrames(api.session, RENDER_URL)
         
         # Create bitmaps and palettes
         self._init_bitmaps()
@@ -48,104 +90,252 @@ class DisplayManager:
             self.separator_bitmap, self.separator_palette,
         )
 
+    @property
+    def games(self):
+        """Games for the current selection (one sport, or every sport for SPORTS)."""
+        return self.store.view(self.current_sport)
+
     def create_text_label(self, text, color=WHITE, x=0, y=16):
         """Create a text label with the given parameters"""
         return Label(terminalio.FONT, text=text, color=color, x=x, y=y)
 
+    @traced("create_game_text")
     def create_game_text(self, game):
         """Create the display_data dict for a game. Delegates to GameDisplayBuilder."""
         return self._builder.create_game_text(game, self.current_sport)
 
+    @traced("display_scoreboard")
     def display_scoreboard(self, display_data):
-        """Render multi-line scoreboard. Main loop owns DISPLAY_INTERVAL timing."""
+        """Render multi-line scoreboard. Main loop owns dwell timing (current_dwell)."""
+        self._scene = None
         try:
             # Validate display_data structure
             if not isinstance(display_data, dict):
-                print("Invalid display_data: not a dictionary")
+                LOG.error("Invalid display_data: not a dictionary")
                 self.display_static_text("Data\nError")
                 return
 
             # Work with a copy so we don't mutate the caller's dict
             data = dict(display_data)
-            for key in ('top_row', 'middle_row', 'bottom_row'):
+            for key in ROW_KEYS:
                 data.setdefault(key, [])
 
             # Create the display group
             display_group = displayio.Group()
+            # Labels per row, aligned with the row's items (None where an item was skipped)
+            labels = {}
 
-            # Create labels for each line (64x32 row baselines from config)
-            y_positions = [ROW_Y_TOP, ROW_Y_MIDDLE, ROW_Y_BOTTOM]
-
-            # Display top row
+            # Display top row (64x32 row baselines from config)
             try:
-                for item in data['top_row']:
-                    if isinstance(item, dict) and 'text' in item:
-                        label = self.create_text_label(
-                            str(item['text']), 
-                            item.get('color', WHITE), 
-                            x=item.get('x', 0), 
-                            y=y_positions[0]
-                        )
-                        display_group.append(label)
+                labels['top_row'] = self._render_row(display_group, data['top_row'], ROW_Y_TOP, False)
             except Exception as e:
-                print(f"Error rendering top row: {e}")
+                LOG.error("Error rendering top row: %s", e)
             
             # Add special display elements safely
+            elements = {}
             try:
                 if 'underline' in data:
                     display_group.append(data['underline'])
+                    elements['underline'] = data['underline']
                 if 'diamond' in data:
                     display_group.append(data['diamond'])
+                    elements['diamond'] = data['diamond']
                 if 'separators' in data:
                     for separator in data['separators']:
                         display_group.append(separator)
+                    elements['separators'] = list(data['separators'])
 
             except Exception as e:
-                print(f"Error adding special elements: {e}")
+                LOG.error("Error adding special elements: %s", e)
             
             # Display middle row
             try:
-                for item in data['middle_row']:
-                    if isinstance(item, dict) and 'text' in item and item['text']:
-                        label = self.create_text_label(
-                            str(item['text']), 
-                            item.get('color', WHITE), 
-                            x=item.get('x', 0), 
-                            y=y_positions[1]
-                        )
-                        display_group.append(label)
+                labels['middle_row'] = self._render_row(display_group, data['middle_row'], ROW_Y_MIDDLE, True)
             except Exception as e:
-                print(f"Error rendering middle row: {e}")
+                LOG.error("Error rendering middle row: %s", e)
             
             # Display bottom row
             try:
-                for item in data['bottom_row']:
-                    if isinstance(item, dict) and 'text' in item and item['text']:
-                        label = self.create_text_label(
-                            str(item['text']), 
-                            item.get('color', WHITE), 
-                            x=item.get('x', 0), 
-                            y=y_positions[2]
-                        )
-                        display_group.append(label)
+                labels['bottom_row'] = self._render_row(display_group, data['bottom_row'], ROW_Y_BOTTOM, True)
             except Exception as e:
-                print(f"Error rendering bottom row: {e}")
+                LOG.error("Error rendering bottom row: %s", e)
             
             # Set as root group
             try:
                 self.display.root_group = display_group
             except Exception as e:
-                print(f"Error setting display group: {e}")
+                LOG.error("Error setting display group: %s", e)
                 self.display_static_text("Display\nFailed")
                 return
+
+            # Remember what is on screen so a refresh can patch it in place
+            if len(labels) == len(ROW_KEYS):
+                self._scene = {
+                    "key": None,
+                    "game": None,
+                    "group": display_group,
+                    "rows": {key: [dict(item) if isinstance(item, dict) else item for item in data[key]] for key in ROW_KEYS},
+                    "labels": labels,
+                    "elements": elements,
+                }
             
         except Exception as e:
-            print(f"Critical error in display_scoreboard: {e}")
+            LOG.error("Critical error in display_scoreboard: %s", e)
+            note_error(e)
             self.display_static_text("Render\nError")
 
+    def _render_row(self, group, items, y, skip_empty):
+        """Append a label per row item to group. Returns labels aligned with items."""
+        labels = []
+        for item in items:
+            if isinstance(item, dict) and 'text' in item and (item['text'] or not skip_empty):
+                label = self.create_text_label(
+                    str(item['text']),
+                    item.get('color', WHITE),
+                    x=item.get('x', 0),
+                    y=y
+                )
+                group.append(label)
+                labels.append(label)
+            else:
+                labels.append(None)
+        return labels
+
+    def refresh_current_game(self):
+        """
+        Diff the on-screen game against the latest data and patch changed labels in place.
+        Falls back to a full display_scoreboard when the layout structure changed, or when
+        a host frame is up and the bundle has no image of the new data.
+        Returns True if the screen was updated.
+        """
+        scene = self._scene
+        if scene is None or scene["key"] is None:
+            return False
+        key = scene["key"]
+        game = None
+        for g in self.games:
+            if game_key(g) == key:
+                game = g
+                break
+        if game is None:
+            return False
+        if "image" in scene:
+            shown = None if self.lean else self._blit_remote(game)
+            if shown is not None:
+                return shown == BLITTED
+        game = self._with_live_clock(game)
+        if game == scene["game"] and "image" not in scene:
+            return False
+        try:
+            display_data = self.create_game_text(game)
+            if "image" in scene or not self._patch_scene(scene, display_data):
+                LOG.debug("No host frame or layout changed; rebuilding scoreboard")
+                self.display_scoreboard(display_data)
+                if self._scene is None:
+                    return True
+            self._scene["key"] = key
+            self._scene["game"] = game
+            return True
+        except Exception as e:
+            LOG.error("Error patching scoreboard: %s", e)
+            note_error(e)
+            return False
+
+    def tick(self):
+        """Called every main-loop pass: repaint the shown game when its interpolated clock moves."""
+        if self._scene is None or self._scene["key"] not in self._clocks or "image" in self._scene:
+            return False
+        return self.refresh_current_game()
+
+    def _with_live_clock(self, game):
+        """Copy of game with the locally interpolated clock in place of the polled one."""
+        view = dict(game)
+        clock = self._clocks.get(game_key(game))
+        if clock is not None:
+            view["clock"] = clock.display_text()
+        return view
+
+    def _anchor_clocks(self):
+        """Re-anchor per-game clock models from freshly fetched games; drop finished ones."""
+        clocks = {}
+        for game in self.games:
+            if game.get("sport") not in CLOCK_SPORTS or not game.get("clock"):
+                continue
+            key = game_key(game)
+            clock = self._clocks.get(key) or GameClock()
+            clock.anchor(
+                game.get("clock", ""),
+                game.get("period", ""),
+                game.get("status") == "In Progress",
+                game.get("stoppage", False),
+            )
+            clocks[key] = clock
+        self._clocks = clocks
+
+    def _patch_scene(self, scene, display_data):
+        """Apply display_data to the on-screen group. Returns False if a rebuild is needed."""
+        elements = scene["elements"]
+        for key in ('underline', 'diamond'):
+            if (key in display_data) != (key in elements):
+                return False
+        if len(display_data.get('separators', [])) != len(elements.get('separators', [])):
+            return False
+
+        # Check every row lines up with the labels on screen before touching anything
+        for key in ROW_KEYS:
+            new_items = display_data.get(key, [])
+            labels = scene["labels"][key]
+            if len(new_items) != len(labels):
+                return False
+            skip_empty = key != 'top_row'
+            for label, item in zip(labels, new_items):
+                if not isinstance(item, dict) or 'text' not in item:
+                    return False
+                if (label is None) != (skip_empty and not item['text']):
+                    return False
+
+        for key in ROW_KEYS:
+            old_items = scene["rows"][key]
+            for i, item in enumerate(display_data.get(key, [])):
+                label = scene["labels"][key][i]
+                old = old_items[i]
+                if label is None:
+                    continue
+                text = str(item['text'])
+                color = item.get('color', WHITE)
+                x = item.get('x', 0)
+                if text != str(old['text']):
+                    label.text = text
+                if color != old.get('color', WHITE):
+                    label.color = color
+                if x != old.get('x', 0):
+                    label.x = x
+                old_items[i] = dict(item)
+
+        group = scene["group"]
+        if 'underline' in elements:
+            old_line = elements['underline']
+            new_line = display_data['underline']
+            if (
+                old_line.x != new_line.x
+                or old_line.y != new_line.y
+                or old_line.pixel_shader[1] != new_line.pixel_shader[1]
+            ):
+                group[group.index(old_line)] = new_line
+                elements['underline'] = new_line
+        if 'diamond' in elements:
+            # Bases are redrawn into the shared base bitmap; only the position can change
+            elements['diamond'].x = display_data['diamond'].x
+            elements['diamond'].y = display_data['diamond'].y
+        for old_sep, new_sep in zip(elements.get('separators', []), display_data.get('separators', [])):
+            old_sep.x = new_sep.x
+            old_sep.y = new_sep.y
+        return True
+
     def display_static_text(self, text, color=None):
         """Display static centered text with support for newlines"""
         color = WHITE if color is None else color  # Default white
+        self._scene = None
         
         # Create the display group
         group = displayio.Group()
@@ -179,174 +369,368 @@ class DisplayManager:
         self.display.root_group = group
 
     def toggle_sport(self):
-        """Cycle through supported sports"""
+        """
+        Cycle through supported sports. Cached games for the new selection are shown
+        immediately. Returns True if the cached data is stale and should be refetched.
+        """
         current_index = self.supported_sports.index(self.current_sport)
         next_index = (current_index + 1) % len(self.supported_sports)
         self.current_sport = self.supported_sports[next_index]
-        self.current_game_index = 0
-        self.games = []  # Clear existing games data
-        
-        # Display a short message about the current sport
-        mode = "ALL" if self.show_all_games else "LIVE"
-        self.display_static_text(f"{mode}\n{self.current_sport}")
-        print(f"Switched to {self.current_sport}")
-        return True
+        LOG.info("Switched to %s", self.current_sport)
+        return self._switch_view()
         
     def toggle_game_display(self):
-        """Toggle between showing all games and only active/upcoming games"""
+        """
+        Toggle between showing all games and only active/upcoming games.
+        Returns True if the cached data is stale and should be refetched.
+        """
         # Simply toggle the flag
         self.show_all_games = not self.show_all_games
+        LOG.info("Now showing %s %s games", "all" if self.show_all_games else "active (or scheduled if no active)", self.current_sport)
+        return self._switch_view()
+
+    def _switch_view(self):
+        """Restart the rotation for the new sport/mode, drawing cached games in this call."""
         self.current_game_index = 0
-        
-        # Display a short message about the current mode
-        mode = "ALL" if self.show_all_games else "LIVE"
-        self.display_static_text(f"{mode}\n{self.current_sport}")
-        
-        print(f"Now showing {'all' if self.show_all_games else 'active (or scheduled if no active)'} {self.current_sport} games")
-        return True
-        
+        self._rotation.reset()
+        self._clear_events()
+        stale = self.store.is_stale(self.current_sport, self.refresh_interval())
+        if self.get_filtered_games():
+            self._display_next()
+        else:
+            # Nothing cached yet: show a short message about the current mode until the fetch lands
+            mode = "ALL" if self.show_all_games else "LIVE"
+            self.display_static_text(f"{mode}\n{self.current_sport}")
+        return stale
+
     async def update_games(self):
-        """Update games from API with error recovery"""
+        """Update games for the current sport; joins a fetch already in flight for it."""
+        target = self.current_sport
+        await self._fetcher.run(target, lambda: self._fetch_games(target))
+
+    def request_update(self, settle=0):
+        """
+        Start a background fetch for the current sport without waiting for it.
+        Supersedes (cancels) an in-flight fetch for another sport. settle delays the
+        first request so rapid button presses collapse into one fetch.
+        """
+        target = self.current_sport
+        self._fetcher.request(target, lambda: self._fetch_games(target, settle))
+
+    @property
+    def fetch_pending(self):
+        """True while a fetch is in flight."""
+        return self._fetcher.busy
+
+    async def _fetch_games(self, target, settle=0):
+        """
+        Fetch games for target sport (or SPORTS) into the store with error recovery.
+        The whole refresh runs under FETCH_DEADLINE, shared evenly across the sports
+        still to fetch; sports whose fetch fails, or that are left when it expires, keep
+        their stored games (and age).
+        """
+        if settle:
+            await asyncio.sleep(settle)
+        old_games = self.games
+        started = time.monotonic()
+        deadline = Deadline(FETCH_DEADLINE)
         try:
-            if self.current_sport == "SPORTS":
-                # Fetch games from all sports
-                new_games = []
-                successful_sports = 0
-                for sport in ["NFL", "NBA", "NHL", "MLB"]:
+            sports = STORE_SPORTS if target == "SPORTS" else (target,)
+            successful_sports = 0
+            with span("refresh"):
+                for i, sport in enumerate(sports):
+                    if deadline.expired():
+                        METRICS.incr("fetch.deadline_expired")
+                        LOG.warning("Refresh deadline hit; keeping stored %s games", ", ".join(sports[i:]))
+                        break
                     try:
-                        sport_games = await self.api.get_games(sport)
-                        if sport_games:
-                            # Add sport identifier to each game
-                            for game in sport_games:
-                                if isinstance(game, dict):  # Validate game is a dict
-                                    game["sport"] = sport
-                                    new_games.append(game)
+                        with span("get_games", sport):
+                            sport_games = await self.api.get_games(sport, deadline=deadline.share(len(sports) - i))
+                        if hasattr(self.api, "fresh") and not self.api.fresh(sport):
+                            LOG.warning("%s fetch failed; keeping stored games", sport)
+                            continue
+                        valid_games = [g for g in sport_games if isinstance(g, dict)] if sport_games else []
+                        self.store.put(sport, valid_games)
+                        if valid_games:
                             successful_sports += 1
-                            print(f"Fetched {len(sport_games)} {sport} games")
+                            LOG.info("Fetched %d %s games", len(valid_games), sport)
                     except Exception as e:
-                        print(f"Failed to fetch {sport} games: {e}")
+                        LOG.warning("Failed to fetch %s games: %s", sport, e)
+                        note_error(e)
                         continue
-                
-                if new_games:
-                    self.games = new_games
-                    print(f"Updated games: {len(self.games)} games from {successful_sports}/4 sports")
-                elif not self.games:  # Only show error if we have no cached games
-                    print("No games available from any sport")
+
+            if self._remote_frames is not None and not self.lean:
+                for sport in sports:
+                    remaining = deadline.remaining()
+                    if remaining < MIN_ATTEMPT_TIMEOUT:
+                        METRICS.incr("render.deadline_skipped")
+                        break
+                    self._remote_frames.fetch(sport, timeout=remaining)
+
+            METRICS.observe("fetch.refresh_s", time.monotonic() - started)
+            if target != self.current_sport:
+                return  # Switched away while fetching; the store keeps the data for later
+            if self.games:
+                LOG.info("Updated games: %d games from %d/%d sports", len(self.games), successful_sports, len(sports))
             else:
-                # Regular single sport fetch
-                try:
-                    new_games = await self.api.get_games(self.current_sport)
-                    if new_games:  # Only update if we got valid data
-                        # Validate and add sport identifier
-                        valid_games = []
-                        for game in new_games:
-                            if isinstance(game, dict):
-                                game["sport"] = self.current_sport
-                                valid_games.append(game)
-                        
-                        if valid_games:
-                            self.games = valid_games
-                            print(f"Updated games: {len(self.games)} {self.current_sport} games found")
-                        else:
-                            print("No valid games received from API")
-                    else:
-                        print("No games data received from API")
-                except Exception as e:
-                    print(f"Error fetching {self.current_sport} games: {e}")
+                LOG.info("No %s games available", target)
+
+            # Patch the game on screen now rather than waiting for the next rotation
+            self._rotation.invalidate()
+            self._anchor_clocks()
+            self.refresh_current_game()
+
+            # Jump straight to games that just scored or went final
+            if self.games is not old_games:
+                self._queue_events(detect_events(old_games, self.games))
+            if self._event_queue:
+                self._show_event()
+
+            # A switch message is on screen: show the new games without waiting out the dwell
+            if self._scene is None:
+                self.needs_display = True
         except Exception as e:
-            print(f"Critical error updating games: {e}")
+            LOG.error("Critical error updating games: %s", e)
+            note_error(e)
             
     async def display_current_game(self):
-        """Display the current game with error recovery"""
+        """Display the next game in the rotation with error recovery"""
+        METRICS.incr("display.cycles")
+        self._display_next()
+
+    def _display_next(self):
+        """Show the next game (or the event game / an empty-state message). Synchronous."""
         try:
+            if self._show_event():
+                return
+
+            self.needs_display = False
             filtered_games = self.get_filtered_games()
             total_games = len(filtered_games)
-            
-            print(f"Display current game: {self.current_game_index + 1}/{total_games} games")
-            
+
+            if not filtered_games and self.fetch_pending:
+                return  # Keep the switch message up until the fetch lands
             if not filtered_games:
+                LOG.debug("Display current game: 0/0 games")
+                self.current_dwell = DISPLAY_INTERVAL
                 if self.show_all_games:
                     self.display_static_text(f"No {self.current_sport}\nGames")
                 else:
                     self.display_static_text(f"No Live\n{self.current_sport}")
                 return
-                
-            # Ensure index is valid
-            if self.current_game_index >= total_games:
-                self.current_game_index = 0
-                
-            game = filtered_games[self.current_game_index]
+
+            index, dwell = self._rotation.next(filtered_games, self.refresh_interval())
+            self.current_game_index = index
+            self.current_dwell = dwell
+            self._event_credit = min(EVENT_DWELL, self._event_credit + dwell * EVENT_SHARE / (1 - EVENT_SHARE))
+            LOG.debug("Display current game: %d/%d games (%.0fs)", index + 1, total_games, dwell)
+            game = filtered_games[index]
             
             # Validate game data before processing
             if not self._validate_game_data(game):
-                print(f"Invalid game data, skipping: {game.get('away_team')} @ {game.get('home_team')} ({game.get('status')})")
-                self.current_game_index = (self.current_game_index + 1) % total_games
+                LOG.warning("Invalid game data, skipping: %s @ %s (%s)", game.get("away_team"), game.get("home_team"), game.get("status"))
+                self.current_dwell = 0  # Move straight on to the next game
                 return
                 
-            print(f"Showing game: {game['home_team']} vs {game['away_team']} - Status: {game['status']}")
+            LOG.debug("Showing game: %s vs %s - Status: %s", game["home_team"], game["away_team"], game["status"])
             
             try:
-                game_text_lines = self.create_game_text(game)
-                self.display_scoreboard(game_text_lines)
+                self._render_game(game)
             except Exception as e:
-                print(f"Error creating display for game: {e}")
+                LOG.error("Error creating display for game: %s", e)
+                note_error(e)
                 self.display_static_text("Display\nError")
-                
-            # Update index for next time
-            self.current_game_index = (self.current_game_index + 1) % total_games
             
         except Exception as e:
-            print(f"Critical error in display_current_game: {e}")
+            LOG.error("Critical error in display_current_game: %s", e)
+            note_error(e)
             self.display_static_text("Game\nError")
 
+    def refresh_interval(self):
+        """Seconds between API refreshes: short while any game is live."""
+        has_live = any(g.get("status") in ACTIVE_STATUSES for g in self.games) if self.games else False
+        return REFRESH_INTERVAL_LIVE if has_live else REFRESH_INTERVAL_IDLE
+
+    def _render_game(self, game):
+        """Build and show the scoreboard for game, remembering it for in-place patches."""
+        METRICS.incr("display.renders")
+        if self._remote_frames is not None and not self.lean and self._blit_remote(game) is not None:
+            return
+        started = ticks_ms()
+        game = self._with_live_clock(game)
+        game_text_lines = self.create_game_text(game)
+        self.display_scoreboard(game_text_lines)
+        METRICS.observe("display.render_ms", ticks_diff(ticks_ms(), started))
+        if self._scene is not None:
+            self._scene["key"] = game_key(game)
+            self._scene["game"] = game
+
+    def _blit_remote(self, game):
+        """Show the host's pre-rendered image of game: BLITTED, SHOWING if it is already up, None if there is none to show."""
+        image = self._remote_frames.image_for(game)
+        if image is None:
+            return None
+        scene = self._scene
+        if scene is not None and scene.get("image") is image:
+            scene["game"] = game
+            return SHOWING
+        if self._blitter is None:
+            self._blitter = FrameBlitter()
+        if not self._blitter.blit(image):
+            return None
+        if self.display.root_group is not self._blitter.group:
+            self.display.root_group = self._blitter.group
+        self._scene = {"key": game_key(game), "game": game, "image": image}
+        return BLITTED
+
+    def set_lean(self, lean):
+        """
+        Memory governor: lean drops the pre-rendered frame bundles and the blitter, so games
+        are built locally, and the cached SPORTS view once; False goes back to normal.
+        A pre-rendered image on screen is replaced by a local build at the next display phase.
+        """
+        self.lean = lean
+        if not lean:
+            return
+        self.store.drop_view()
+        self._blitter = None
+        if self._remote_frames is not None:
+            self._remote_frames.clear()
+        if self._scene is not None and "image" in self._scene:
+            self._scene = None
+            self.needs_display = True
+
+    def set_game_cap(self, cap):
+        """Memory governor: keep at most cap games per sport (None = all), here and in the API cache."""
+        if hasattr(self.api, "set_game_cap"):
+            self.api.set_game_cap(cap)
+        if cap:
+            self.store.trim(cap)
+            self._rotation.invalidate()
+
+    def _queue_events(self, events):
+        """
+        Queue score events for games in the current view (one entry per game), each with
+        the data time of the fetch that detected it for the latency metrics. A newer
+        event for a game still waiting replaces its entry in place (and its age).
+        """
+        if not events:
+            return
+        visible = set(game_key(g) for g in self.get_filtered_games())
+        queued = dict((e["key"], e) for e in self._event_queue)
+        for kind, key, game in events:
+            METRICS.incr(f"events.{kind}")
+            if key not in visible:
+                continue
+            entry = queued.get(key)
+            if entry is not None and entry["until"] is not None:
+                continue  # On screen now
+            LOG.info("Event %s: %s @ %s", kind, game.get("away_team"), game.get("home_team"))
+            data_time = self.api.data_time(game.get("sport")) if hasattr(self.api, "data_time") else None
+            if entry is None:
+                entry = {"key": key, "until": None}
+                self._event_queue.append(entry)
+                queued[key] = entry
+            entry.update(kind=kind, game=game, queued=time.monotonic(), data_time=data_time)
+
+    def _clear_events(self):
+        self._event_queue = []
+
+    def _show_event(self):
+        """
+        Keep the screen on the oldest queued event game for EVENT_DWELL seconds.
+        Returns True while an event owns the screen; the rotation does not advance
+        meanwhile, so it resumes where it was interrupted once the queue drains.
+        An event starts only when the rotation has earned EVENT_DWELL seconds of
+        airtime (EVENT_SHARE of the screen), and one still waiting after a refresh
+        interval is dropped; the next fetch has newer news.
+        """
+        now = time.monotonic()
+        while self._event_queue:
+            event = self._event_queue[0]
+            game = None
+            for g in self.games:
+                if game_key(g) == event["key"]:
+                    game = g
+                    break
+            if game is None:
+                self._event_queue.pop(0)
+                continue
+            if event["until"] is None:
+                if now - event["queued"] > self.refresh_interval():
+                    METRICS.incr("events.expired")
+                    self._event_queue.pop(0)
+                    continue
+                if self._event_credit < EVENT_DWELL:
+                    return False  # The rotation runs until it has earned the airtime
+                self._event_credit -= EVENT_DWELL
+                event["until"] = now + EVENT_DWELL
+                self.current_dwell = EVENT_DWELL
+                self._render_game(game)
+                self._record_event_latency(event)
+                return True
+            if now < event["until"]:
+                if self._scene is None or self._scene["key"] != event["key"]:
+                    self._render_game(game)
+                self.current_dwell = event["until"] - now
+                return True
+            self._event_queue.pop(0)
+        return False
+
+    def _record_event_latency(self, event):
+        """Record upstream-data-to-pixels and fetch-to-pixels latency for a shown event (from its detecting fetch)."""
+        data_time = event.get("data_time")
+        if not data_time:
+            return
+        data_epoch, received = data_time
+        METRICS.observe("event_fetch_to_pixels_ms", (time.monotonic() - received) * 1000)
+        now = get_rtc_now()
+        if data_epoch is not None and now is not None:
+            METRICS.observe("event_latency_s", now - data_epoch)
+
     def _validate_game_data(self, game):
         """Validate essential game data fields"""
         try:
             required_fields = ['home_team', 'away_team', 'status']
             for field in required_fields:
                 if field not in game or game[field] is None:
-                    print(f"Missing required field: {field}")
+                    LOG.warning("Missing required field: %s", field)
                     return False
             
             # Ensure team names are strings
             if not isinstance(game['home_team'], str) or not isinstance(game['away_team'], str):
-                print("Invalid team name types")
+                LOG.warning("Invalid team name types")
                 return False
                 
             return True
         except Exception as e:
-            print(f"Error validating game data: {e}")
+            LOG.error("Error validating game data: %s", e)
             return False
 
     def get_filtered_games(self):
         """Get games filtered by current settings"""
         if not self.games:
-            if DEBUG_DISPLAY:
-                print("No games available")
+            LOG.debug("No games available")
             return []
-        if DEBUG_DISPLAY:
-            print(f"Total games: {len(self.games)}")
+        if LOG.enabled(DEBUG):
+            LOG.debug("Total games: %d", len(self.games))
             for i, game in enumerate(self.games):
-                print(f"Game {i+1}: {game['home_team']} vs {game['away_team']} - Status: {game['status']}")
+                LOG.debug("Game %d: %s vs %s - Status: %s", i + 1, game["home_team"], game["away_team"], game["status"])
         if self.show_all_games:
-            if DEBUG_DISPLAY:
-                print(f"Showing all games: {len(self.games)} games")
+            LOG.debug("Showing all games: %d games", len(self.games))
             return self.games
         else:
             active_games = [g for g in self.games if g["status"] in ACTIVE_STATUSES]
             if active_games:
-                if DEBUG_DISPLAY:
-                    print(f"Showing active/live games: {len(active_games)} games")
+                LOG.debug("Showing active/live games: %d games", len(active_games))
                 return active_games
             # No active games: show nearby games (finals <24h + scheduled within 36h)
             nearby = self._get_nearby_games()
             if nearby:
-                if DEBUG_DISPLAY:
-                    print(f"No active games; showing {len(nearby)} nearby games")
+                LOG.debug("No active games; showing %d nearby games", len(nearby))
                 return nearby
             # RTC unavailable or nothing nearby: show everything so display isn't blank
-            if DEBUG_DISPLAY:
-                print("No nearby games; showing all games as fallback")
+            LOG.debug("No nearby games; showing all games as fallback")
             return self.games
 
     def _get_nearby_games(self):
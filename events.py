@@ -0,0 +1,60 @@
+"""
+Score events: compare the games on hand with a fresh fetch and report score
+changes, lead changes and finals so the display can jump to the game.
+"""
+from games_processor import game_key
+
+SCORE_CHANGE = "score"
+LEAD_CHANGE = "lead"
+FINAL = "final"
+
+# Most interesting first; a game reports only its highest-priority event per fetch
+EVENT_PRIORITY = (FINAL, LEAD_CHANGE, SCORE_CHANGE)
+
+
+def _scores(game):
+    try:
+        return int(game.get("away_score", 0)), int(game.get("home_score", 0))
+    except (ValueError, TypeError):
+        return None
+
+
+def _leader(scores):
+    away, home = scores
+    if away > home:
+        return "away"
+    if home > away:
+        return "home"
+    return None
+
+
+def detect_events(old_games, new_games):
+    """
+    Return [(kind, key, game)] for games present in both lists whose state changed.
+    Games seen for the first time are not events (no baseline to compare with).
+    """
+    if not old_games:
+        return []
+    previous = {}
+    for game in old_games:
+        previous[game_key(game)] = game
+    events = []
+    for game in new_games:
+        key = game_key(game)
+        old = previous.get(key)
+        if old is None:
+            continue
+        kinds = []
+        if game.get("status") == "Final" and old.get("status") != "Final":
+            kinds.append(FINAL)
+        old_scores = _scores(old)
+        new_scores = _scores(game)
+        if old_scores is not None and new_scores is not None and new_scores != old_scores:
+            if _leader(new_scores) != _leader(old_scores) and _leader(new_scores) is not None:
+                kinds.append(LEAD_CHANGE)
+            kinds.append(SCORE_CHANGE)
+        for kind in EVENT_PRIORITY:
+            if kind in kinds:
+                events.append((kind, key, game))
+                break
+    return events
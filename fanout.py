@@ -0,0 +1,237 @@
+"""
+Fleet fan-out over UDP multicast: one fetcher, many displays.
+The hub (a board with FANOUT_PUBLISH, or the companion aggregator with --fanout)
+fetches as usual and multicasts each sport's processed games as score frames
+(score_frame.py). Receivers (API_BACKEND = "fanout") never call the upstream API.
+
+Wire protocol (one datagram each):
+  snapshot  score frame, flags 0: replaces the sport's games; always applied
+  part      FLAG_DELTA | FLAG_CONT, same seq: more games of a snapshot too big for one datagram
+  delta     FLAG_DELTA, seq = previous seq + 1: changed or new games, matched by game_key
+  resync    b"SMR" + sport code, receiver -> hub (unicast to the port the hub sends from):
+            hub answers with a snapshot
+
+Sequence numbers advance once per change per sport. A receiver that sees a delta
+whose seq isn't its own seq + 1 has missed something and asks the hub for a
+snapshot. The hub also repeats snapshots every FANOUT_HEARTBEAT seconds so
+late joiners and lost parts catch up without asking; each heartbeat takes a new
+seq, so the parts of one whose head was lost can't attach to an earlier snapshot
+(the receiver sees a gap at the next delta and resyncs).
+
+Sockets come from socketpool.SocketPool on the board or the socket module on a computer.
+Firmware that can't join a multicast group can still receive with FANOUT_BROADCAST
+on and FANOUT_GROUP set to the LAN broadcast address (e.g. "192.168.1.255").
+"""
+import asyncio
+import time
+import score_frame
+from frame_state import FrameState, diff_games, APPLIED, GAP, BAD
+from metrics import METRICS
+from config import FANOUT_GROUP, FANOUT_PORT, FANOUT_HEARTBEAT, FANOUT_BROADCAST
+
+RESYNC_MAGIC = b"SMR"
+MAX_DATAGRAM = 1400  # stay under a typical LAN MTU so datagrams aren't fragmented
+MULTICAST_TTL = 1    # don't leave the LAN
+WAIT_STEP = 0.05     # seconds between receives while waiting for a first snapshot
+
+
+def _address_bytes(address):
+    return bytes(int(part) for part in address.split("."))
+
+
+def open_socket(pool, port=None, group=None, broadcast=False):
+    """
+    Non-blocking UDP socket, bound to port if given. group is a multicast group to join
+    where the stack allows, or with broadcast the LAN broadcast address.
+    """
+    sock = pool.socket(pool.AF_INET, pool.SOCK_DGRAM)
+    reuse = getattr(pool, "SO_REUSEADDR", None)
+    if reuse is not None:
+        try:
+            sock.setsockopt(pool.SOL_SOCKET, reuse, 1)
+        except (OSError, AttributeError):
+            pass
+    if group and broadcast and hasattr(pool, "SO_BROADCAST"):
+        sock.setsockopt(pool.SOL_SOCKET, pool.SO_BROADCAST, 1)
+    if port is not None:
+        sock.bind(("0.0.0.0", port))
+    if group and not broadcast:
+        if hasattr(pool, "IP_MULTICAST_TTL"):
+            try:
+                sock.setsockopt(pool.IPPROTO_IP, pool.IP_MULTICAST_TTL, MULTICAST_TTL)
+            except OSError:
+                pass
+        if port is not None and not join_group(pool, sock, group):
+            print("Multicast join unsupported; set FANOUT_BROADCAST and FANOUT_GROUP to the LAN broadcast address")
+    sock.setblocking(False)
+    return sock
+
+
+def join_group(pool, sock, group):
+    """Subscribe sock to a multicast group. Returns False if the stack has no IP_ADD_MEMBERSHIP."""
+    option = getattr(pool, "IP_ADD_MEMBERSHIP", None)
+    if option is None:
+        return False
+    try:
+        sock.setsockopt(pool.IPPROTO_IP, option, _address_bytes(group) + bytes(4))
+        return True
+    except OSError as e:
+        print(f"Multicast join failed: {e}")
+        return False
+
+
+def split_frames(sport, seq, games, flags=0):
+    """Encode games as one or more frames that each fit in MAX_DATAGRAM."""
+    per_frame = max(1, (MAX_DATAGRAM - score_frame.HEADER_SIZE) // (score_frame.RECORD_SIZE + 2 * score_frame.TEAM_WIDTH))
+    if not games:
+        return [score_frame.encode(sport, seq, [], flags)]
+    frames = []
+    for start in range(0, len(games), per_frame):
+        part_flags = flags if start == 0 else flags | score_frame.FLAG_DELTA | score_frame.FLAG_CONT
+        frames.append(score_frame.encode(sport, seq, games[start:start + per_frame], part_flags))
+    return frames
+
+
+class FanoutHub:
+    """Multicasts each sport's games as they change and answers resync requests."""
+
+    def __init__(self, pool, group=FANOUT_GROUP, port=FANOUT_PORT, heartbeat=FANOUT_HEARTBEAT,
+                 broadcast=FANOUT_BROADCAST):
+        self.group = group
+        self.port = port
+        self.heartbeat = heartbeat
+        # Unbound: sends from an ephemeral port, which is where receivers send resync requests
+        self._sock = open_socket(pool, None, group, broadcast)
+        self._games = {}  # sport -> games last published
+        self._seq = {}    # sport -> sequence number of those games
+        self._last_snapshot = 0.0
+        self._buf = bytearray(16)
+
+    def publish(self, sport, games):
+        """Send the change since the last publish for sport (nothing if unchanged)."""
+        old = self._games.get(sport)
+        if old == games:
+            return
+        seq = self._seq.get(sport, 0) + 1
+        self._seq[sport] = seq
+        self._games[sport] = games
+        changed = None if old is None else diff_games(old, games)
+        if changed is not None:
+            delta = score_frame.encode(sport, seq, changed, score_frame.FLAG_DELTA)
+            if len(delta) <= MAX_DATAGRAM:
+                self._send(delta, (self.group, self.port))
+                METRICS.incr("fanout.deltas_sent")
+                return
+        self._send_snapshot(sport, (self.group, self.port))
+
+    def poll(self, now=None):
+        """Answer pending resync requests and repeat snapshots every heartbeat. Call often."""
+        while True:
+            try:
+                size, addr = self._sock.recvfrom_into(self._buf)
+            except OSError:
+                break
+            request = bytes(self._buf[:size])
+            if size == 4 and request[:3] == RESYNC_MAGIC and request[3] < len(score_frame.SPORTS):
+                sport = score_frame.SPORTS[request[3]]
+                if sport in self._games:
+                    METRICS.incr("fanout.resyncs_served")
+                    self._send_snapshot(sport, addr)
+        if now is None:
+            now = time.monotonic()
+        if now - self._last_snapshot >= self.heartbeat:
+            self._last_snapshot = now
+            for sport in self._games:
+                self._seq[sport] += 1
+                self._send_snapshot(sport, (self.group, self.port))
+
+    def _send_snapshot(self, sport, addr):
+        for frame in split_frames(sport, self._seq[sport], self._games[sport]):
+            self._send(frame, addr)
+        METRICS.incr("fanout.snapshots_sent")
+
+    def _send(self, data, addr):
+        try:
+            self._sock.sendto(data, addr)
+        except OSError as e:
+            METRICS.incr("fanout.send_errors")
+            print(f"Fan-out send failed: {e}")
+
+    def close(self):
+        self._sock.close()
+
+
+class FanoutReceiver:
+    """Applies multicast frames to a FrameState; asks the hub for a snapshot on gaps."""
+
+    def __init__(self, pool, group=FANOUT_GROUP, port=FANOUT_PORT, hub=None, broadcast=FANOUT_BROADCAST):
+        self._sock = open_socket(pool, port, group, broadcast)
+        self._hub_host = hub
+        self.hub = None  # (address, port) resyncs go to; learned from the first datagram
+        self.state = FrameState()
+        self._buf = bytearray(MAX_DATAGRAM + 100)
+
+    def has(self, sport):
+        return self.state.has(sport)
+
+    def games(self, sport):
+        return self.state.games(sport)
+
+    def age(self, sport):
+        """Seconds since a frame for sport was applied, or None if never."""
+        return self.state.age(sport)
+
+    def receive(self):
+        """Drain pending datagrams. Returns the set of sports whose games changed."""
+        changed = set()
+        while True:
+            try:
+                size, addr = self._sock.recvfrom_into(self._buf)
+            except OSError:
+                break
+            sport = self._apply(memoryview(self._buf)[:size], addr)
+            if sport:
+                changed.add(sport)
+        return changed
+
+    async def wait(self, sport, timeout):
+        """Receive until sport has games or timeout seconds pass, yielding to the loop in between."""
+        end = time.monotonic() + timeout
+        while not self.has(sport):
+            self.receive()
+            if self.has(sport) or time.monotonic() >= end:
+                break
+            await asyncio.sleep(WAIT_STEP)
+        return self.has(sport)
+
+    def request_resync(self, sport):
+        """Ask the hub (if known) for a snapshot of sport."""
+        if self.hub is None:
+            return False  # the next heartbeat snapshot both syncs us and tells us the hub's port
+        METRICS.incr("fanout.resyncs_requested")
+        try:
+            self._sock.sendto(RESYNC_MAGIC + bytes((score_frame.SPORTS.index(sport),)), self.hub)
+            return True
+        except OSError as e:
+            print(f"Resync request failed: {e}")
+            return False
+
+    def _apply(self, frame, addr):
+        """Apply one datagram; returns the sport if its games changed."""
+        if self._hub_host and addr[0] != self._hub_host:
+            return None  # another hub on the same group
+        sport, result = self.state.apply(frame)
+        if result == BAD:
+            METRICS.incr("fanout.bad_frames")
+            return None
+        METRICS.incr("fanout.frames")
+        if self.hub is None:
+            self.hub = (addr[0], addr[1])
+        if result == GAP:
+            METRICS.incr("fanout.gaps")
+            print(f"{sport} fan-out gap after seq {self.state.seq(sport)}; resyncing")
+            self.request_resync(sport)
+        return sport if result == APPLIED else None
+
+    def close(self):
+        self._sock.close()
@@ -0,0 +1,52 @@
+"""
+Single-flight fetch coordination: at most one fetch task runs at a time.
+Requests for the key already in flight share that task; a request for a
+different key cancels the running task (e.g. a sport that is no longer selected).
+"""
+import asyncio
+from log import LOG
+
+
+class SingleFlight:
+    """Owns the one in-flight fetch task and the key it is fetching."""
+
+    def __init__(self):
+        self._task = None
+        self._key = None
+
+    @property
+    def busy(self):
+        """True while a fetch task is running."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def key(self):
+        """Key of the running fetch, or None."""
+        return self._key if self.busy else None
+
+    def request(self, key, factory):
+        """
+        Ensure a fetch for key is running and return its task.
+        factory() must return a new coroutine; it is only called when a task is started.
+        Cancellation lands at the running task's next await (retry sleeps, between sports).
+        """
+        if self.busy:
+            if self._key == key:
+                return self._task
+            LOG.info("Cancelling %s fetch for %s", self._key, key)
+            self._task.cancel()
+        self._key = key
+        self._task = asyncio.create_task(factory())
+        return self._task
+
+    async def run(self, key, factory):
+        """Request a fetch for key and wait for it. Returns False if it was superseded."""
+        task = self.request(key, factory)
+        try:
+            await task
+            return True
+        except asyncio.CancelledError:
+            if self._task is task:
+                # We were cancelled ourselves, not superseded
+                raise
+            return False
@@ -0,0 +1,109 @@
+"""
+Per-sport game lists rebuilt from a sequence of score frames (score_frame.py).
+Shared by the push transports (fanout.py over UDP, push.py over SSE):
+  snapshot (no FLAG_DELTA)      replaces the sport's games; always applied
+  part (FLAG_DELTA | FLAG_CONT) adds to the snapshot in progress (its head was applied, same seq)
+  delta (FLAG_DELTA)            replaces/appends games by game_key; needs seq = last + 1
+A part is only taken while its snapshot is open: from a head with the same seq
+until the next head or delta. Parts merge by game_key as well, so a part applied
+twice never duplicates games.
+diff_games is the sending side: what a delta for a change must carry.
+"""
+import time
+import score_frame
+from games_processor import game_key
+
+APPLIED = "applied"
+GAP = "gap"          # a delta arrived out of sequence; the sender must resend a snapshot
+IGNORED = "ignored"  # a snapshot part whose head was missed (a heartbeat reuses the seq)
+BAD = "bad"          # not a decodable frame
+
+
+def parse_cursor(text):
+    """'NFL.3,NBA.7' -> {"NFL": 3, "NBA": 7} (malformed entries ignored)."""
+    cursor = {}
+    for part in (text or "").split(","):
+        sport, _, seq = part.partition(".")
+        if sport in score_frame.SPORTS and seq.isdigit():
+            cursor[sport] = int(seq)
+    return cursor
+
+
+def diff_games(old_games, new_games):
+    """
+    Games to send as a delta, or None if only a snapshot can express the change
+    (a game dropped out or existing games changed order; deltas only replace and append).
+    """
+    old_keys = [game_key(g) for g in old_games]
+    new_keys = [game_key(g) for g in new_games]
+    if new_keys[:len(old_keys)] != old_keys:
+        return None
+    return [g for i, g in enumerate(new_games) if i >= len(old_games) or g != old_games[i]]
+
+
+class FrameState:
+    """Latest games, sequence number and receive time per sport."""
+
+    def __init__(self):
+        self._games = {}     # sport -> games
+        self._seq = {}       # sport -> last applied seq
+        self._received = {}  # sport -> time.monotonic() of the last applied frame
+        self._open = {}      # sport -> seq of the snapshot whose parts may follow
+
+    def has(self, sport):
+        return sport in self._games
+
+    def games(self, sport):
+        return self._games.get(sport, [])
+
+    def seq(self, sport):
+        """Last applied sequence number for sport, or None."""
+        return self._seq.get(sport)
+
+    def age(self, sport):
+        """Seconds since a frame for sport was applied, or None if never."""
+        received = self._received.get(sport)
+        if received is None:
+            return None
+        return time.monotonic() - received
+
+    def cursor(self):
+        """'NFL.3,NBA.7' - last seq per sport, for resuming a stream."""
+        return ",".join(f"{sport}.{seq}" for sport, seq in self._seq.items())
+
+    def apply(self, frame):
+        """Apply one encoded frame. Returns (sport or None, APPLIED | GAP | IGNORED | BAD)."""
+        try:
+            sport, seq, flags, games = score_frame.decode(bytes(frame))
+        except (ValueError, IndexError):
+            return None, BAD
+        last = self._seq.get(sport)
+        if not flags & score_frame.FLAG_DELTA:
+            self._games[sport] = games
+            self._open[sport] = seq
+        elif flags & score_frame.FLAG_CONT:
+            if self._open.get(sport) != seq:
+                return sport, IGNORED
+            self._merge(sport, games)
+        elif last is None or seq != (last + 1) & 0xFFFFFFFF:
+            self._open.pop(sport, None)
+            return sport, GAP
+        else:
+            self._open.pop(sport, None)
+            self._merge(sport, games)
+        self._seq[sport] = seq
+        self._received[sport] = time.monotonic()
+        return sport, APPLIED
+
+    def _merge(self, sport, games):
+        """Replace the sport's games with the same game_key, append the rest."""
+        merged = list(self._games.get(sport, []))
+        index = {game_key(g): i for i, g in enumerate(merged)}
+        for game in games:
+            i = index.get(game_key(game))
+            if i is None:
+                index[game_key(game)] = len(merged)
+                merged.append(game)
+            else:
+                merged[i] = game
+        self._games[sport] = merged
@@ -0,0 +1,78 @@
+"""
+Local game-clock model: counts a live game's clock down between polls so the
+scoreboard ticks every second instead of freezing and jumping by REFRESH_INTERVAL_LIVE.
+Re-anchored from the API clock on every fetch; pauses on stoppages.
+"""
+import time
+from config import REFRESH_INTERVAL_LIVE
+
+# Sports whose clock counts down (MLB has no clock)
+CLOCK_SPORTS = ("NFL", "NBA", "NHL")
+
+# Never run the local clock further than this past the last anchor (missed polls, stalled feed)
+MAX_EXTRAPOLATION = 2 * REFRESH_INTERVAL_LIVE
+
+
+def parse_clock(text):
+    """Parse 'M:SS', 'MM:SS' or 'SS.s' to seconds (float), or None if unparseable."""
+    if not text:
+        return None
+    text = str(text).strip()
+    try:
+        if ":" in text:
+            minutes, seconds = text.split(":", 1)
+            return int(minutes) * 60 + float(seconds)
+        return float(text)
+    except ValueError:
+        return None
+
+
+def format_clock(seconds, tenths=False):
+    """Format seconds as 'M:SS', or 'SS.s' under a minute when the API uses tenths."""
+    if seconds < 0:
+        seconds = 0
+    if tenths and seconds < 60:
+        return f"{seconds:.1f}"
+    whole = int(seconds)
+    return f"{whole // 60}:{whole % 60:02d}"
+
+
+class GameClock:
+    """Clock for one game: anchored from each poll, counts down locally while running."""
+
+    def __init__(self):
+        self.seconds = None      # Clock value at anchor time
+        self.anchor_time = 0.0   # time.monotonic() when anchored
+        self.running = False
+        self.text = ""           # Clock text from the last poll
+        self._tenths = False
+        self._period = None
+
+    def anchor(self, clock_text, period, in_progress, stoppage=False, now=None):
+        """
+        Re-anchor on fresh API data. The clock runs only while the game is in
+        progress, not in a stoppage, has time left, and the clock moved since
+        the previous poll in the same period (unchanged across two polls = stopped).
+        """
+        if now is None:
+            now = time.monotonic()
+        seconds = parse_clock(clock_text)
+        unchanged = clock_text == self.text and period == self._period
+        self.seconds = seconds
+        self.anchor_time = now
+        self.text = clock_text
+        self._period = period
+        self._tenths = "." in str(clock_text) and ":" not in str(clock_text)
+        self.running = bool(
+            in_progress and not stoppage and not unchanged
+            and seconds is not None and seconds > 0
+        )
+
+    def display_text(self, now=None):
+        """Clock text to show now: the polled text, or the locally counted-down value."""
+        if not self.running:
+            return self.text
+        if now is None:
+            now = time.monotonic()
+        elapsed = min(now - self.anchor_time, MAX_EXTRAPOLATION)
+        return format_clock(self.seconds - elapsed, self._tenths)
@@ -0,0 +1,61 @@
+"""
+Per-sport game store: the latest processed games for each sport, read through
+views by SPORTS mode (all sports) and single-sport modes alike. Switching
+sports reads from here instead of refetching.
+"""
+import time
+from games_processor import cap_games
+
+STORE_SPORTS = ("NFL", "NBA", "NHL", "MLB")
+
+
+class GameStore:
+    """Latest games per sport with fetch times; the SPORTS view is cached until the next put."""
+
+    def __init__(self):
+        self._games = {}
+        self._updated = {}
+        self._all = None
+
+    def put(self, sport, games):
+        """Replace the games for sport (games already carry game["sport"] from processing)."""
+        self._games[sport] = games
+        self._updated[sport] = time.monotonic()
+        self._all = None
+
+    def view(self, selection):
+        """Games for one sport, or all sports in STORE_SPORTS order for "SPORTS"."""
+        if selection != "SPORTS":
+            return self._games.get(selection, [])
+        if self._all is None:
+            combined = []
+            for sport in STORE_SPORTS:
+                combined.extend(self._games.get(sport, []))
+            self._all = combined
+        return self._all
+
+    def drop_view(self):
+        """Forget the cached SPORTS view once (rebuilt on the next read)."""
+        self._all = None
+
+    def trim(self, cap):
+        """Cut every sport's stored games to cap (live first) without touching their fetch times."""
+        for sport, games in self._games.items():
+            self._games[sport] = cap_games(games, cap)
+        self._all = None
+
+    def age(self, sport):
+        """Seconds since sport was last stored, or None if never."""
+        updated = self._updated.get(sport)
+        if updated is None:
+            return None
+        return time.monotonic() - updated
+
+    def is_stale(self, selection, max_age):
+        """True if any sport in the selection was never fetched or is older than max_age."""
+        sports = STORE_SPORTS if selection == "SPORTS" else (selection,)
+        for sport in sports:
+            age = self.age(sport)
+            if age is None or age >= max_age:
+                return True
+        return False
@@ -1,10 +1,14 @@
 """
 Game processing: normalize status, filter old finals, and build processed game dicts.
-Used by the API layer; can be tested with raw dicts without HTTP.
+Used by the API layer and the host-side companion service; can be tested with raw dicts without HTTP.
 """
 import time
-import rtc
-from config import ACTIVE_STATUSES, DEBUG_DISPLAY
+try:
+    import rtc
+except ImportError:
+    rtc = None  # CPython (companion service): use the system clock
+from config import ACTIVE_STATUSES
+from log import LOG, DEBUG
 
 # Normalize API status strings to canonical display status (dict lookup + keywords fallback).
 STATUS_MAP = {
@@ -18,16 +22,44 @@ STATUS_MAP = {
     "suspended": "Suspended",
     "cancelled": "Cancelled", "canceled": "Cancelled",
 }
+# Raw statuses that normalize to "In Progress" but mean the game clock is stopped.
+STOPPAGE_STATUSES = frozenset({
+    "halftime", "half time", "end of period", "end period", "between periods",
+})
 DELAY_KEYWORDS = ("delay", "rain", "weather", "lightning")
 CANCEL_KEYWORDS = ("void", "forfeit", "abandon")
 TWENTY_FOUR_HOURS = 24 * 60 * 60
 THIRTY_SIX_HOURS = 36 * 60 * 60
 
 
+def game_key(game):
+    """Identity of a processed game across fetches (scores and clock change, teams and date do not)."""
+    return (game.get("sport"), game.get("away_team"), game.get("home_team"), game.get("date"))
+
+
+def cap_games(games, cap):
+    """At most cap games: live ones first, then the rest in order; the kept games stay in their original order."""
+    if not cap or len(games) <= cap:
+        return games
+    keep = [i for i, g in enumerate(games) if g.get("status") in ACTIVE_STATUSES][:cap]
+    if len(keep) < cap:
+        chosen = set(keep)
+        keep.extend([i for i in range(len(games)) if i not in chosen][:cap - len(keep)])
+        keep.sort()
+    return [games[i] for i in keep]
+
+
+def _rtc_datetime():
+    """Current RTC struct_time (system local time off-device)."""
+    if rtc is None:
+        return time.localtime()
+    return rtc.RTC().datetime
+
+
 def get_rtc_now():
     """Return current RTC as epoch seconds, or None if unavailable."""
     try:
-        current_time = rtc.RTC().datetime
+        current_time = _rtc_datetime()
         return time.mktime((
             current_time.tm_year, current_time.tm_mon, current_time.tm_mday,
             current_time.tm_hour, current_time.tm_min, current_time.tm_sec, 0, 0, -1
@@ -78,7 +110,7 @@ def is_game_date_today(date):
     if not date or "-" not in date:
         return True
     try:
-        now = rtc.RTC().datetime
+        now = _rtc_datetime()
         return int(date[5:7]) == now.tm_mon and int(date[8:10]) == now.tm_mday
     except Exception:
         return True
@@ -113,38 +145,31 @@ def _infer_status_from_game_data(raw_status, game, sport):
         game_period = game.get("game_period", "")
 
         if home_score == 0 and away_score == 0:
-            if DEBUG_DISPLAY:
-                print(f"Inferring pre-game status for unknown state: {raw_status}")
+            LOG.debug("Inferring pre-game status for unknown state: %s", raw_status)
             return "Scheduled"
         has_scores = home_score > 0 or away_score > 0
         if has_scores:
             try:
                 if sport == "NFL" and quarter and int(quarter) >= 4:
-                    if DEBUG_DISPLAY:
-                        print(f"Inferring final status for NFL game in Q{quarter}: {raw_status}")
+                    LOG.debug("Inferring final status for NFL game in Q%s: %s", quarter, raw_status)
                     return "Final"
                 if sport == "NBA" and quarter and int(quarter) >= 4:
-                    if DEBUG_DISPLAY:
-                        print(f"Inferring final status for NBA game in Q{quarter}: {raw_status}")
+                    LOG.debug("Inferring final status for NBA game in Q%s: %s", quarter, raw_status)
                     return "Final"
                 if sport == "NHL" and game_period and int(game_period) >= 3:
-                    if DEBUG_DISPLAY:
-                        print(f"Inferring final status for NHL game in P{game_period}: {raw_status}")
+                    LOG.debug("Inferring final status for NHL game in P%s: %s", game_period, raw_status)
                     return "Final"
                 if sport == "MLB" and inning and int(inning) >= 9:
-                    if DEBUG_DISPLAY:
-                        print(f"Inferring final status for MLB game in inning {inning}: {raw_status}")
+                    LOG.debug("Inferring final status for MLB game in inning %s: %s", inning, raw_status)
                     return "Final"
             except (ValueError, TypeError):
                 pass
-            if DEBUG_DISPLAY:
-                print(f"Inferring delayed status for game with scores: {raw_status}")
+            LOG.debug("Inferring delayed status for game with scores: %s", raw_status)
             return "Delayed"
-        if DEBUG_DISPLAY:
-            print(f"Could not infer status, treating as delayed: {raw_status}")
+        LOG.debug("Could not infer status, treating as delayed: %s", raw_status)
         return "Delayed"
     except Exception as e:
-        print(f"Error inferring status from game data: {e}")
+        LOG.warning("Error inferring status from game data: %s", e)
         return "Delayed"
 
 
@@ -158,13 +183,14 @@ def process_games(raw_games, sport):
     processed = []
     now = get_rtc_now()
     if now is None:
-        print("RTC unavailable; skipping time-based filtering")
+        LOG.warning("RTC unavailable; skipping time-based filtering")
+    debug = LOG.enabled(DEBUG)  # checked once; the per-game lines below are skipped unless debug
 
     for i, game in enumerate(raw_games):
         try:
             if not isinstance(game, dict):
-                if DEBUG_DISPLAY:
-                    print(f"Skipping invalid game {i+1}: not a dictionary")
+                if debug:
+                    LOG.debug("Skipping invalid game %d: not a dictionary", i + 1)
                 continue
             raw_status = game.get("status", "Unknown")
             home_team = game.get("home_abbreviation", "UNK")
@@ -201,10 +227,12 @@ def process_games(raw_games, sport):
             last_play = game.get("last_play", "")
 
             status = normalize_and_infer_status(raw_status, game, sport)
-            if DEBUG_DISPLAY and raw_status != status:
-                print(f"Debug: Status normalized from '{raw_status}' to '{status}'")
+            stoppage = str(raw_status).strip().lower() in STOPPAGE_STATUSES
+            if debug and raw_status != status:
+                LOG.debug("Status normalized from '%s' to '%s'", raw_status, status)
 
             candidate = {
+                "sport": sport,
                 "home_team": home_team,
                 "away_team": away_team,
                 "home_score": home_score,
@@ -212,6 +240,7 @@ def process_games(raw_games, sport):
                 "status": status,
                 "period": period,
                 "clock": clock,
+                "stoppage": stoppage,
                 "date": date,
                 "venue": venue,
                 "home_record": home_record,
@@ -223,15 +252,14 @@ def process_games(raw_games, sport):
                 "bases": bases,
             }
             if now is not None and not is_game_in_time_window(candidate, now):
-                if DEBUG_DISPLAY:
-                    print(f"Filtered out-of-window game: {away_team} @ {home_team} on {date} ({status})")
+                if debug:
+                    LOG.debug("Filtered out-of-window game: %s @ %s on %s (%s)", away_team, home_team, date, status)
                 continue
 
             processed.append(candidate)
-            if DEBUG_DISPLAY:
-                print(f"Processed: {home_team} vs {away_team} - Status: {status}, Period: {period}, Clock: {clock}")
+            if debug:
+                LOG.debug("Processed: %s vs %s - Status: %s, Period: %s, Clock: %s", home_team, away_team, status, period, clock)
         except Exception as e:
-            print(f"Error processing game {i+1}: {e}")
-            if DEBUG_DISPLAY:
-                print(f"Skipping malformed game data: {game}")
+            LOG.warning("Error processing game %d: %s", i + 1, e)
+            LOG.debug("Skipping malformed game data: %s", game)
     return processed
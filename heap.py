@@ -0,0 +1,98 @@
+"""
+Heap sampling for long runs: free and allocated bytes from gc, the largest free
+block (estimated by probing allocations, since a fragmented heap can fail a
+MemoryError with plenty free in total) and a tracker that flags steady growth.
+On CPython gc has no mem_free, so read_heap() returns None there; host/soak.py
+feeds the same GrowthTracker from tracemalloc instead.
+"""
+import gc
+from metrics import METRICS
+
+LARGEST_RESOLUTION = 1024  # bytes; stop bisecting the largest free block at this precision
+GROWTH_WINDOW = 12  # samples looked at when deciding whether the heap keeps growing
+GROWTH_SHARE = 0.75  # fraction of steps in the window that must rise
+GROWTH_TOLERANCE = 4096  # bytes; rises smaller than this over the window are noise
+
+
+def largest_free_block(limit, resolution=LARGEST_RESOLUTION):
+    """Largest bytearray (to within resolution) that can be allocated right now, up to limit."""
+    lo, hi = 0, limit
+    while hi - lo > resolution:
+        mid = (lo + hi) // 2
+        try:
+            block = bytearray(mid)
+            del block
+            lo = mid
+        except MemoryError:
+            hi = mid
+    return lo
+
+
+def read_heap(largest=True):
+    """{"free", "alloc", "largest"} bytes after a collection, or None without gc.mem_free."""
+    if not hasattr(gc, "mem_free"):
+        return None
+    gc.collect()
+    free = gc.mem_free()
+    sample = {"free": free, "alloc": gc.mem_alloc(), "largest": None}
+    if largest:
+        sample["largest"] = largest_free_block(free)
+        gc.collect()
+    return sample
+
+
+class GrowthTracker:
+    """Flags a value that keeps climbing: most steps in the window rise and the total rise is real."""
+
+    def __init__(self, window=GROWTH_WINDOW, share=GROWTH_SHARE, tolerance=GROWTH_TOLERANCE):
+        self.window = window
+        self.share = share
+        self.tolerance = tolerance
+        self.values = []
+
+    def add(self, value):
+        """Record a sample; returns True while the window shows steady growth."""
+        self.values.append(value)
+        if len(self.values) > self.window:
+            self.values.pop(0)
+        return self.growing()
+
+    def growing(self):
+        values = self.values
+        if len(values) < self.window:
+            return False
+        rising = sum(1 for a, b in zip(values, values[1:]) if b > a)
+        return rising >= self.share * (len(values) - 1) and values[-1] - values[0] > self.tolerance
+
+    def rise(self):
+        """Change across the window (bytes)."""
+        return self.values[-1] - self.values[0] if self.values else 0
+
+
+class HeapMonitor:
+    """Samples the heap into METRICS and serial; warns when allocated bytes keep growing."""
+
+    def __init__(self, read=read_heap, tracker=None):
+        self.read = read
+        self.tracker = tracker or GrowthTracker()
+
+    def sample(self):
+        """Take one sample. Returns it (with "growing") or None if the runtime can't report."""
+        sample = self.read()
+        if sample is None:
+            return None
+        METRICS.gauge("heap.free", sample["free"])
+        METRICS.gauge("heap.alloc", sample["alloc"])
+        line = f"Heap: {sample['free']} free, {sample['alloc']} alloc"
+        largest = sample.get("largest")
+        if largest is not None:
+            METRICS.gauge("heap.largest", largest)
+            fragmentation = 1 - largest / sample["free"] if sample["free"] else 0
+            METRICS.gauge("heap.fragmentation", round(fragmentation, 3))
+            line += f", largest block {largest} ({fragmentation * 100:.0f}% fragmented)"
+        print(line)
+        sample["growing"] = self.tracker.add(sample["alloc"])
+        if sample["growing"]:
+            METRICS.incr("heap.growth_warnings")
+            print(f"Heap keeps growing: +{self.tracker.rise()} bytes over the last {len(self.tracker.values)} samples")
+        return sample
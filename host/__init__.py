@@ -0,0 +1,6 @@
+"""
+Host-side (CPython) tools and services that run next to the boards, not on them.
+Run from the repository root, e.g. `python -m host.aggregator`, so the board
+modules (games_processor, score_frame, ...) are importable. Don't copy this
+directory to CIRCUITPY.
+"""
@@ -0,0 +1,268 @@
+"""
+Companion aggregator: polls the sports API once for every board on the LAN,
+runs the same processing as the board (games_processor.process_games: status
+normalization and time-window filtering) and serves each sport as a compact
+binary score frame (score_frame.py) over HTTP.
+
+    python -m host.aggregator --api-key KEY [--port 8080]
+
+Endpoints:
+  GET /<sport>.bin   latest frame (ETag = sequence number; If-None-Match -> 304)
+  GET /status        JSON: per-sport sequence, game count, age, last error
+  GET /<sport>.img   pre-rendered scoreboard images (--render; RENDER_MODE = "host")
+  GET /events        SSE push stream of frame changes (host/relay.py; API_BACKEND = "stream")
+
+Boards use it with API_BACKEND = "frame" and FEED_URL = "http://<host>:8080".
+With --fanout it is also the fleet hub: every change is multicast (fanout.py) to
+boards running API_BACKEND = "fanout", so N displays cost one upstream fetch.
+Standard library only.
+"""
+import argparse
+import gzip
+import json
+import os
+import socket
+import threading
+import time
+import urllib.request
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import score_frame
+from config import ACTIVE_STATUSES, FANOUT_GROUP, FANOUT_PORT, FANOUT_HEARTBEAT, FANOUT_BROADCAST
+from fanout import FanoutHub
+from host.relay import EventFeed, serve_events
+from games_processor import process_games
+
+DEFAULT_UPSTREAM = "https://sports-slim-api.vercel.app/api"
+UPSTREAM_TIMEOUT = 15
+
+
+def fetch_upstream(upstream, sport, api_key, timeout=UPSTREAM_TIMEOUT):
+    """GET raw games for sport from the upstream API (gzip/deflate accepted)."""
+    url = f"{upstream}/{sport.lower()}/scores?api_key={api_key}"
+    request = urllib.request.Request(url, headers={"Accept-Encoding": "gzip, deflate"})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        body = response.read()
+        encoding = (response.headers.get("Content-Encoding") or "").lower()
+    if encoding == "gzip":
+        body = gzip.decompress(body)
+    elif encoding == "deflate":
+        body = zlib.decompress(body)
+    return json.loads(body).get("games", [])
+
+
+class SportFeed:
+    """Latest frame for one sport; the sequence number advances only when the games change."""
+
+    def __init__(self, sport):
+        self.sport = sport
+        self.seq = 0
+        self.games = []
+        self.frame = score_frame.encode(sport, 0, [])
+        self.updated = None
+        self.last_error = None
+        self.lock = threading.Lock()
+
+    def update(self, games):
+        """Install freshly processed games. Returns True if they differ from the current ones."""
+        with self.lock:
+            self.updated = time.time()
+            self.last_error = None
+            if games == self.games:
+                return False
+            self.seq += 1
+            self.games = games
+            self.frame = score_frame.encode(self.sport, self.seq, games)
+            return True
+
+    def snapshot(self):
+        with self.lock:
+            return self.seq, self.frame
+
+    def status(self):
+        with self.lock:
+            age = None if self.updated is None else round(time.time() - self.updated, 1)
+            return {"seq": self.seq, "games": len(self.games), "bytes": len(self.frame), "age": age, "last_error": self.last_error}
+
+
+class Aggregator:
+    """Polls upstream for each sport (fast while any game is live) and keeps a SportFeed per sport."""
+
+    def __init__(self, api_key, upstream=DEFAULT_UPSTREAM, sports=score_frame.SPORTS,
+                 interval_live=15, interval_idle=120, fetch=fetch_upstream):
+        self.api_key = api_key
+        self.upstream = upstream
+        self.feeds = {sport: SportFeed(sport) for sport in sports}
+        self.interval_live = interval_live
+        self.interval_idle = interval_idle
+        self._fetch = fetch
+        self._stop = threading.Event()
+        self.listeners = []  # callables(sport, seq, games) run after each change
+        self.images = {}  # sport -> (seq, image bundle) when rendering for RENDER_MODE = "host"
+
+    def poll_once(self, sport):
+        """Fetch, process and install one sport. Returns True if the games changed."""
+        feed = self.feeds[sport]
+        try:
+            raw = self._fetch(self.upstream, sport, self.api_key)
+        except Exception as e:
+            feed.last_error = str(e)
+            print(f"{sport} upstream error: {e}")
+            return False
+        games = process_games(raw, sport)
+        changed = feed.update(games)
+        if changed:
+            print(f"{sport}: seq {feed.seq}, {len(games)} games, {len(feed.frame)} bytes")
+            for listener in self.listeners:
+                listener(sport, feed.seq, games)
+        return changed
+
+    def run(self):
+        """Poll every sport until stop() is called."""
+        while not self._stop.is_set():
+            live = False
+            for sport in self.feeds:
+                self.poll_once(sport)
+                live = live or any(g.get("status") in ACTIVE_STATUSES for g in self.feeds[sport].games)
+            self._stop.wait(self.interval_live if live else self.interval_idle)
+
+    def stop(self):
+        self._stop.set()
+
+
+def attach_fanout(aggregator, group=FANOUT_GROUP, port=FANOUT_PORT, heartbeat=FANOUT_HEARTBEAT,
+                  broadcast=FANOUT_BROADCAST):
+    """Multicast the aggregator's changes; a daemon thread answers resyncs and sends heartbeats."""
+    hub = FanoutHub(socket, group, port, heartbeat, broadcast)
+    lock = threading.Lock()
+
+    def publish(sport, seq, games):
+        with lock:
+            hub.publish(sport, games)
+
+    def serve():
+        while not aggregator._stop.is_set():
+            with lock:
+                hub.poll()
+            aggregator._stop.wait(0.05)
+
+    aggregator.listeners.append(publish)
+    threading.Thread(target=serve, daemon=True).start()
+    print(f"Fan-out hub on {group}:{port}")
+    return hub
+
+
+def attach_events(aggregator):
+    """EventFeed mirroring the aggregator's changes, for the /events push stream."""
+    events = EventFeed(list(aggregator.feeds))
+    aggregator.listeners.append(lambda sport, seq, games: events.publish(sport, games))
+    return events
+
+
+def attach_renderer(aggregator):
+    """Render every game of a sport with the board's layout code after each change."""
+    from host.renderer import FrameRenderer
+    renderer = FrameRenderer()
+    lock = threading.Lock()
+
+    def render(sport, seq, games):
+        with lock:
+            bundle = renderer.bundle(sport, games)
+        aggregator.images[sport] = (seq, bundle)
+        print(f"{sport}: rendered {len(games)} games, {len(bundle)} bytes")
+
+    aggregator.listeners.append(render)
+    return renderer
+
+
+def make_handler(aggregator, events=None):
+    """HTTP handler class serving the aggregator's frames (and /events if an EventFeed is given)."""
+
+    class FrameHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path, _, query = self.path.partition("?")
+            if path == "/events" and events is not None:
+                serve_events(self, events, query)
+                return
+            if path == "/status":
+                body = json.dumps({s: f.status() for s, f in aggregator.feeds.items()}).encode()
+                self._reply(200, body, "application/json")
+                return
+            name = path.strip("/")
+            if name.endswith(".img") and name[:-4].upper() in aggregator.images:
+                seq, bundle = aggregator.images[name[:-4].upper()]
+                self._send_versioned(seq, bundle)
+                return
+            sport = name[:-4].upper() if name.endswith(".bin") else None
+            feed = aggregator.feeds.get(sport)
+            if feed is None:
+                self._reply(404, b"not found", "text/plain")
+                return
+            seq, frame = feed.snapshot()
+            self._send_versioned(seq, frame)
+
+        def _send_versioned(self, seq, body):
+            """Reply with body tagged by seq; 304 if the client already has it."""
+            etag = f'"{seq}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            self._reply(200, body, "application/octet-stream", {"ETag": etag})
+
+        def _reply(self, code, body, content_type, headers=None):
+            self.send_response(code)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, fmt, *args):
+            pass
+
+    return FrameHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--api-key", default=os.getenv("API_KEY"))
+    parser.add_argument("--upstream", default=DEFAULT_UPSTREAM)
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--interval-live", type=int, default=15)
+    parser.add_argument("--interval-idle", type=int, default=120)
+    parser.add_argument("--render", action="store_true", help="also serve pre-rendered images to RENDER_MODE=host boards")
+    parser.add_argument("--fanout", action="store_true", help="also multicast changes to API_BACKEND=fanout boards")
+    parser.add_argument("--fanout-group", default=FANOUT_GROUP)
+    parser.add_argument("--fanout-port", type=int, default=FANOUT_PORT)
+    parser.add_argument("--fanout-broadcast", action="store_true", default=FANOUT_BROADCAST,
+                        help="--fanout-group is the LAN broadcast address, not a multicast group")
+    args = parser.parse_args()
+    if not args.api_key:
+        parser.error("--api-key or API_KEY is required")
+
+    aggregator = Aggregator(args.api_key, args.upstream, interval_live=args.interval_live, interval_idle=args.interval_idle)
+    if args.fanout:
+        attach_fanout(aggregator, args.fanout_group, args.fanout_port, broadcast=args.fanout_broadcast)
+    if args.render:
+        attach_renderer(aggregator)
+    events = attach_events(aggregator)
+    threading.Thread(target=aggregator.run, daemon=True).start()
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(aggregator, events))
+    server.daemon_threads = True
+    print(f"Serving score frames on {args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        aggregator.stop()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
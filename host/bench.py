@@ -0,0 +1,214 @@
+"""
+Host benchmark suite for the board's hot paths, run in the headless emulator
+(host/emulator) on synthetic slates (host/slates.py) of every sport and status:
+
+  ingest     games_processor.process_games (raw API JSON -> processed games)
+  positions  display_utils.calculate_text_positions
+  layout     GameDisplayBuilder.create_game_text (display_data, underline/diamond bitmaps)
+  render     DisplayManager.display_scoreboard (Labels and the scene group)
+
+Each case reports time per op (op = one game; best of --repeat rounds, each
+looped to at least MIN_ROUND_SECONDS with the garbage collector paused), bytes
+allocated per op (tracemalloc high-water while the op runs) and peak traced
+memory over a whole round.
+
+    python -m host.bench --sizes 10,100,1000 --save bench_baseline.json
+    python -m host.bench --compare bench_baseline.json --threshold 0.25   # exit 1 on regression
+
+Baselines are machine-specific; compare only against one saved on the same computer.
+"""
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from host import emulator
+
+emulator.install()
+
+from display_utils import calculate_text_positions  # noqa: E402  (needs the emulated displayio)
+from games_processor import process_games  # noqa: E402
+from host.renderer import FrameRenderer  # noqa: E402
+from host.slates import raw_slate  # noqa: E402
+
+DEFAULT_SIZES = (10, 100, 1000)
+DEFAULT_REPEAT = 5
+MIN_ROUND_SECONDS = 0.1  # small slates are looped until a timed round is at least this long
+DEFAULT_THRESHOLD = 0.25  # fractional slowdown / growth that counts as a regression
+MEMORY_SLACK = 256  # bytes; ignore memory changes below this (allocator noise)
+
+
+def _ingest_case(slate, renderer):
+    sports = [(sport, games) for sport, games in slate.items() if games]
+
+    def run():
+        for sport, games in sports:
+            process_games(games, sport)
+    return [run]
+
+
+def _processed(slate):
+    games = []
+    for sport, raw in slate.items():
+        games.extend(process_games(raw, sport))
+    return games
+
+
+def _positions_case(slate, renderer):
+    args = [(str(g["home_team"])[:3], str(g["away_team"])[:3], str(g["home_score"]), str(g["away_score"]))
+            for g in _processed(slate)]
+    return [lambda a=a: calculate_text_positions(*a) for a in args]
+
+
+def _layout_case(slate, renderer):
+    manager = renderer.manager
+    return [lambda g=g: manager.create_game_text(g) for g in _processed(slate)]
+
+
+def _render_case(slate, renderer):
+    manager = renderer.manager
+    data = [manager.create_game_text(g) for g in _processed(slate)]
+    return [lambda d=d: manager.display_scoreboard(d) for d in data]
+
+
+# name -> factory(slate, renderer) returning the round's ops (zero-argument callables)
+CASES = {
+    "ingest": _ingest_case,
+    "positions": _positions_case,
+    "layout": _layout_case,
+    "render": _render_case,
+}
+
+
+def _silenced(fn):
+    """Run fn with stdout discarded (error paths print per game)."""
+    stdout = sys.stdout
+    sys.stdout = None
+    try:
+        return fn()
+    finally:
+        sys.stdout = stdout
+
+
+def measure(ops, games, repeat=DEFAULT_REPEAT):
+    """{"us_per_op", "alloc_bytes_per_op", "peak_kb"} for one round of ops over games games."""
+    def round_time(loops):
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            for _ in range(loops):
+                for op in ops:
+                    op()
+            return time.perf_counter() - started
+        finally:
+            if enabled:
+                gc.enable()
+
+    loops = 1
+    while True:
+        elapsed = _silenced(lambda: round_time(loops))
+        if elapsed >= MIN_ROUND_SECONDS:
+            break
+        loops *= 2 if elapsed <= 0 else max(2, int(MIN_ROUND_SECONDS / elapsed) + 1)
+    best = min([elapsed] + [_silenced(lambda: round_time(loops)) for _ in range(max(0, repeat - 1))]) / loops
+
+    def traced():
+        tracemalloc.start()
+        try:
+            start = tracemalloc.get_traced_memory()[0]
+            peak = 0
+            allocated = 0
+            for op in ops:
+                before = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+                op()
+                current, op_peak = tracemalloc.get_traced_memory()
+                allocated += op_peak - before
+                peak = max(peak, op_peak - start, current - start)
+            return allocated, peak
+        finally:
+            tracemalloc.stop()
+
+    allocated, peak = _silenced(traced)
+    return {
+        "us_per_op": round(best / games * 1e6, 2),
+        "alloc_bytes_per_op": round(allocated / games),
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+def run(sizes=DEFAULT_SIZES, cases=None, repeat=DEFAULT_REPEAT, seed=0):
+    """{"<case>/<games>": measurement} for every case and slate size."""
+    renderer = FrameRenderer()
+    results = {}
+    for size in sizes:
+        slate = raw_slate(size, seed)
+        games = sum(len(g) for g in slate.values())
+        for name in cases or CASES:
+            ops = _silenced(lambda: CASES[name](slate, renderer))
+            result = measure(ops, games, repeat)
+            results[f"{name}/{size}"] = result
+            print(f"{name:<10} {size:>5} games  {result['us_per_op']:>9.1f} us/op  "
+                  f"{result['alloc_bytes_per_op']:>7} B/op  {result['peak_kb']:>8.1f} KB peak")
+    return results
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Regression messages for results that are worse than baseline by more than threshold."""
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        for metric, slack in (("us_per_op", 0), ("alloc_bytes_per_op", MEMORY_SLACK), ("peak_kb", MEMORY_SLACK / 1024)):
+            old, new = base.get(metric), result.get(metric)
+            if old is None or new is None:
+                continue
+            if new > old * (1 + threshold) + slack:
+                regressions.append(f"{key} {metric}: {old} -> {new} (+{(new - old) / old * 100 if old else 100:.0f}%)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES), help="comma-separated slate sizes")
+    parser.add_argument("--cases", default=",".join(CASES), help="comma-separated cases to run")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="timed rounds per case (best is kept)")
+    parser.add_argument("--seed", type=int, default=0, help="slate random seed")
+    parser.add_argument("--save", help="write results as a JSON baseline")
+    parser.add_argument("--compare", help="baseline JSON to check against; exit 1 on regression")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed fractional regression")
+    args = parser.parse_args()
+
+    cases = [c for c in args.cases.split(",") if c]
+    unknown = [c for c in cases if c not in CASES]
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(unknown)}")
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    results = run(sizes, cases, args.repeat, args.seed)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "results": results,
+            }, f, indent=2, sort_keys=True)
+        print(f"Baseline saved to {args.save}")
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline.get("results", {}), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold * 100:.0f}% against {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
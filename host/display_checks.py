@@ -0,0 +1,175 @@
+"""
+Display checks: DisplayManager's rotation and refresh handling on the emulator,
+driven by a scripted API and a virtual clock (host/replay.py) so minutes of
+board time run in well under a second. Each scenario checks what the viewer
+sees: with every live game scoring on every poll, score events still leave the
+rotation most of the screen, every game (live or not) gets shown, and no event
+is shown more than a refresh interval after the fetch that found it.
+
+    python -m host.display_checks              # every scenario; exit 1 on any failure
+    python -m host.display_checks -k flood     # only scenarios whose name contains "flood"
+
+Standard library only.
+"""
+import argparse
+import asyncio
+import os
+import sys
+from host import emulator
+
+SPORT = "NHL"
+LIVE_GAMES = 10
+SCHEDULED_GAMES = 1
+RUN_SECONDS = 600
+
+
+class ScriptedAPI:
+    """API stand-in: the same slate on every poll, with every live game's score bumped."""
+
+    def __init__(self, games):
+        self.games = games
+        self.polls = 0
+        self.fetched = None
+
+    async def get_games(self, sport, deadline=None):
+        import time
+        from config import ACTIVE_STATUSES
+        self.polls += 1
+        self.fetched = (time.time(), time.monotonic())
+        for game in self.games:
+            if game["status"] in ACTIVE_STATUSES:
+                side = "home_score" if self.polls % 2 else "away_score"
+                game[side] = game.get(side, 0) + 2  # alternate sides so leads change too
+        return [dict(game) for game in self.games]
+
+    def data_time(self, sport):
+        return self.fetched
+
+
+class Harness:
+    def __init__(self):
+        self.failures = []
+
+    def expect(self, ok, message):
+        if not ok:
+            self.failures.append(message)
+        return ok
+
+
+def slate():
+    """LIVE_GAMES live and SCHEDULED_GAMES scheduled processed games, distinct match-ups."""
+    import random
+    from host.slates import raw_game, TEAMS
+    from games_processor import process_games
+    rng = random.Random(0)
+    teams = TEAMS[SPORT]
+    raw = []
+    for i in range(LIVE_GAMES + SCHEDULED_GAMES):
+        game = raw_game(SPORT, "In Progress" if i < LIVE_GAMES else "Scheduled", rng)
+        game["away_abbreviation"], game["home_abbreviation"] = teams[i], teams[(i + 1) % len(teams)]
+        raw.append(game)
+    return process_games(raw, SPORT)
+
+
+def event_flood(h):
+    """Every live game scores on every poll: events stay fresh, under EVENT_SHARE, and every game is still shown."""
+    import time
+    from config import EVENT_SHARE, REFRESH_INTERVAL_LIVE
+    from display_manager import DisplayManager
+    from games_processor import game_key
+    from host.replay import VirtualClock
+    from metrics import METRICS
+    games = slate()
+    if not h.expect(len(games) == LIVE_GAMES + SCHEDULED_GAMES, f"slate has {len(games)} games"):
+        return
+    api = ScriptedAPI(games)
+    manager = DisplayManager(emulator.FramebufferDisplay(64, 32), api)
+    manager.current_sport = SPORT
+    manager.show_all_games = True
+    METRICS.timings.pop("event_fetch_to_pixels_ms", None)
+
+    clock = VirtualClock(time.time())
+    clock.install()
+    try:
+        start = time.monotonic()
+        last_update = last_display = None
+        airtime = {}  # game key -> seconds on screen
+        event_seconds = 0
+        for _ in range(RUN_SECONDS):
+            now = time.monotonic()
+            if last_update is None or now - last_update >= manager.refresh_interval():
+                asyncio.run(manager._fetch_games(SPORT))
+                last_update = now
+            if last_display is None or manager.needs_display or now - last_display >= manager.current_dwell:
+                manager._display_next()
+                last_display = now
+            if manager._scene is not None:
+                key = manager._scene["key"]
+                airtime[key] = airtime.get(key, 0) + 1
+            queue = manager._event_queue
+            if queue and queue[0]["until"] is not None and now < queue[0]["until"]:
+                event_seconds += 1
+            clock.advance(1)
+        elapsed = time.monotonic() - start
+    finally:
+        clock.uninstall()
+
+    h.expect(api.polls >= RUN_SECONDS // 30, f"only {api.polls} polls in {RUN_SECONDS}s")
+    never = [f"{g['away_team']}@{g['home_team']}" for g in games if game_key(g) not in airtime]
+    h.expect(not never, f"never shown: {', '.join(never)}")
+    share = event_seconds / elapsed
+    h.expect(0 < share <= EVENT_SHARE + 0.05, f"events held the screen {share:.0%} of the time")
+    delay = METRICS.timings.get("event_fetch_to_pixels_ms")
+    if h.expect(delay is not None, "no event latency recorded"):
+        h.expect(delay.max <= REFRESH_INTERVAL_LIVE * 1000,
+                 f"an event went up {delay.max / 1000:.0f}s after its fetch (mean {delay.total / delay.count / 1000:.0f}s)")
+
+
+SCENARIOS = [
+    ("event-flood", event_flood),
+]
+
+
+def run(pattern="", verbose=False):
+    os.environ.setdefault("API_KEY", "display")
+    emulator.install()
+    failed = 0
+    for name, scenario in SCENARIOS:
+        if pattern and pattern not in name:
+            continue
+        h = Harness()
+        stdout = sys.stdout
+        devnull = None if verbose else open(os.devnull, "w")
+        if devnull is not None:
+            sys.stdout = devnull
+        try:
+            scenario(h)
+        except Exception as e:
+            h.failures.append(f"raised {type(e).__name__}: {e}")
+        finally:
+            sys.stdout = stdout
+            if devnull is not None:
+                devnull.close()
+        if h.failures:
+            failed += 1
+            print(f"FAIL {name}")
+            for message in h.failures:
+                print(f"     {message}")
+        else:
+            print(f"ok   {name}")
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", dest="pattern", default="", help="only scenarios whose name contains this")
+    parser.add_argument("--verbose", action="store_true", help="show the board code's serial output")
+    args = parser.parse_args()
+    failed = run(args.pattern, args.verbose)
+    print(f"{failed} check(s) failed" if failed else "All checks passed")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
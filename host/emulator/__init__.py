@@ -0,0 +1,65 @@
+"""
+Headless displayio emulator: CPython stand-ins for the CircuitPython display
+modules so the board's own layout code runs on a computer.
+
+    from host import emulator
+    emulator.install()          # before importing display_manager & co.
+    display = emulator.FramebufferDisplay(64, 32)
+    ...
+    pixels = display.framebuffer()   # row-major 0xRRGGBB ints
+    rgb = display.rgb_array()        # (height, width, 3) uint8, needs numpy
+
+install() puts host/emulator/modules at the front of sys.path: displayio,
+fontio, terminalio and adafruit_display_text.label for layout; rtc, wifi,
+socketpool, adafruit_requests, adafruit_ticks, board, digitalio and
+adafruit_matrixportal.matrix so main.py and boot.py run unchanged (python -m host.simulate).
+"""
+import os
+import sys
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+MODULES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "modules")
+
+
+def install():
+    """Make the emulated modules importable under their CircuitPython names."""
+    if MODULES not in sys.path:
+        sys.path.insert(0, MODULES)
+
+
+class FramebufferDisplay:
+    """Display stand-in: holds root_group and composites it on demand."""
+
+    def __init__(self, width=64, height=32):
+        install()
+        self.width = width
+        self.height = height
+        self.root_group = None
+        self.auto_refresh = True
+        self.brightness = 1.0
+        self.rotation = 0
+        self.refresh_count = 0
+
+    def refresh(self, *, target_frames_per_second=None, minimum_frames_per_second=0):
+        self.refresh_count += 1
+        return True
+
+    def framebuffer(self):
+        """Row-major list of width*height 0xRRGGBB ints for the current root_group."""
+        import displayio
+        return displayio.composite(self.root_group, self.width, self.height)
+
+    def rgb_array(self):
+        """The framebuffer as a (height, width, 3) uint8 numpy array."""
+        if numpy is None:
+            raise RuntimeError("rgb_array() needs numpy; use framebuffer() without it")
+        pixels = numpy.array(self.framebuffer(), dtype=numpy.uint32).reshape(self.height, self.width)
+        rgb = numpy.empty((self.height, self.width, 3), dtype=numpy.uint8)
+        rgb[..., 0] = pixels >> 16
+        rgb[..., 1] = (pixels >> 8) & 0xFF
+        rgb[..., 2] = pixels & 0xFF
+        return rgb
@@ -0,0 +1 @@
+"""Emulated adafruit_display_text (label.Label only)."""
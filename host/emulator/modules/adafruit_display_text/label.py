@@ -0,0 +1,137 @@
+"""
+Emulated adafruit_display_text.label.Label: a Group of glyph TileGrids laid out
+like the library does for a fixed-cell font. y is the vertical center of the
+text (glyph cells span y - height//2 .. y + height//2 - 1); x is the left edge
+of the first cell; bounding_box is (0, -height//2, advance total, height).
+"""
+import displayio
+
+
+class Label(displayio.Group):
+    def __init__(self, font, *, text="", color=0xFFFFFF, background_color=None,
+                 line_spacing=1.25, scale=1, x=0, y=0, anchor_point=None,
+                 anchored_position=None, **kwargs):
+        super().__init__(scale=scale, x=x, y=y)
+        self.font = font
+        self.line_spacing = line_spacing
+        self._palette = displayio.Palette(2)
+        self._palette.make_transparent(0)
+        self._color = None
+        self._background_color = None
+        self._text = ""
+        self._bounding_box = (0, 0, 0, 0)
+        self._anchor_point = anchor_point
+        self._anchored_position = None
+        self._local = displayio.Group()
+        self.append(self._local)
+        self.color = color
+        self.background_color = background_color
+        self.text = text
+        if anchored_position is not None:
+            self.anchored_position = anchored_position
+
+    @property
+    def text(self):
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        self._text = str(value)
+        self._layout()
+        if self._anchored_position is not None:
+            self.anchored_position = self._anchored_position
+
+    @property
+    def color(self):
+        return self._color
+
+    @color.setter
+    def color(self, value):
+        self._color = value
+        if value is None:
+            self._palette.make_transparent(1)
+        else:
+            self._palette[1] = value
+            self._palette.make_opaque(1)
+
+    @property
+    def background_color(self):
+        return self._background_color
+
+    @background_color.setter
+    def background_color(self, value):
+        self._background_color = value
+        if value is None:
+            self._palette.make_transparent(0)
+        else:
+            self._palette[0] = value
+            self._palette.make_opaque(0)
+
+    @property
+    def bounding_box(self):
+        return self._bounding_box
+
+    @property
+    def width(self):
+        return self._bounding_box[2]
+
+    @property
+    def height(self):
+        return self._bounding_box[3]
+
+    @property
+    def anchor_point(self):
+        return self._anchor_point
+
+    @anchor_point.setter
+    def anchor_point(self, value):
+        self._anchor_point = value
+        if self._anchored_position is not None:
+            self.anchored_position = self._anchored_position
+
+    @property
+    def anchored_position(self):
+        return self._anchored_position
+
+    @anchored_position.setter
+    def anchored_position(self, value):
+        self._anchored_position = value
+        if value is None:
+            return
+        ax, ay = self._anchor_point or (0, 0)
+        bx, by, bw, bh = self._bounding_box
+        self.x = int(value[0] - bx * self.scale - round(ax * bw * self.scale))
+        self.y = int(value[1] - by * self.scale - round(ay * bh * self.scale))
+
+    def _layout(self):
+        while len(self._local):
+            self._local.pop()
+        cell_width, cell_height = self.font.get_bounding_box()
+        top = -(cell_height // 2)
+        x = 0
+        y = top
+        right = 0
+        lines = 1
+        for ch in self._text:
+            if ch == "\n":
+                x = 0
+                y += int(self.line_spacing * cell_height)
+                lines += 1
+                continue
+            glyph = self.font.get_glyph(ord(ch))
+            if glyph is None:
+                continue
+            tile = displayio.TileGrid(
+                glyph.bitmap, pixel_shader=self._palette,
+                tile_width=glyph.width, tile_height=glyph.height,
+                x=x + glyph.dx, y=y - glyph.dy,
+            )
+            tile[0] = glyph.tile_index
+            self._local.append(tile)
+            x += glyph.shift_x
+            right = max(right, x)
+        if not self._text:
+            self._bounding_box = (0, 0, 0, 0)
+            return
+        height = cell_height + (lines - 1) * int(self.line_spacing * cell_height)
+        self._bounding_box = (0, top, right, height)
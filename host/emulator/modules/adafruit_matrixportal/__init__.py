@@ -0,0 +1 @@
+"""Emulated adafruit_matrixportal (matrix.Matrix only)."""
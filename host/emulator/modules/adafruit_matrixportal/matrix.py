@@ -0,0 +1,19 @@
+"""
+Emulated adafruit_matrixportal.matrix.Matrix: display is a FramebufferDisplay
+(host/emulator) that composites root_group on demand instead of driving the panel.
+"""
+from host.emulator import FramebufferDisplay
+
+current = None  # display of the most recent Matrix (host/simulate.py watches it)
+
+
+class Matrix:
+    def __init__(self, *, width=64, height=32, bit_depth=2, alt_addr_pins=None,
+                 color_order="RGB", serpentine=True, tile_rows=1, rotation=0):
+        self.width = width
+        self.height = height
+        self.bit_depth = bit_depth
+        self.display = FramebufferDisplay(width, height)
+        self.display.rotation = rotation
+        global current
+        current = self.display
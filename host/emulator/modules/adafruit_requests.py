@@ -0,0 +1,82 @@
+"""
+Emulated adafruit_requests: Session.get/post over urllib with the library's
+Response surface (status_code, lower-cased headers, content, text, json(),
+iter_content(), close()). Non-2xx answers come back as responses, not exceptions;
+bodies are not decompressed, so compression.py sees what the board would.
+"""
+import json as _json
+import urllib.error
+import urllib.request
+
+
+class Response:
+    def __init__(self, raw, status_code):
+        self._raw = raw
+        self.status_code = status_code
+        self.reason = getattr(raw, "reason", "")
+        self.headers = {key.lower(): value for key, value in raw.headers.items()}
+        self._content = None
+
+    @property
+    def content(self):
+        if self._content is None:
+            self._content = self._raw.read()
+        return self._content
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8")
+
+    def json(self):
+        return _json.loads(self.content)
+
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        if self._content is not None:
+            for i in range(0, len(self._content), chunk_size):
+                yield self._content[i:i + chunk_size]
+            return
+        # Like the library, yield what a single socket read returns rather than filling each chunk
+        read = getattr(self._raw, "read1", self._raw.read)
+        while True:
+            chunk = read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def close(self):
+        self._raw.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class Session:
+    def __init__(self, socket_pool=None, ssl_context=None, session_id=None):
+        self.socket_pool = socket_pool
+        self.ssl_context = ssl_context
+
+    def request(self, method, url, data=None, json=None, headers=None, stream=False, timeout=60):
+        headers = dict(headers or {})
+        if json is not None:
+            data = _json.dumps(json)
+            headers.setdefault("Content-Type", "application/json")
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        request = urllib.request.Request(url, data=data, headers=headers, method=method)
+        try:
+            raw = urllib.request.urlopen(request, timeout=timeout, context=self.ssl_context)
+            return Response(raw, raw.status)
+        except urllib.error.HTTPError as e:
+            return Response(e, e.code)
+
+    def get(self, url, **kw):
+        return self.request("GET", url, **kw)
+
+    def post(self, url, **kw):
+        return self.request("POST", url, **kw)
+
+    def head(self, url, **kw):
+        return self.request("HEAD", url, **kw)
@@ -0,0 +1,19 @@
+"""
+Emulated board: the MatrixPortal pins the scoreboard uses. A pin's level is what
+a DigitalInOut input reads; set it False to hold a button down (buttons pull up).
+"""
+
+
+class Pin:
+    def __init__(self, name):
+        self.name = name
+        self.level = True
+
+    def __repr__(self):
+        return f"board.{self.name}"
+
+
+BUTTON_UP = Pin("BUTTON_UP")
+BUTTON_DOWN = Pin("BUTTON_DOWN")
+NEOPIXEL = Pin("NEOPIXEL")
+L = LED = Pin("LED")
@@ -0,0 +1,236 @@
+"""
+Emulated displayio: the subset the scoreboard uses (Bitmap, Palette, TileGrid,
+Group) plus composite(), which flattens a scene graph into RGB888 pixels the
+way the display core would. Colors are 0xRRGGBB ints; transparent palette
+entries let lower layers show through; uncovered pixels are black.
+"""
+
+
+def _rgb(color):
+    if isinstance(color, (tuple, list, bytes, bytearray)):
+        r, g, b = color[0], color[1], color[2]
+        return (r << 16) | (g << 8) | b
+    return int(color) & 0xFFFFFF
+
+
+class Bitmap:
+    """width x height array of palette indices, each < value_count."""
+
+    def __init__(self, width, height, value_count):
+        if value_count < 1 or value_count > 65536:
+            raise ValueError("value_count must be 1-65536")
+        self.width = width
+        self.height = height
+        self.value_count = value_count
+        self._data = bytearray(width * height) if value_count <= 256 else [0] * (width * height)
+
+    def _index(self, key):
+        if isinstance(key, tuple):
+            x, y = key
+            if not (0 <= x < self.width and 0 <= y < self.height):
+                raise IndexError("pixel out of bounds")
+            return y * self.width + x
+        if not 0 <= key < self.width * self.height:
+            raise IndexError("pixel out of bounds")
+        return key
+
+    def __getitem__(self, key):
+        return self._data[self._index(key)]
+
+    def __setitem__(self, key, value):
+        if not 0 <= value < self.value_count:
+            raise ValueError("value out of range")
+        self._data[self._index(key)] = value
+
+    def fill(self, value):
+        if not 0 <= value < self.value_count:
+            raise ValueError("value out of range")
+        for i in range(len(self._data)):
+            self._data[i] = value
+
+    def blit(self, x, y, source_bitmap, *, x1=0, y1=0, x2=None, y2=None, skip_index=None):
+        x2 = source_bitmap.width if x2 is None else x2
+        y2 = source_bitmap.height if y2 is None else y2
+        for sy in range(y1, y2):
+            for sx in range(x1, x2):
+                dx, dy = x + sx - x1, y + sy - y1
+                if 0 <= dx < self.width and 0 <= dy < self.height:
+                    value = source_bitmap[sx, sy]
+                    if value != skip_index:
+                        self[dx, dy] = value
+
+    def dirty(self, x1=0, y1=0, x2=-1, y2=-1):
+        pass
+
+
+class Palette:
+    """Indexed colors with per-entry transparency."""
+
+    def __init__(self, color_count, *, dither=False):
+        self._colors = [0] * color_count
+        self._transparent = [False] * color_count
+        self.dither = dither
+
+    def __len__(self):
+        return len(self._colors)
+
+    def __getitem__(self, index):
+        return self._colors[index]
+
+    def __setitem__(self, index, color):
+        self._colors[index] = _rgb(color)
+
+    def make_transparent(self, index):
+        self._transparent[index] = True
+
+    def make_opaque(self, index):
+        self._transparent[index] = False
+
+    def is_transparent(self, index):
+        return self._transparent[index]
+
+
+class ColorConverter:
+    """Pass-through shader for bitmaps that hold RGB888 values directly."""
+
+    def __init__(self, *, input_colorspace=None, dither=False):
+        self._transparent = None
+
+    def convert(self, color):
+        return _rgb(color)
+
+    def make_transparent(self, color):
+        self._transparent = _rgb(color)
+
+    def make_opaque(self, color):
+        self._transparent = None
+
+
+class TileGrid:
+    """Grid of tiles cut from a bitmap, colored by pixel_shader."""
+
+    def __init__(self, bitmap, *, pixel_shader, width=1, height=1, tile_width=None,
+                 tile_height=None, default_tile=0, x=0, y=0):
+        self.bitmap = bitmap
+        self.pixel_shader = pixel_shader
+        self.width = width
+        self.height = height
+        self.tile_width = bitmap.width if tile_width is None else tile_width
+        self.tile_height = bitmap.height if tile_height is None else tile_height
+        self.x = x
+        self.y = y
+        self.hidden = False
+        self.flip_x = False
+        self.flip_y = False
+        self.transpose_xy = False
+        self._tiles = [default_tile] * (width * height)
+
+    def _tile_index(self, key):
+        if isinstance(key, tuple):
+            x, y = key
+            return y * self.width + x
+        return key
+
+    def __getitem__(self, key):
+        return self._tiles[self._tile_index(key)]
+
+    def __setitem__(self, key, tile):
+        self._tiles[self._tile_index(key)] = tile
+
+    def _draw(self, frame, width, height, ox, oy, scale):
+        bitmap = self.bitmap
+        shader = self.pixel_shader
+        tiles_per_row = max(1, bitmap.width // self.tile_width)
+        tw, th = self.tile_width, self.tile_height
+        palette = isinstance(shader, Palette)
+        for ty in range(self.height):
+            for tx in range(self.width):
+                tile = self._tiles[ty * self.width + tx]
+                sx0 = (tile % tiles_per_row) * tw
+                sy0 = (tile // tiles_per_row) * th
+                for py in range(th):
+                    for px in range(tw):
+                        bx = tw - 1 - px if self.flip_x else px
+                        by = th - 1 - py if self.flip_y else py
+                        value = bitmap[sx0 + bx, sy0 + by]
+                        if palette:
+                            if shader.is_transparent(value):
+                                continue
+                            color = shader[value]
+                        else:
+                            color = shader.convert(value)
+                            if color == shader._transparent:
+                                continue
+                        lx, ly = (ty * th + py, tx * tw + px) if self.transpose_xy else (tx * tw + px, ty * th + py)
+                        for sy in range(scale):
+                            fy = oy + (self.y + ly) * scale + sy
+                            if not 0 <= fy < height:
+                                continue
+                            for sx in range(scale):
+                                fx = ox + (self.x + lx) * scale + sx
+                                if 0 <= fx < width:
+                                    frame[fy * width + fx] = color
+
+
+class Group:
+    """Ordered layers with a shared offset and integer scale."""
+
+    def __init__(self, *, scale=1, x=0, y=0):
+        self.scale = scale
+        self.x = x
+        self.y = y
+        self.hidden = False
+        self._layers = []
+
+    def append(self, layer):
+        self._layers.append(layer)
+
+    def insert(self, index, layer):
+        self._layers.insert(index, layer)
+
+    def index(self, layer):
+        for i, item in enumerate(self._layers):
+            if item is layer:
+                return i
+        raise ValueError("layer not in group")
+
+    def pop(self, i=-1):
+        return self._layers.pop(i)
+
+    def remove(self, layer):
+        del self._layers[self.index(layer)]
+
+    def __len__(self):
+        return len(self._layers)
+
+    def __getitem__(self, index):
+        return self._layers[index]
+
+    def __setitem__(self, index, layer):
+        self._layers[index] = layer
+
+    def __delitem__(self, index):
+        del self._layers[index]
+
+    def __iter__(self):
+        return iter(self._layers)
+
+    def _draw(self, frame, width, height, ox, oy, scale):
+        ox += self.x * scale
+        oy += self.y * scale
+        scale *= self.scale
+        for layer in self._layers:
+            if not layer.hidden:
+                layer._draw(frame, width, height, ox, oy, scale)
+
+
+def composite(group, width, height):
+    """Flatten group into a row-major list of width*height 0xRRGGBB ints (black background)."""
+    frame = [0] * (width * height)
+    if group is not None and not group.hidden:
+        group._draw(frame, width, height, 0, 0, 1)
+    return frame
+
+
+def release_displays():
+    pass
@@ -0,0 +1,32 @@
+"""Emulated fontio: Glyph and BuiltinFont (a strip of fixed-size glyph tiles in one Bitmap)."""
+
+
+class Glyph:
+    def __init__(self, bitmap, tile_index, width, height, dx, dy, shift_x, shift_y):
+        self.bitmap = bitmap
+        self.tile_index = tile_index
+        self.width = width
+        self.height = height
+        self.dx = dx
+        self.dy = dy
+        self.shift_x = shift_x
+        self.shift_y = shift_y
+
+
+class BuiltinFont:
+    """Fixed-cell font: glyph for code c is tile (c - first) of bitmap."""
+
+    def __init__(self, bitmap, cell_width, cell_height, codes):
+        self.bitmap = bitmap
+        self._cell = (cell_width, cell_height)
+        self._tiles = {code: i for i, code in enumerate(codes)}
+
+    def get_bounding_box(self):
+        return self._cell
+
+    def get_glyph(self, codepoint):
+        tile = self._tiles.get(codepoint)
+        if tile is None:
+            return None
+        width, height = self._cell
+        return Glyph(self.bitmap, tile, width, height, 0, 0, width, 0)
@@ -0,0 +1,18 @@
+"""
+Emulated rtc: RTC().datetime reads the host clock (local time) plus whatever
+offset boot.py's sync set, so a set sticks across RTC() instances like on the board.
+"""
+import time
+
+_offset = 0  # seconds added to the host clock by the last datetime assignment
+
+
+class RTC:
+    @property
+    def datetime(self):
+        return time.localtime(time.time() + _offset)
+
+    @datetime.setter
+    def datetime(self, value):
+        global _offset
+        _offset = int(time.mktime(tuple(value)[:8] + (-1,)) - time.time())
@@ -0,0 +1,30 @@
+"""
+Emulated socketpool: SocketPool hands out CPython sockets, which already have the
+methods the board code uses (connect, send, recv_into, recvfrom_into, sendto,
+settimeout, setblocking, setsockopt, and bind / listen / accept for status_server.py). Non-blocking reads raise OSError EAGAIN as on the board.
+"""
+import socket as _socket
+
+
+class SocketPool:
+    AF_INET = _socket.AF_INET
+    SOCK_STREAM = _socket.SOCK_STREAM
+    SOCK_DGRAM = _socket.SOCK_DGRAM
+    SOL_SOCKET = _socket.SOL_SOCKET
+    SO_REUSEADDR = _socket.SO_REUSEADDR
+    SO_BROADCAST = _socket.SO_BROADCAST
+    IPPROTO_IP = _socket.IPPROTO_IP
+    IPPROTO_TCP = _socket.IPPROTO_TCP
+    IP_MULTICAST_TTL = _socket.IP_MULTICAST_TTL
+    IP_ADD_MEMBERSHIP = _socket.IP_ADD_MEMBERSHIP
+    TCP_NODELAY = _socket.TCP_NODELAY
+    gaierror = _socket.gaierror
+
+    def __init__(self, radio=None):
+        self.radio = radio
+
+    def socket(self, family=_socket.AF_INET, type=_socket.SOCK_STREAM, proto=0):
+        return _socket.socket(family, type, proto)
+
+    def getaddrinfo(self, host, port, family=0, type=0, proto=0, flags=0):
+        return _socket.getaddrinfo(host, port, family, type, proto, flags)
@@ -0,0 +1,81 @@
+"""
+Emulated terminalio: FONT with terminalio's metrics (6x12 cells, 6px advance,
+printable ASCII in one tile strip). Glyph shapes come from the real ter-u12n BDF
+when TERMINALIO_BDF names it, otherwise from host/emulator/glyphs.py.
+"""
+import os
+import displayio
+from fontio import BuiltinFont
+
+CELL_WIDTH = 6
+CELL_HEIGHT = 12
+CODES = list(range(32, 127))
+
+
+def _builtin_cells():
+    from host.emulator.glyphs import GLYPHS, CAP_TOP
+    cells = {}
+    for code in CODES:
+        rows = GLYPHS.get(chr(code), [])
+        pixels = set()
+        for y, row in enumerate(rows):
+            for x, ch in enumerate(row):
+                if ch == "#":
+                    pixels.add((x, CAP_TOP + y))
+        cells[code] = pixels
+    return cells
+
+
+def load_bdf(path):
+    """{code: set((x, y))} for CODES from a BDF font laid out in CELL_WIDTH x CELL_HEIGHT cells."""
+    cells = {}
+    font_x = font_y = 0
+    font_height = CELL_HEIGHT
+    code = None
+    bbx = None
+    rows = None
+    with open(path) as f:
+        for line in f:
+            parts = line.split()
+            if not parts:
+                continue
+            if parts[0] == "FONTBOUNDINGBOX":
+                font_height, font_x, font_y = int(parts[2]), int(parts[3]), int(parts[4])
+            elif parts[0] == "ENCODING":
+                code = int(parts[1])
+            elif parts[0] == "BBX":
+                bbx = [int(p) for p in parts[1:5]]
+            elif parts[0] == "BITMAP":
+                rows = []
+            elif parts[0] == "ENDCHAR":
+                if code in CODES and bbx is not None:
+                    width, height, x_off, y_off = bbx
+                    baseline = font_height + font_y
+                    top = baseline - (y_off + height)
+                    pixels = set()
+                    for y, hex_row in enumerate(rows):
+                        bits = int(hex_row, 16)
+                        nbits = len(hex_row) * 4
+                        for x in range(width):
+                            if bits & (1 << (nbits - 1 - x)):
+                                px, py = x + x_off - font_x, top + y
+                                if 0 <= px < CELL_WIDTH and 0 <= py < CELL_HEIGHT:
+                                    pixels.add((px, py))
+                    cells[code] = pixels
+                code = bbx = rows = None
+            elif rows is not None:
+                rows.append(parts[0])
+    return cells
+
+
+def _build_font():
+    path = os.getenv("TERMINALIO_BDF")
+    cells = load_bdf(path) if path else _builtin_cells()
+    bitmap = displayio.Bitmap(CELL_WIDTH * len(CODES), CELL_HEIGHT, 2)
+    for tile, code in enumerate(CODES):
+        for x, y in cells.get(code, ()):
+            bitmap[tile * CELL_WIDTH + x, y] = 1
+    return BuiltinFont(bitmap, CELL_WIDTH, CELL_HEIGHT, CODES)
+
+
+FONT = _build_font()
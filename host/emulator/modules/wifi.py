@@ -0,0 +1,22 @@
+"""
+Emulated wifi: the computer's network stands in for the radio. connect() always
+succeeds; set radio.connected = False to exercise the main loop's WiFi-down path.
+"""
+
+
+class Radio:
+    def __init__(self):
+        self.enabled = True
+        self.connected = True
+        self.ipv4_address = "127.0.0.1"
+        self.hostname = "matrixportal-emulator"
+        self.ap_info = None
+
+    def connect(self, ssid=None, password=None, *, channel=0, bssid=None, timeout=None):
+        self.connected = True
+
+    def disconnect(self):
+        self.connected = False
+
+
+radio = Radio()
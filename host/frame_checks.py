@@ -0,0 +1,237 @@
+"""
+Frame checks: the board's push and pre-rendered frame paths with datagrams and
+renders under the harness's control. FanoutHub's output is captured instead of
+sent, then fed to FrameState (which the SSE stream in push.py shares) with parts
+dropped on purpose, and each scenario checks what a receiver relies on: a lost
+datagram never duplicates or corrupts the games it already holds. The blit
+scenarios give a DisplayManager a host-rendered bundle (host/renderer.py) and
+check that showing a game again keeps the host frame on screen, and that a
+bundle lagging the board's data is never blitted over a newer score.
+
+    python -m host.frame_checks              # every scenario; exit 1 on any failure
+    python -m host.frame_checks -k heartbeat # only scenarios whose name contains "heartbeat"
+
+Standard library only.
+"""
+import argparse
+import os
+import sys
+import time
+from host import emulator
+
+SLATE_GAMES = 184  # raw games over four sports; enough that a snapshot takes several datagrams
+
+
+class Wire:
+    """Socket pool stand-in for FanoutHub: keeps every datagram sent, receives nothing."""
+
+    AF_INET = 2
+    SOCK_DGRAM = 2
+
+    def __init__(self):
+        self.sent = []
+
+    def socket(self, family, kind):
+        return self
+
+    def setblocking(self, flag):
+        pass
+
+    def sendto(self, data, addr):
+        self.sent.append(bytes(data))
+
+    def recvfrom_into(self, buf):
+        raise OSError(11)
+
+    def take(self):
+        sent, self.sent = self.sent, []
+        return sent
+
+
+class Harness:
+    def __init__(self):
+        self.failures = []
+
+    def expect(self, ok, message):
+        if not ok:
+            self.failures.append(message)
+        return ok
+
+
+def slate(sport="NFL"):
+    """Processed games for sport from a synthetic slate."""
+    from host.slates import raw_slate
+    from games_processor import process_games
+    return process_games(raw_slate(SLATE_GAMES)[sport], sport)
+
+
+def heartbeat_head_lost(h):
+    """A heartbeat whose head datagram is lost must not add its parts to the games already held."""
+    from fanout import FanoutHub
+    from frame_state import FrameState, IGNORED, GAP
+    wire = Wire()
+    hub = FanoutHub(wire, heartbeat=30)
+    games = slate()
+    hub.publish("NFL", games)
+    state = FrameState()
+    first = wire.take()
+    if not h.expect(len(first) > 1, f"snapshot of {len(games)} games fit in {len(first)} datagram(s)"):
+        return
+    for frame in first:
+        state.apply(frame)
+    held = len(state.games("NFL"))
+    h.expect(held == len(games), f"receiver holds {held} of {len(games)} games after the snapshot")
+
+    for beat in range(3):
+        hub.poll(now=time.monotonic() + 60 * (beat + 1))
+        parts = wire.take()[1:]  # the head is lost
+        results = [state.apply(frame)[1] for frame in parts]
+        h.expect(len(state.games("NFL")) == held,
+                 f"heartbeat {beat + 1} without its head: {held} games became {len(state.games('NFL'))}")
+        h.expect(all(r == IGNORED for r in results), f"orphaned parts were applied: {results}")
+
+    changed = [dict(games[0], home_score=games[0].get("home_score", 0) + 3)] + games[1:]
+    hub.publish("NFL", changed)
+    results = [state.apply(frame)[1] for frame in wire.take()]
+    h.expect(results == [GAP], f"first delta after lost heartbeats gave {results}, not a gap (resync)")
+
+    hub.poll(now=time.monotonic() + 600)
+    for frame in wire.take():
+        state.apply(frame)
+    h.expect(len(state.games("NFL")) == held, f"complete heartbeat left {len(state.games('NFL'))} games")
+    h.expect(state.games("NFL")[0].get("home_score") == changed[0]["home_score"],
+             "complete heartbeat did not carry the change")
+
+
+def part_after_delta(h):
+    """A part arriving after a delta (its snapshot superseded) is ignored; the delta's games stand."""
+    import score_frame
+    from fanout import split_frames
+    from frame_state import FrameState, APPLIED, IGNORED
+    games = slate()
+    frames = split_frames("NFL", 1, games)
+    state = FrameState()
+    state.apply(frames[0])
+    changed = [dict(games[0], home_score=games[0].get("home_score", 0) + 7)]
+    h.expect(state.apply(score_frame.encode("NFL", 2, changed, score_frame.FLAG_DELTA))[1] == APPLIED,
+             "delta after the snapshot head was not applied")
+    count = len(state.games("NFL"))
+    late = [state.apply(frame)[1] for frame in frames[1:]]
+    h.expect(all(r == IGNORED for r in late), f"parts after a delta were applied: {late}")
+    h.expect(len(state.games("NFL")) == count, f"{count} games became {len(state.games('NFL'))}")
+
+
+def host_frames(games):
+    """(DisplayManager holding games with a host bundle of them, list of local scoreboard builds)."""
+    import render_frame
+    from display_manager import DisplayManager
+    from host.renderer import FrameRenderer
+    remote = render_frame.RemoteFrames(None, "")
+    remote._bundles["NFL"] = ("bundle", render_frame.decode_bundle(FrameRenderer().bundle("NFL", games))[1])
+    manager = DisplayManager(emulator.FramebufferDisplay(64, 32), None)
+    manager._remote_frames = remote
+    manager.store.put("NFL", games)
+    built = []
+    build = manager.display_scoreboard
+    manager.display_scoreboard = lambda data: (built.append(data), build(data))
+    return manager, built
+
+
+def blit_repeat(h):
+    """The same game rendered twice in a row keeps the host frame; the scene is not rebuilt locally."""
+    games = slate()[:2]
+    manager, built = host_frames(games)
+
+    manager._render_game(games[0])
+    scene = manager._scene
+    if not h.expect(scene is not None and "image" in scene, "first render did not blit the host frame"):
+        return
+    manager._render_game(games[0])
+    h.expect(manager._scene is scene, "second render of the same game replaced the scene")
+    h.expect(not built, f"second render rebuilt the scoreboard locally ({len(built)} build(s))")
+    h.expect(manager.display.root_group is manager._blitter.group, "host frame is no longer on screen")
+    h.expect(not manager.refresh_current_game(), "refresh of an unchanged host frame reported a repaint")
+
+    manager._render_game(games[1])
+    h.expect(manager._scene is not scene and "image" in manager._scene, "next game was not blitted")
+    h.expect(not built, "next game was built locally")
+
+
+def blit_lagging_bundle(h):
+    """A bundle rendered from older data than the board holds is not blitted; the board builds locally."""
+    import render_frame
+    from host.renderer import FrameRenderer
+    games = slate()[:2]
+    manager, built = host_frames(games)
+    manager._render_game(games[0])
+    if not h.expect("image" in (manager._scene or {}), "first render did not blit the host frame"):
+        return
+
+    scored = [dict(games[0], home_score=games[0].get("home_score", 0) + 7)] + games[1:]
+    manager.store.put("NFL", scored)
+    h.expect(manager.refresh_current_game(), "refresh after a score change reported no repaint")
+    h.expect("image" not in manager._scene, "the lagging host frame stayed on screen")
+    h.expect(manager._scene["game"]["home_score"] == scored[0]["home_score"],
+             f"screen shows {manager._scene['game'].get('home_score')}, data has {scored[0]['home_score']}")
+    h.expect(len(built) == 1, f"{len(built)} local build(s) for the new score, not 1")
+
+    manager._render_game(scored[0])
+    h.expect("image" not in manager._scene, "rendering the game again blitted the lagging frame")
+
+    fresh = FrameRenderer().bundle("NFL", scored)
+    manager._remote_frames._bundles["NFL"] = ("fresh", render_frame.decode_bundle(fresh)[1])
+    manager._render_game(scored[0])
+    h.expect("image" in manager._scene, "a bundle caught up with the data was not blitted")
+
+
+SCENARIOS = [
+    ("heartbeat-head-lost", heartbeat_head_lost),
+    ("part-after-delta", part_after_delta),
+    ("blit-repeat", blit_repeat),
+    ("blit-lagging-bundle", blit_lagging_bundle),
+]
+
+
+def run(pattern="", verbose=False):
+    os.environ.setdefault("API_KEY", "frames")
+    emulator.install()
+    failed = 0
+    for name, scenario in SCENARIOS:
+        if pattern and pattern not in name:
+            continue
+        h = Harness()
+        stdout = sys.stdout
+        devnull = None if verbose else open(os.devnull, "w")
+        if devnull is not None:
+            sys.stdout = devnull
+        try:
+            scenario(h)
+        except Exception as e:
+            h.failures.append(f"raised {type(e).__name__}: {e}")
+        finally:
+            sys.stdout = stdout
+            if devnull is not None:
+                devnull.close()
+        if h.failures:
+            failed += 1
+            print(f"FAIL {name}")
+            for message in h.failures:
+                print(f"     {message}")
+        else:
+            print(f"ok   {name}")
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", dest="pattern", default="", help="only scenarios whose name contains this")
+    parser.add_argument("--verbose", action="store_true", help="show the board code's serial output")
+    args = parser.parse_args()
+    failed = run(args.pattern, args.verbose)
+    print(f"{failed} check(s) failed" if failed else "All checks passed")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
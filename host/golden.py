@@ -0,0 +1,203 @@
+"""
+Golden-frame pixel tests: renders every mock game (mock_games.py: each sport x
+status, the status labels and edge cases) plus the static text screens with the
+board's DisplayManager in the headless emulator, and compares each 64x32 frame
+with the checked-in golden in host/goldens/ (binary PPM).
+
+    python -m host.golden               # check; exit 1 on any differing pixel
+    python -m host.golden --update      # accept the current rendering as the goldens
+    python -m host.golden -k nfl        # only cases whose name contains "nfl"
+
+A mismatch writes <case>.diff.ppm to --diff-dir: expected | actual | diff, with
+differing pixels red in the diff panel. The RTC is pinned to mock_games.MOCK_DATE
+and the built-in glyphs are always used (TERMINALIO_BDF is ignored), so frames
+depend only on the layout code.
+"""
+import argparse
+import os
+import sys
+import time
+
+if os.environ.pop("TERMINALIO_BDF", None):
+    print("TERMINALIO_BDF ignored: goldens use the built-in glyphs")
+
+from host import emulator  # noqa: E402
+
+emulator.install()
+
+import rtc  # noqa: E402  (emulated)
+from config import DISPLAY_WIDTH, DISPLAY_HEIGHT  # noqa: E402
+from display_manager import DisplayManager  # noqa: E402
+from mock_games import (  # noqa: E402
+    MOCK_DATE, MOCK_GAMES_BY_SPORT, STATUS_TEST_LABELS, EDGE_CASE_GAMES, create_status_mock_game,
+)
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "goldens")
+STATIC_TEXTS = ["Starting", "Load\nScores", "WiFi\nDown", "Init\nError", "Safe\nMode", "Display\nIssue"]
+DIFF_COLOR = 0xFF0000
+
+
+class _NoAPI:
+    """Golden cases never fetch."""
+
+
+def _slug(text):
+    return "".join(ch if ch.isalnum() else "-" for ch in text.lower()).strip("-")
+
+
+def cases():
+    """[(name, game dict or static text)] in a stable order."""
+    found = []
+    for sport, games in MOCK_GAMES_BY_SPORT.items():
+        for i, game in enumerate(games):
+            found.append((f"{sport.lower()}-{i}-{_slug(game['status'])}", game))
+    for status in STATUS_TEST_LABELS:
+        found.append((f"status-{_slug(status)}", create_status_mock_game(status)))
+    for i, game in enumerate(EDGE_CASE_GAMES):
+        found.append((f"edge-{i}-{_slug(game['status'])}", game))
+    for text in STATIC_TEXTS:
+        found.append((f"text-{_slug(text)}", text))
+    return found
+
+
+class Rasterizer:
+    """Renders a case to row-major 0xRRGGBB pixels with a fresh DisplayManager state."""
+
+    def __init__(self, width=DISPLAY_WIDTH, height=DISPLAY_HEIGHT):
+        year, month, day = (int(part) for part in MOCK_DATE.split("-"))
+        rtc.RTC().datetime = time.struct_time((year, month, day, 12, 0, 0, 0, 0, -1))
+        self.display = emulator.FramebufferDisplay(width, height)
+        self.manager = DisplayManager(self.display, _NoAPI())
+
+    def render(self, case):
+        if isinstance(case, str):
+            self.manager.display_static_text(case)
+        else:
+            self.manager.current_sport = case.get("sport", "SPORTS")
+            self.manager.display_scoreboard(self.manager.create_game_text(case))
+        return self.display.framebuffer()
+
+
+def write_ppm(path, pixels, width, height):
+    """Binary PPM (P6) of row-major 0xRRGGBB pixels."""
+    data = bytearray()
+    for color in pixels:
+        data += bytes((color >> 16, (color >> 8) & 0xFF, color & 0xFF))
+    with open(path, "wb") as f:
+        f.write(f"P6\n{width} {height}\n255\n".encode("ascii"))
+        f.write(data)
+
+
+def read_ppm(path):
+    """(width, height, pixels) from a binary PPM written by write_ppm."""
+    with open(path, "rb") as f:
+        data = f.read()
+    fields = []
+    pos = 0
+    while len(fields) < 4:
+        while data[pos:pos + 1].isspace():
+            pos += 1
+        if data[pos:pos + 1] == b"#":
+            pos = data.index(b"\n", pos) + 1
+            continue
+        end = pos
+        while not data[end:end + 1].isspace():
+            end += 1
+        fields.append(data[pos:end])
+        pos = end
+    if fields[0] != b"P6" or fields[3] != b"255":
+        raise ValueError(f"{path}: not an 8-bit binary PPM")
+    width, height = int(fields[1]), int(fields[2])
+    body = data[pos + 1:pos + 1 + width * height * 3]
+    if len(body) != width * height * 3:
+        raise ValueError(f"{path}: truncated")
+    pixels = [(body[i] << 16) | (body[i + 1] << 8) | body[i + 2] for i in range(0, len(body), 3)]
+    return width, height, pixels
+
+
+def diff_image(expected, actual, width, height, scale=4):
+    """(pixels, width, height) of expected | actual | diff panels, scaled up for viewing."""
+    panels = width * 3 + 2
+    out = [0x404040] * (panels * height)
+    for y in range(height):
+        for x in range(width):
+            i = y * width + x
+            e, a = expected[i], actual[i]
+            row = y * panels
+            out[row + x] = e
+            out[row + width + 1 + x] = a
+            dimmed = ((e >> 2) & 0x3F3F3F)
+            out[row + 2 * (width + 1) + x] = DIFF_COLOR if e != a else dimmed
+    if scale > 1:
+        scaled = []
+        for y in range(height):
+            row = []
+            for color in out[y * panels:(y + 1) * panels]:
+                row.extend([color] * scale)
+            for _ in range(scale):
+                scaled.extend(row)
+        return scaled, panels * scale, height * scale
+    return out, panels, height
+
+
+def run(pattern="", update=False, diff_dir="golden_diffs", scale=4):
+    """Check (or with update, rewrite) every matching case. Returns the number of failures."""
+    rasterizer = Rasterizer()
+    width, height = rasterizer.display.width, rasterizer.display.height
+    started = time.monotonic()
+    checked = failed = written = 0
+    for name, case in cases():
+        if pattern and pattern not in name:
+            continue
+        checked += 1
+        pixels = rasterizer.render(case)
+        path = os.path.join(GOLDEN_DIR, f"{name}.ppm")
+        expected = None
+        if os.path.exists(path):
+            golden_width, golden_height, golden = read_ppm(path)
+            if (golden_width, golden_height) == (width, height):
+                expected = golden
+        if update:
+            if expected != pixels:
+                os.makedirs(GOLDEN_DIR, exist_ok=True)
+                write_ppm(path, pixels, width, height)
+                written += 1
+                print(f"updated {name}")
+            continue
+        if expected is None:
+            failed += 1
+            print(f"MISSING {name} (run with --update to create it)")
+            continue
+        differing = sum(1 for e, a in zip(expected, pixels) if e != a)
+        if differing:
+            failed += 1
+            os.makedirs(diff_dir, exist_ok=True)
+            diff_path = os.path.join(diff_dir, f"{name}.diff.ppm")
+            write_ppm(diff_path, *diff_image(expected, pixels, width, height, scale))
+            print(f"FAIL {name}: {differing} pixels differ -> {diff_path}")
+    elapsed = time.monotonic() - started
+    if update:
+        print(f"{checked} frames rendered, {written} goldens written in {elapsed:.2f}s")
+    else:
+        print(f"{checked} frames checked, {failed} failed in {elapsed:.2f}s")
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", dest="pattern", default="", help="only cases whose name contains this")
+    parser.add_argument("--update", action="store_true", help="write the current frames as goldens")
+    parser.add_argument("--diff-dir", default="golden_diffs", help="where mismatch images go")
+    parser.add_argument("--scale", type=int, default=4, help="diff image magnification")
+    parser.add_argument("--list", action="store_true", help="list case names and exit")
+    args = parser.parse_args()
+    if args.list:
+        for name, _ in cases():
+            print(name)
+        return
+    if run(args.pattern, args.update, args.diff_dir, args.scale):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+Reads the board's persistent metrics log (metrics_log.py, METRICS_LOG_PATH on the
+SD card) and prints a summary of every field and a time series in fixed buckets,
+with a sparkline per field so a week of behavior fits on one screen.
+
+    python -m host.metrics_report /media/sd/metrics.bin                 # hourly series
+    python -m host.metrics_report metrics.bin --every 6h --since 7d
+    python -m host.metrics_report metrics.bin --fields fetch_ms.NFL,err.timeout,heap_free
+    python -m host.metrics_report metrics.bin --csv week.csv            # one row per record
+
+Counts (fetches, bytes_rx, cache_hits, err.*, renders, wifi_reconnects) are summed
+per bucket; fetch_ms.* and render_ms are averaged over the records that have them;
+heap_free is the lowest value in the bucket. "fetch_ms" and "errors" in the series
+are the mean over sports and the sum over causes. Records written before the RTC was
+synced (t = 0) are placed from the uptime of a synced record in the same boot.
+Standard library only.
+"""
+import argparse
+import csv
+import sys
+import time
+
+from metrics_log import read_records
+
+BOOKKEEPING = ("seq", "t", "uptime_s", "interval_s")
+DEFAULT_SERIES = ("fetches", "fetch_ms", "bytes_rx", "cache_hits", "errors", "heap_free", "render_ms", "wifi_reconnects")
+SPARK = " ▁▂▃▄▅▆▇█"
+UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_span(text):
+    """'90m', '6h', '7d' or seconds -> seconds."""
+    text = text.strip()
+    if text and text[-1] in UNITS:
+        return float(text[:-1]) * UNITS[text[-1]]
+    return float(text)
+
+
+def boots(records):
+    """Records split wherever uptime goes backwards (a reset)."""
+    segments = []
+    for record in records:
+        if not segments or record["uptime_s"] < segments[-1][-1]["uptime_s"]:
+            segments.append([])
+        segments[-1].append(record)
+    return segments
+
+
+def assign_times(records):
+    """Set record["time"]: RTC time, else derived from a synced record in the same boot (None if none)."""
+    for segment in boots(records):
+        anchor = next((r for r in segment if r["t"]), None)
+        for record in segment:
+            if record["t"]:
+                record["time"] = record["t"]
+            elif anchor is not None:
+                record["time"] = anchor["t"] - (anchor["uptime_s"] - record["uptime_s"])
+            else:
+                record["time"] = None
+    return records
+
+
+def field_kind(name):
+    if name == "heap_free":
+        return "min"
+    if "_ms" in name:
+        return "mean"
+    return "sum"
+
+
+def derive(record, layout_names):
+    """Add the series-only columns: fetch_ms (mean over sports) and errors (sum over causes)."""
+    sports = [record[n] for n in layout_names if n.startswith("fetch_ms.") and record[n]]
+    record["fetch_ms"] = round(sum(sports) / len(sports)) if sports else 0
+    record["errors"] = sum(record[n] for n in layout_names if n.startswith("err."))
+    return record
+
+
+def aggregate(name, values):
+    """One bucket's value for field name (None when nothing was recorded)."""
+    kind = field_kind(name)
+    if kind == "sum":
+        return sum(values) if values else None
+    present = [v for v in values if v]
+    if not present:
+        return None
+    return min(present) if kind == "min" else sum(present) / len(present)
+
+
+def bucketize(records, every):
+    """[(bucket start epoch, [records])] for records with a time, oldest first, empty buckets included."""
+    timed = [r for r in records if r["time"] is not None]
+    if not timed:
+        return []
+    first = int(timed[0]["time"] // every)
+    last = int(timed[-1]["time"] // every)
+    buckets = [(int((first + i) * every), []) for i in range(last - first + 1)]
+    for record in timed:
+        buckets[int(record["time"] // every) - first][1].append(record)
+    return buckets
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, (len(values) * p) // 100)]
+
+
+def sparkline(values):
+    present = [v for v in values if v is not None]
+    if not present:
+        return ""
+    low, high = min(present), max(present)
+    out = []
+    for v in values:
+        if v is None:
+            out.append(" ")
+        elif high == low:
+            out.append(SPARK[1])
+        else:
+            out.append(SPARK[1 + int((v - low) / (high - low) * (len(SPARK) - 2))])
+    return "".join(out)
+
+
+def summarize(name, records, buckets, span_s):
+    """Summary line for one field."""
+    values = [r[name] for r in records]
+    series = [aggregate(name, [r[name] for r in rs]) for _, rs in buckets]
+    kind = field_kind(name)
+    if kind == "sum":
+        total = sum(values)
+        rate = total / (span_s / 3600) if span_s else 0
+        text = f"total {total:>10}  {rate:>9.1f}/h  max/record {max(values) if values else 0:>6}"
+    else:
+        present = [v for v in values if v]
+        if not present:
+            return f"  {name:<18} no data"
+        text = (f"mean {sum(present) / len(present):>9.0f}  p50 {percentile(present, 50):>7}  "
+                f"p95 {percentile(present, 95):>7}  min {min(present):>7}  max {max(present):>7}")
+    return f"  {name:<18} {text}  {sparkline(series)}"
+
+
+def _format(value, name):
+    if value is None:
+        return "-"
+    if name == "bytes_rx":
+        return f"{value / 1024:.0f}K"
+    if isinstance(value, float):
+        return f"{value:.0f}"
+    return str(value)
+
+
+def print_report(path, layout, records, every, fields=None, out=sys.stdout):
+    names = [name for name, _ in layout if name not in BOOKKEEPING]
+    for record in records:
+        derive(record, names)
+    assign_times(records)
+    buckets = bucketize(records, every)
+    segments = boots(records)
+    untimed = sum(1 for r in records if r["time"] is None)
+    timed = [r for r in records if r["time"] is not None]
+    span_s = sum(r["interval_s"] for r in records)
+
+    print(f"{path}: {len(records)} records, {len(segments)} boot(s) ({len(segments) - 1} reset(s))", file=out)
+    if timed:
+        start, end = timed[0]["time"], timed[-1]["time"]
+        print(f"  {_stamp(start)} -> {_stamp(end)} ({(end - start) / 86400:.1f} days), "
+              f"{every / 3600:g} h per bucket", file=out)
+    if untimed:
+        print(f"  {untimed} record(s) from boots that never synced the clock are left out of the series", file=out)
+    if not records:
+        return
+
+    print("Summary (sparkline: one character per bucket):", file=out)
+    for name in names:
+        print(summarize(name, records, buckets, span_s), file=out)
+
+    columns = list(fields or DEFAULT_SERIES)
+    print("Time series:", file=out)
+    widths = [max(8, len(c)) for c in columns]
+    print(f"  {'bucket':<16} " + " ".join(f"{c:>{w}}" for c, w in zip(columns, widths)), file=out)
+    for start, bucket in buckets:
+        cells = [_format(aggregate(c, [r[c] for r in bucket]) if bucket else None, c) for c in columns]
+        print(f"  {_stamp(start):<16} " + " ".join(f"{v:>{w}}" for v, w in zip(cells, widths)), file=out)
+
+
+def _stamp(epoch):
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(epoch))
+
+
+def write_csv(path, layout, records):
+    names = ["time"] + [name for name, _ in layout]
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(names)
+        for record in records:
+            row = [_stamp(record["time"]) if record.get("time") is not None else ""]
+            writer.writerow(row + [record[name] for name, _ in layout])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", help="metrics log copied off the SD card")
+    parser.add_argument("--every", default="1h", help="bucket size for the series: 30m, 1h, 6h, 1d (default 1h)")
+    parser.add_argument("--since", help="only the last span of the log, e.g. 7d or 12h")
+    parser.add_argument("--fields", help="comma-separated series columns (record fields, fetch_ms or errors)")
+    parser.add_argument("--csv", help="also write every record to this CSV file")
+    args = parser.parse_args()
+
+    try:
+        layout, records = read_records(args.path)
+    except (OSError, ValueError) as e:
+        raise SystemExit(str(e))
+    known = {name for name, _ in layout} | {"fetch_ms", "errors"}
+    fields = [f.strip() for f in args.fields.split(",") if f.strip()] if args.fields else None
+    unknown = [f for f in fields or () if f not in known]
+    if unknown:
+        raise SystemExit(f"unknown field(s) {', '.join(unknown)}; the log has {', '.join(sorted(known))}")
+    if args.since:
+        assign_times(records)
+        newest = max((r["time"] for r in records if r["time"] is not None), default=None)
+        if newest is not None:
+            cutoff = newest - parse_span(args.since)
+            records = [r for r in records if r["time"] is not None and r["time"] >= cutoff]
+    print_report(args.path, layout, records, parse_span(args.every), fields)
+    if args.csv:
+        write_csv(args.csv, layout, records)
+        print(f"Records written to {args.csv}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+"""
+Local stand-in for the sports API and the RTC time services, with scripted
+faults, so the board's retry, cache, breaker and time-sync paths can be driven
+on purpose (host/resilience.py does that against the real client code; a board
+or host/simulate.py can use it with API_URL = "http://<host>:8090/api").
+
+    python -m host.mockapi [--port 8090] --fault nfl=503x2,ok --fault time=hang:30
+
+Endpoints:
+  GET /api/<sport>/scores           {"games": [...], "timestamp": ...} from host/slates.py
+  GET /api/Time/current/zone        timeapi.io shape: {"dateTime": ...}
+  GET /developer/api/ip             time.now shape: {"datetime": ...}
+  GET /_status                      JSON: requests per route and scripted faults left
+  POST /_faults                     JSON {"nfl": "503x3,ok", ...} replaces those routes' scripts
+
+Routes are the sport in lower case ("nfl") or "time". Each request takes the
+next step of its route's script, then the default (--default, "ok"):
+  ok              normal answer (gzip when the client accepts it)
+  latency:S       answer after S seconds
+  hang[:S]        say nothing for S seconds (default 60), then close
+  reset           close the connection without answering
+  <code>          that HTTP status with a small JSON error body, e.g. 503 or 404
+  truncate[:F]    full Content-Length, send only fraction F (default 0.5) and close
+  drip[:B]        send the body B bytes per second (default 200) in small pieces
+  oversize[:N]    pad the body to N bytes (default 1 MB)
+  html            200 with an HTML error page instead of JSON (captive portals, proxies)
+Append xN to repeat a step: "503x3,latency:2x2,ok". --chaos P replaces each
+unscripted answer with a random fault with probability P.
+Standard library only.
+"""
+import argparse
+import gzip
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import score_frame
+from host.slates import raw_slate
+
+TIME_PATHS = ("/api/Time/current/zone", "/developer/api/ip")
+DRIP_PIECE = 32  # bytes per write while dripping
+DEFAULT_HANG = 60
+DEFAULT_DRIP = 200
+DEFAULT_OVERSIZE = 1024 * 1024
+CHAOS_FAULTS = ["latency:3", "hang:30", "reset", "500", "503", "429", "truncate", "drip", "html"]
+
+
+def parse_faults(spec):
+    """'503x2,latency:1.5,ok' -> [("503", None), ("503", None), ("latency", 1.5), ("ok", None)]."""
+    steps = []
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        count = 1
+        if "x" in item and item.rsplit("x", 1)[1].isdigit():
+            item, repeat = item.rsplit("x", 1)
+            count = int(repeat)
+        kind, _, arg = item.partition(":")
+        if not (kind.isdigit() or kind in ("ok", "latency", "hang", "reset", "truncate", "drip", "oversize", "html")):
+            raise ValueError(f"unknown fault {kind!r}")
+        steps.extend([(kind, float(arg) if arg else None)] * count)
+    return steps
+
+
+class FaultScript:
+    """Per-route queues of scripted faults and request counts; shared by all handler threads."""
+
+    def __init__(self, default="ok", chaos=0.0, seed=0):
+        self._lock = threading.Lock()
+        self._steps = {}  # route -> [(kind, arg)]
+        self.default = parse_faults(default)[0]
+        self.chaos = chaos
+        self._rng = random.Random(seed)
+        self.hits = {}
+
+    def set(self, route, spec):
+        """Replace route's script with spec (a fault string)."""
+        steps = parse_faults(spec)
+        with self._lock:
+            self._steps[route] = steps
+
+    def reset(self):
+        with self._lock:
+            self._steps = {}
+            self.hits = {}
+
+    def next(self, route):
+        """The (kind, arg) fault for route's next request."""
+        with self._lock:
+            self.hits[route] = self.hits.get(route, 0) + 1
+            steps = self._steps.get(route)
+            if steps:
+                return steps.pop(0)
+            if self.chaos and self._rng.random() < self.chaos:
+                return parse_faults(self._rng.choice(CHAOS_FAULTS))[0]
+            return self.default
+
+    def status(self):
+        with self._lock:
+            return {
+                "hits": dict(self.hits),
+                "scripted": {route: len(steps) for route, steps in self._steps.items() if steps},
+                "default": self.default[0],
+                "chaos": self.chaos,
+            }
+
+
+class MockAPI:
+    """The HTTP server plus its slates, script and clock; start() serves on a daemon thread."""
+
+    def __init__(self, host="127.0.0.1", port=0, script=None, games_per_sport=8, seed=0, clock=None):
+        self.script = script or FaultScript()
+        self.slate = raw_slate(games_per_sport * len(score_frame.SPORTS), seed)
+        self.clock = clock  # epoch served by the time endpoints; None = now
+        self.stopping = threading.Event()
+        self.server = ThreadingHTTPServer((host, port), make_handler(self))
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{'127.0.0.1' if host == '0.0.0.0' else host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.stopping.set()  # releases hanging and dripping handlers
+        self.server.shutdown()
+        self.server.server_close()
+
+    def scores(self, sport):
+        return {"games": self.slate.get(sport.upper(), []), "timestamp": int(time.time())}
+
+    def time_answer(self, path):
+        now = time.time() if self.clock is None else self.clock
+        stamp = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(now))
+        zone = time.strftime("%Z", time.localtime(now))  # the computer's local time, like an IP lookup
+        if path == "/developer/api/ip":
+            return {"datetime": f"{stamp}.000000", "timezone": zone}
+        return {"dateTime": f"{stamp}.0000000", "timeZone": zone}
+
+
+def _route(path):
+    """(route, sport or None) for an API path, or (None, None)."""
+    if path in TIME_PATHS:
+        return "time", None
+    parts = path.strip("/").split("/")
+    if len(parts) == 3 and parts[0] == "api" and parts[2] == "scores" and parts[1].upper() in score_frame.SPORTS:
+        return parts[1].lower(), parts[1].upper()
+    return None, None
+
+
+def make_handler(mock):
+    """HTTP handler class answering through mock's fault script."""
+
+    class MockHandler(BaseHTTPRequestHandler):
+        def _send(self, status, body, content_type="application/json", encoding=None, length=None):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body) if length is None else length))
+            if encoding:
+                self.send_header("Content-Encoding", encoding)
+            self.send_header("Connection", "close")
+            self.end_headers()
+
+        def do_GET(self):
+            path = self.path.partition("?")[0]
+            if path == "/_status":
+                body = json.dumps(mock.script.status()).encode()
+                self._send(200, body)
+                self.wfile.write(body)
+                return
+            route, sport = _route(path)
+            if route is None:
+                self.send_error(404)
+                return
+            kind, arg = mock.script.next(route)
+            try:
+                self._answer(path, sport, kind, arg)
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # the client gave up, which is often the point
+
+        def do_POST(self):
+            if self.path != "/_faults":
+                self.send_error(404)
+                return
+            try:
+                specs = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+                for route, spec in specs.items():
+                    mock.script.set(route, spec)
+            except (ValueError, AttributeError) as e:
+                self.send_error(400, str(e))
+                return
+            body = json.dumps(mock.script.status()).encode()
+            self._send(200, body)
+            self.wfile.write(body)
+
+        def _answer(self, path, sport, kind, arg):
+            if kind == "hang":
+                mock.stopping.wait(DEFAULT_HANG if arg is None else arg)
+                return
+            if kind == "reset":
+                return
+            if kind == "latency":
+                if mock.stopping.wait(arg or 0):
+                    return
+            if kind.isdigit():
+                body = json.dumps({"error": f"mock {kind}"}).encode()
+                self._send(int(kind), body)
+                self.wfile.write(body)
+                return
+            if kind == "html":
+                body = b"<html><body><h1>502 Bad Gateway</h1></body></html>"
+                self._send(200, body, content_type="text/html")
+                self.wfile.write(body)
+                return
+
+            payload = mock.scores(sport) if sport else mock.time_answer(path)
+            body = json.dumps(payload).encode()
+            if kind == "oversize":
+                size = int(arg or DEFAULT_OVERSIZE)
+                payload["padding"] = "x" * max(0, size - len(body) - 16)
+                body = json.dumps(payload).encode()
+            encoding = None
+            if sport and "gzip" in self.headers.get("Accept-Encoding", ""):
+                body = gzip.compress(body)
+                encoding = "gzip"
+
+            if kind == "truncate":
+                self._send(200, body, encoding=encoding)
+                self.wfile.write(body[:int(len(body) * (0.5 if arg is None else arg))])
+                self.wfile.flush()
+                return
+            self._send(200, body, encoding=encoding)
+            if kind == "drip":
+                pause = DRIP_PIECE / (arg or DEFAULT_DRIP)
+                for i in range(0, len(body), DRIP_PIECE):
+                    self.wfile.write(body[i:i + DRIP_PIECE])
+                    self.wfile.flush()
+                    if mock.stopping.wait(pause):
+                        return
+                return
+            self.wfile.write(body)
+
+        def log_message(self, fmt, *args):
+            pass
+
+    return MockHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--fault", action="append", default=[], metavar="ROUTE=SPEC",
+                        help="script for a route, e.g. nfl=503x2,ok or time=hang (repeatable)")
+    parser.add_argument("--default", default="ok", help="fault once a route's script runs out")
+    parser.add_argument("--chaos", type=float, default=0.0, help="probability of a random fault per unscripted request")
+    parser.add_argument("--games", type=int, default=8, help="games per sport")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    script = FaultScript(args.default, args.chaos, args.seed)
+    for item in args.fault:
+        route, _, spec = item.partition("=")
+        script.set(route.lower(), spec)
+    mock = MockAPI(args.host, args.port, script, args.games, args.seed)
+    print(f"Mock sports API on {mock.url} (API_URL = \"{mock.url}/api\")")
+    try:
+        mock.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        mock.stopping.set()
+        mock.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""
+Push relay: streams score frames to boards over Server-Sent Events
+(API_BACKEND = "stream", FEED_URL = "http://<host>:8081").
+
+The companion aggregator serves the same /events endpoint from real API data.
+Run standalone, this is a stand-in relay fed by synthetic games, with switches
+that break the stream on purpose to exercise reconnect and resume on Linux:
+
+    python -m host.relay [--port 8081] [--step 5] [--drop-every 60] [--gap-every 4]
+
+Endpoints:
+  GET /events?since=NFL.3,NBA.7   SSE stream; missed deltas are replayed from history,
+                                  otherwise a snapshot is sent first
+  GET /status                     JSON: per-sport sequence and history depth
+Standard library only.
+"""
+import argparse
+import base64
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import score_frame
+from frame_state import diff_games, parse_cursor
+
+HISTORY = 32        # deltas kept per sport for resuming clients
+PING_INTERVAL = 15  # seconds between keep-alive pings (boards drop silent streams)
+
+
+class EventFeed:
+    """Per-sport sequence, games, snapshot and recent deltas; writers notify waiting streams."""
+
+    def __init__(self, sports=score_frame.SPORTS):
+        self._changed = threading.Condition()
+        self.version = 0
+        self._feeds = {sport: {"seq": 0, "games": [], "history": []} for sport in sports}
+
+    def sports(self):
+        return list(self._feeds)
+
+    def publish(self, sport, games):
+        """Install new games for sport. Returns the new seq, or None if nothing changed."""
+        with self._changed:
+            feed = self._feeds[sport]
+            if games == feed["games"]:
+                return None
+            changed = diff_games(feed["games"], games) if feed["seq"] else None
+            feed["seq"] += 1
+            seq = feed["seq"]
+            if changed is None:
+                frame = score_frame.encode(sport, seq, games)
+            else:
+                frame = score_frame.encode(sport, seq, changed, score_frame.FLAG_DELTA)
+            feed["games"] = games
+            feed["history"] = (feed["history"] + [(seq, frame)])[-HISTORY:]
+            self.version += 1
+            self._changed.notify_all()
+            return seq
+
+    def frames_since(self, sport, seq):
+        """[(seq, frame)] that bring a client at seq up to date: replayed deltas or one snapshot."""
+        with self._changed:
+            feed = self._feeds[sport]
+            current = feed["seq"]
+            if seq == current:
+                return []
+            history = feed["history"]
+            if seq is not None and history and history[0][0] <= seq + 1 <= current:
+                return [entry for entry in history if entry[0] > seq]
+            return [(current, score_frame.encode(sport, current, feed["games"]))]
+
+    def wait(self, version, timeout):
+        """Block until version moves past the given one. Returns False on timeout."""
+        with self._changed:
+            return self._changed.wait_for(lambda: self.version != version, timeout)
+
+    def cursor(self):
+        """'NFL.3,NBA.7' - current seq per sport (sent with each ping so clients notice a lost tail)."""
+        with self._changed:
+            return ",".join(f"{s}.{f['seq']}" for s, f in self._feeds.items())
+
+    def status(self):
+        with self._changed:
+            return {s: {"seq": f["seq"], "games": len(f["games"]), "history": len(f["history"])} for s, f in self._feeds.items()}
+
+
+def serve_events(handler, feed, query, drop_after=None, gap_every=0):
+    """Stream feed to one client until it disconnects (or drop_after seconds pass)."""
+    since = ""
+    for pair in query.split("&"):
+        key, _, value = pair.partition("=")
+        if key == "since":
+            since = value
+    cursor = parse_cursor(since)
+    handler.send_response(200)
+    handler.send_header("Content-Type", "text/event-stream")
+    handler.send_header("Cache-Control", "no-cache")
+    handler.end_headers()
+    started = time.monotonic()
+    sent = 0
+    try:
+        while True:
+            version = feed.version
+            for sport in feed.sports():
+                for seq, frame in feed.frames_since(sport, cursor.get(sport)):
+                    cursor[sport] = seq
+                    sent += 1
+                    if gap_every and sent % gap_every == 0 and score_frame.decode_header(frame)[2] & score_frame.FLAG_DELTA:
+                        print(f"Dropping {sport} seq {seq} on purpose")
+                        continue
+                    data = base64.b64encode(frame).decode("ascii")
+                    handler.wfile.write(f"event: frame\nid: {sport}.{seq}\ndata: {data}\n\n".encode("ascii"))
+            handler.wfile.flush()
+            if drop_after and time.monotonic() - started >= drop_after:
+                print("Dropping stream on purpose")
+                return
+            if not feed.wait(version, PING_INTERVAL):
+                handler.wfile.write(f"event: ping\ndata: {feed.cursor()}\n\n".encode("ascii"))
+                handler.wfile.flush()
+    except (BrokenPipeError, ConnectionResetError):
+        pass
+
+
+def make_handler(feed, drop_after=None, gap_every=0):
+    """HTTP handler class serving /events and /status from feed."""
+
+    class RelayHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path, _, query = self.path.partition("?")
+            if path == "/events":
+                serve_events(self, feed, query, drop_after, gap_every)
+                return
+            if path == "/status":
+                body = json.dumps(feed.status()).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+            self.send_error(404)
+
+        def log_message(self, fmt, *args):
+            pass
+
+    return RelayHandler
+
+
+def synthetic_games(sport, count=3):
+    """A few in-progress games shaped like process_games output."""
+    teams = ["AAA", "BBB", "CCC", "DDD", "EEE", "FFF", "GGG", "HHH"]
+    games = []
+    for i in range(count):
+        games.append({
+            "sport": sport, "home_team": teams[2 * i], "away_team": teams[2 * i + 1],
+            "home_score": 0, "away_score": 0, "status": "In Progress",
+            "period": "1", "clock": "12:00", "stoppage": False, "date": "",
+            "venue": "", "home_record": "", "away_record": "", "last_play": "",
+            "down_distance": "", "possession": "", "count": {}, "bases": {},
+        })
+    return games
+
+
+def run_synthetic(feed, step, stop):
+    """Score a random synthetic game every step seconds until stop is set."""
+    games = {sport: synthetic_games(sport) for sport in feed.sports()}
+    for sport, sport_games in games.items():
+        feed.publish(sport, sport_games)
+    while not stop.wait(step):
+        sport = random.choice(feed.sports())
+        sport_games = [dict(g) for g in games[sport]]
+        game = random.choice(sport_games)
+        side = random.choice(("home_score", "away_score"))
+        game[side] += 1
+        games[sport] = sport_games
+        seq = feed.publish(sport, sport_games)
+        print(f"{sport} seq {seq}: {game['away_team']} {game['away_score']} - {game['home_team']} {game['home_score']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--step", type=float, default=5, help="seconds between synthetic score changes")
+    parser.add_argument("--drop-every", type=float, default=None, help="close each stream after this many seconds")
+    parser.add_argument("--gap-every", type=int, default=0, help="skip every Nth delta to force a resync")
+    args = parser.parse_args()
+
+    feed = EventFeed()
+    stop = threading.Event()
+    threading.Thread(target=run_synthetic, args=(feed, args.step, stop), daemon=True).start()
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(feed, args.drop_every, args.gap_every))
+    server.daemon_threads = True
+    print(f"Relay streaming on {args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
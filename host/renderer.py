@@ -0,0 +1,70 @@
+"""
+Host-side scoreboard renderer: runs the board's own DisplayManager /
+GameDisplayBuilder layout in the headless displayio emulator and encodes each
+game as a palette + run-length image (render_frame.py) for RENDER_MODE = "host" boards.
+
+    python -m host.renderer --demo     # print one rendered game as text
+"""
+import argparse
+from host import emulator
+
+emulator.install()
+
+import render_frame  # noqa: E402  (needs the emulated displayio)
+from config import DISPLAY_WIDTH, DISPLAY_HEIGHT  # noqa: E402
+from display_manager import DisplayManager  # noqa: E402
+
+
+class _NoAPI:
+    """DisplayManager never fetches here; games are handed to render()."""
+
+
+class FrameRenderer:
+    """Renders processed games to pixels and encoded images with the board's layout code."""
+
+    def __init__(self, width=DISPLAY_WIDTH, height=DISPLAY_HEIGHT):
+        self.display = emulator.FramebufferDisplay(width, height)
+        self.manager = DisplayManager(self.display, _NoAPI())
+
+    def pixels(self, game):
+        """Row-major 0xRRGGBB pixels of game's scoreboard."""
+        self.manager.current_sport = game.get("sport", "SPORTS")
+        self.manager._render_game(game)
+        return self.display.framebuffer()
+
+    def image(self, game):
+        return render_frame.encode_image(self.pixels(game), self.display.width, self.display.height)
+
+    def bundle(self, sport, games):
+        """Image bundle for all of sport's games."""
+        return render_frame.encode_bundle(sport, [(game, self.image(game)) for game in games])
+
+
+def to_text(pixels, width=DISPLAY_WIDTH):
+    """ASCII view of a frame: '#' white, '+' any other lit pixel, '.' off."""
+    rows = []
+    for y in range(len(pixels) // width):
+        row = pixels[y * width:(y + 1) * width]
+        rows.append("".join("#" if p == 0xFFFFFF else ("+" if p else ".") for p in row))
+    return "\n".join(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--demo", action="store_true", help="render a sample MLB game")
+    args = parser.parse_args()
+    if args.demo:
+        game = {
+            "sport": "MLB", "home_team": "NYY", "away_team": "BOS", "home_score": 3, "away_score": 2,
+            "status": "In Progress", "period": "T7", "clock": "", "stoppage": False, "date": "",
+            "venue": "", "home_record": "", "away_record": "", "last_play": "", "down_distance": "",
+            "possession": "", "count": {"balls": 3, "strikes": 2, "outs": 1}, "bases": {"first": True},
+        }
+        renderer = FrameRenderer()
+        image = renderer.image(game)
+        print(to_text(renderer.pixels(game)))
+        print(f"{len(image)} bytes encoded ({DISPLAY_WIDTH * DISPLAY_HEIGHT * 3} raw)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+"""
+Time-accelerated replay of a captured day through the unchanged main.py: the
+headless emulator stands in for the hardware, API_BACKEND = "replay" answers
+from the capture (capture.py), and a virtual clock replaces time.time,
+time.monotonic, time.sleep and asyncio.sleep (the RTC and get_rtc_now follow
+time.time in the emulator). Every sleep advances the clock instantly, so a
+day runs in minutes; the run stops when the clock passes the last record.
+
+    python -m host.replay capture.jsonl                     # a file recorded with API_CAPTURE
+    python -m host.replay --synthetic day.jsonl --hours 24  # write a synthetic day, then replay it
+
+The report covers refreshes per sport, display cycles and renders, score events
+and time to display: captured data to pixels for score events (event_latency_s)
+and how long after capture each response was first polled (replay.fetch_lag_s).
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import runpy
+import sys
+import time
+from host import emulator
+
+MONOTONIC_START = 1000.0  # virtual time.monotonic() at the start of a run
+LEAD_SECONDS = 60  # start this long before the first record
+TAIL_SECONDS = 600  # keep running this long after the last record
+PROGRESS_EVERY = 3600  # virtual seconds between progress lines
+
+
+class ReplayFinished(BaseException):
+    """Raised from a sleep once the virtual clock passes the end; main.py only catches Exception."""
+
+
+class VirtualClock:
+    """Epoch and monotonic time that move only when something sleeps."""
+
+    def __init__(self, epoch, stop_at=None, progress=None, every=PROGRESS_EVERY):
+        self.start = float(epoch)
+        self.epoch = float(epoch)
+        self.stop_at = stop_at
+        self.progress = progress
+        self.every = every
+        self._next_progress = self.epoch + every
+        self._saved = None
+
+    def time(self):
+        return self.epoch
+
+    def monotonic(self):
+        return MONOTONIC_START + self.epoch - self.start
+
+    def advance(self, seconds):
+        self.epoch += max(0.0, float(seconds))
+        if self.progress is not None and self.epoch >= self._next_progress:
+            self._next_progress += self.every
+            self.progress(self)
+        if self.stop_at is not None and self.epoch >= self.stop_at:
+            raise ReplayFinished()
+
+    def sleep(self, seconds):
+        self.advance(seconds)
+
+    def install(self):
+        """Patch the time and asyncio functions the board code calls."""
+        self._saved = (time.time, time.monotonic, time.sleep, asyncio.sleep)
+        real_sleep = asyncio.sleep
+
+        async def virtual_sleep(delay, result=None):
+            self.advance(delay)
+            await real_sleep(0)  # still yield, so other tasks (background fetches) run
+            return result
+
+        time.time = self.time
+        time.monotonic = self.monotonic
+        time.sleep = self.sleep
+        asyncio.sleep = virtual_sleep
+
+    def uninstall(self):
+        if self._saved is not None:
+            time.time, time.monotonic, time.sleep, asyncio.sleep = self._saved
+            self._saved = None
+
+
+def synthetic_day(path, hours=24, games_per_sport=6, seed=0, start=None):
+    """
+    Write a capture of hours of games: each day, each sport's games_per_sport games
+    start through the day, run three hours with scores climbing, then go final.
+    A record per sport every REFRESH_INTERVAL_LIVE seconds while something is live,
+    else every five minutes.
+    """
+    from config import REFRESH_INTERVAL_LIVE
+    from host.slates import raw_game
+    import score_frame
+
+    rng = random.Random(seed)
+    start = time.time() if start is None else start
+    end = start + hours * 3600
+    length = 3 * 3600
+    days = max(1, int(-(-hours // 24)))
+    span = max(0, min(hours, 24) * 3600 - length - 3600)
+    entries = []  # {"sport", "kickoff", "game", "score"}
+    for sport in score_frame.SPORTS:
+        for i in range(games_per_sport * days):
+            day, slot = divmod(i, games_per_sport)
+            kickoff = start + day * 86400 + 1800 + span * slot / max(1, games_per_sport - 1)
+            game = raw_game(sport, "Scheduled", rng, kickoff)
+            game["date"] = time.strftime("%Y-%m-%dT%H:%M", time.localtime(kickoff))
+            entries.append({"sport": sport, "kickoff": kickoff, "game": game, "score": [0, 0]})
+
+    records = 0
+    t = start
+    with open(path, "w") as f:
+        while t <= end:
+            live = False
+            for sport in score_frame.SPORTS:
+                raw = []
+                for entry in entries:
+                    if entry["sport"] != sport:
+                        continue
+                    game = dict(entry["game"])
+                    progress = (t - entry["kickoff"]) / length
+                    if progress < 0:
+                        game["status"] = "Scheduled"
+                    elif progress < 1:
+                        live = True
+                        game["status"] = "In Progress"
+                        if rng.random() < 0.08:
+                            entry["score"][rng.randrange(2)] += 1 if sport in ("NHL", "MLB") else rng.choice((2, 3, 7))
+                        if sport == "MLB":
+                            game["inning"] = str(1 + int(progress * 9))
+                        elif sport == "NHL":
+                            game["game_period"] = str(1 + int(progress * 3))
+                            game["time_remaining"] = f"{19 - int(progress * 60) % 20}:00"
+                        else:
+                            game["quarter"] = str(1 + int(progress * 4))
+                            game["time_remaining"] = f"{14 - int(progress * 60) % 15}:00"
+                    else:
+                        game["status"] = "Final"
+                    game["away_score"], game["home_score"] = entry["score"]
+                    raw.append(game)
+                f.write(json.dumps({"t": int(t), "sport": sport, "data": {"games": raw}}))
+                f.write("\n")
+                records += 1
+            t += REFRESH_INTERVAL_LIVE if live else 300
+    return records
+
+
+def _summary(metrics, clock, wall, replay):
+    counters = metrics["counters"]
+    timings = metrics["timings"]
+    hours = (clock.epoch - clock.start) / 3600
+    lines = [f"Replayed {hours:.1f}h ({replay.count()} records: {', '.join(replay.sports)}) "
+             f"in {wall:.1f}s wall ({(clock.epoch - clock.start) / max(wall, 1e-9):.0f}x)"]
+    refreshes = {k.rsplit(".", 1)[1]: v for k, v in counters.items() if k.startswith("replay.requests.")}
+    lines.append("Refreshes: " + ", ".join(f"{sport} {n}" for sport, n in sorted(refreshes.items())))
+    lines.append(f"Display cycles: {counters.get('display.cycles', 0)}, scoreboard renders: "
+                 f"{counters.get('display.renders', 0)}")
+    events = {k.split(".", 1)[1]: v for k, v in counters.items() if k.startswith("events.")}
+    lines.append("Score events: " + (", ".join(f"{kind} {n}" for kind, n in sorted(events.items())) or "none"))
+    for name, label, unit in (
+        ("event_latency_s", "Captured data -> pixels (score events)", "s"),
+        ("replay.fetch_lag_s", "Capture -> first poll", "s"),
+        ("event_fetch_to_pixels_ms", "Fetch -> pixels (score events)", "ms"),
+        ("fetch.refresh_s", "Refresh duration", "s"),
+    ):
+        t = timings.get(name)
+        if t and t["count"]:
+            lines.append(f"{label}: mean {t['mean']:.2f}{unit}, max {t['max']:.2f}{unit} (n={t['count']})")
+    return lines
+
+
+def configure(path):
+    """Point the board settings at the replay; must run before config is first imported."""
+    if "config" in sys.modules:
+        raise RuntimeError("configure() must run before config is imported")
+    os.environ["API_BACKEND"] = "replay"
+    os.environ["REPLAY_FILE"] = path
+    os.environ.pop("API_CAPTURE", None)
+    os.environ.pop("FANOUT_PUBLISH", None)
+    os.environ.pop("RENDER_MODE", None)
+    os.environ.setdefault("API_KEY", "replay")
+    emulator.install()
+
+
+def run(path, verbose=False, json_path=None, progress=None, every=PROGRESS_EVERY):
+    """
+    Replay path through main.py on a virtual clock (after configure). Returns the METRICS snapshot.
+    progress(clock) is called every `every` virtual seconds (default: a line on stderr).
+    """
+
+    from capture import CaptureReplay
+    from log import LOG
+    from metrics import METRICS
+
+    replay = CaptureReplay(path)
+    if replay.start is None:
+        raise SystemExit(f"{path}: no records to replay")
+
+    def report(clock):
+        sys.stderr.write(f"  {time.strftime('%Y-%m-%d %H:%M', time.localtime(clock.epoch))} "
+                         f"({METRICS.counters.get('display.cycles', 0)} display cycles)\n")
+
+    clock = VirtualClock(replay.start - LEAD_SECONDS, stop_at=replay.end + TAIL_SECONDS,
+                         progress=progress or report, every=every)
+    clock.install()
+    import boot
+    boot.sync_rtc = lambda on_progress=None: True  # the RTC already follows the virtual clock
+
+    stdout = sys.stdout
+    devnull = None if verbose else open(os.devnull, "w")
+    wall_started = time.perf_counter()
+    try:
+        if devnull is not None:
+            sys.stdout = devnull
+        runpy.run_path("main.py", run_name="__main__")
+    except ReplayFinished:
+        pass
+    finally:
+        LOG.flush()  # buffered lines belong with main.py's (possibly discarded) output
+        sys.stdout = stdout
+        if devnull is not None:
+            devnull.close()
+        clock.uninstall()
+    wall = time.perf_counter() - wall_started
+
+    metrics = METRICS.snapshot()
+    for line in _summary(metrics, clock, wall, replay):
+        print(line)
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump({"replayed_s": clock.epoch - clock.start, "wall_s": wall, "metrics": metrics}, f, indent=2)
+        print(f"Metrics written to {json_path}")
+    return metrics
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("capture", help="capture file (JSON lines from API_CAPTURE)")
+    parser.add_argument("--synthetic", action="store_true", help="write a synthetic day to the capture path first")
+    parser.add_argument("--hours", type=float, default=24, help="length of the synthetic day")
+    parser.add_argument("--seed", type=int, default=0, help="synthetic day random seed")
+    parser.add_argument("--verbose", action="store_true", help="show main.py's serial output")
+    parser.add_argument("--json", help="also write the final metrics snapshot here")
+    args = parser.parse_args()
+    configure(args.capture)
+    if args.synthetic:
+        records = synthetic_day(args.capture, args.hours, seed=args.seed)
+        print(f"Wrote {records} synthetic records to {args.capture}")
+    run(args.capture, verbose=args.verbose, json_path=args.json)
+
+
+if __name__ == "__main__":
+    main()
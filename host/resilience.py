@@ -0,0 +1,358 @@
+"""
+Resilience checks: the board's real fetch and clock code (SportsAPI.get_games,
+boot.sync_rtc) in the headless emulator, against host/mockapi.py answering with
+scripted faults. Each scenario asserts what the display loop relies on: a call
+returns within its time budget, serves cached games when the API fails, opens
+and recovers the circuit breaker, records the right failure cause, and a failed
+refresh leaves the display's stored games (and their age) alone.
+
+    python -m host.resilience               # every scenario; exit 1 on any failure
+    python -m host.resilience -k time       # only scenarios whose name contains "time"
+    python -m host.resilience --verbose     # with the client's serial output
+
+Fetches run under the per-sport share of FETCH_DEADLINE, as in a refresh. Real
+time passes (the retry backoff sleeps), so a full run takes about a minute.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from host import emulator
+from host.mockapi import FaultScript, MockAPI
+
+SLACK = 1.5  # seconds allowed past a budget for connection setup and scheduling
+BACKOFF = (2, 4)  # get_games' sleeps between its three attempts
+TIME_SYNC_TIMEOUT = 3  # boot.TIME_SYNC_TIMEOUT for these runs, so hangs cost seconds, not minutes
+
+
+class Harness:
+    """The mock server plus helpers for driving the client and recording failed checks."""
+
+    def __init__(self, mock):
+        self.mock = mock
+        self.failures = []
+        from config import FETCH_DEADLINE
+        import score_frame
+        self.share = FETCH_DEADLINE / len(score_frame.SPORTS)
+
+    def expect(self, ok, message):
+        if not ok:
+            self.failures.append(message)
+        return ok
+
+    def script(self, route, spec):
+        self.mock.script.set(route, spec)
+
+    def hits(self, route="nfl"):
+        return self.mock.script.status()["hits"].get(route, 0)
+
+    def api(self):
+        from api import SportsAPI
+        api = SportsAPI("resilience", backend="json")
+        api.base_url = f"{self.mock.url}/api"
+        return api
+
+    def fetch(self, api, sport="NFL", budget=None):
+        """(games, seconds) for one get_games call under budget (default: a sport's refresh share)."""
+        from deadline import Deadline
+        budget = self.share if budget is None else budget
+        started = time.monotonic()
+        games = asyncio.run(api.get_games(sport, deadline=Deadline(budget)))
+        elapsed = time.monotonic() - started
+        self.expect(elapsed <= budget + SLACK, f"{sport} fetch took {elapsed:.1f}s, budget {budget:.0f}s")
+        return games, elapsed
+
+    def primed(self):
+        """A client with NFL games cached from one good fetch."""
+        api = self.api()
+        games, _ = self.fetch(api)
+        self.expect(bool(games), "priming fetch returned no games")
+        return api, games
+
+    def cause(self, api, sport="NFL"):
+        return api.breaker_states().get(sport, {}).get("last_cause")
+
+    def sync_rtc(self, sources=2):
+        """(synced, seconds) for boot.sync_rtc against the mock's time endpoints."""
+        import boot
+        boot.TIME_URLS = [
+            (f"{self.mock.url}/api/Time/current/zone?timeZone=UTC", "dateTime"),
+            (f"{self.mock.url}/developer/api/ip", "datetime"),
+        ][:sources]
+        started = time.monotonic()
+        synced = boot.sync_rtc()
+        return synced, time.monotonic() - started
+
+
+def healthy(h):
+    h.script("nfl", "ok")
+    games, elapsed = h.fetch(h.api())
+    h.expect(bool(games), "no games from a healthy API")
+    h.expect(h.hits() == 1, f"{h.hits()} requests for one healthy fetch")
+    h.expect(elapsed < SLACK, f"healthy fetch took {elapsed:.1f}s")
+
+
+def latency(h):
+    h.script("nfl", "latency:2")
+    games, elapsed = h.fetch(h.api())
+    h.expect(bool(games), "no games from a slow API")
+    h.expect(elapsed >= 2, f"answer came back after {elapsed:.1f}s, before the scripted 2s latency")
+
+
+def transient_5xx(h):
+    from circuit_breaker import CLOSED
+    h.script("nfl", "503,502,ok")
+    api = h.api()
+    games, elapsed = h.fetch(api)
+    h.expect(bool(games), "no games after two 5xx answers and a good one")
+    h.expect(h.hits() == 3, f"{h.hits()} requests, expected 3")
+    h.expect(elapsed >= sum(BACKOFF), f"retries took {elapsed:.1f}s; backoff should take {sum(BACKOFF)}s")
+    h.expect(api._breaker("NFL").state == CLOSED, "breaker not closed after recovery")
+
+
+def outage_breaker(h):
+    from circuit_breaker import OPEN, CLOSED
+    api, cached = h.primed()
+    h.script("nfl", "500x3")
+    games, _ = h.fetch(api)
+    h.expect(games == cached, "cached games not served during an outage")
+    breaker = api._breaker("NFL")
+    h.expect(breaker.state == OPEN, f"breaker {breaker.state} after three 500s, expected open")
+    h.expect(h.cause(api) == "http_500", f"cause {h.cause(api)}, expected http_500")
+
+    hits = h.hits()
+    games, elapsed = h.fetch(api)
+    h.expect(games == cached and h.hits() == hits, "open breaker still sent a request")
+    h.expect(elapsed < 0.1, f"short-circuited call took {elapsed:.2f}s")
+
+    breaker.opened_at -= breaker.cooldown  # as if the cooldown had passed
+    h.script("nfl", "ok")
+    games, _ = h.fetch(api)
+    h.expect(bool(games) and h.hits() == hits + 1, "half-open probe didn't fetch")
+    h.expect(breaker.state == CLOSED, f"breaker {breaker.state} after a good probe, expected closed")
+
+
+def client_error(h):
+    h.script("nfl", "404x3")
+    api = h.api()
+    games, elapsed = h.fetch(api)
+    h.expect(games == [], "games from a 404 with nothing cached")
+    h.expect(h.hits() == 1, f"404 retried ({h.hits()} requests)")
+    h.expect(h.cause(api) == "http_404", f"cause {h.cause(api)}, expected http_404")
+
+
+def rate_limited(h):
+    h.script("nfl", "429,ok")
+    games, _ = h.fetch(h.api())
+    h.expect(bool(games) and h.hits() == 2, "429 not retried")
+
+
+def hang(h):
+    api, cached = h.primed()
+    h.script("nfl", "hang:60x3")
+    games, _ = h.fetch(api)
+    h.expect(games == cached, "cached games not served when the API hangs")
+    h.expect(h.cause(api) == "timeout", f"cause {h.cause(api)}, expected timeout")
+
+
+def slow_drip(h):
+    api, cached = h.primed()
+    h.script("nfl", "drip:20x3")
+    games, _ = h.fetch(api)
+    h.expect(games == cached, "cached games not served for a dripping body")
+    h.expect(h.cause(api) == "timeout", f"cause {h.cause(api)}, expected timeout")
+
+
+def truncated(h):
+    api, cached = h.primed()
+    h.script("nfl", "truncate,ok")
+    games, _ = h.fetch(api)
+    h.expect(bool(games) and h.hits() == 3, "no recovery after a truncated body")
+    h.expect(api._accept_encoding is None, "compression still requested after a broken gzip body")
+
+
+def html_page(h):
+    api = h.api()
+    h.script("nfl", "htmlx3")
+    games, _ = h.fetch(api)
+    h.expect(games == [], "games from an HTML error page")
+    h.expect(h.cause(api) == "parse", f"cause {h.cause(api)}, expected parse")
+
+
+def oversize(h):
+    from api import MAX_BODY_BYTES
+    api, cached = h.primed()
+    hits = h.hits()
+    h.script("nfl", f"oversize:{MAX_BODY_BYTES * 4}")
+    games, elapsed = h.fetch(api)
+    h.expect(games == cached, "cached games not served for an oversize body")
+    h.expect(h.cause(api) == "too_large", f"cause {h.cause(api)}, expected too_large")
+    h.expect(h.hits() == hits + 1, "oversize body retried")
+
+
+def reset(h):
+    api = h.api()
+    h.script("nfl", "reset,ok")
+    games, _ = h.fetch(api)
+    h.expect(bool(games) and h.hits() == 2, "no recovery after a dropped connection")
+
+
+def refresh_outage(h):
+    """A refresh whose fetch fails keeps the stored games and their age, so staleness shows."""
+    from display_manager import DisplayManager
+    h.script("nfl", "ok")
+    manager = DisplayManager(emulator.FramebufferDisplay(64, 32), h.api())
+    manager.current_sport = "NFL"
+    asyncio.run(manager.update_games())
+    stored = manager.games
+    if not h.expect(bool(stored), "no games stored from a healthy refresh"):
+        return
+    h.script("nfl", "503x3")
+    started = time.monotonic()
+    asyncio.run(manager.update_games())
+    elapsed = time.monotonic() - started
+    h.expect(manager.games == stored, f"{len(stored)} stored games became {len(manager.games)} after a failed refresh")
+    age = manager.store.age("NFL")
+    h.expect(age is not None and age >= elapsed, f"stored games aged {age}s after a {elapsed:.1f}s failed refresh")
+    h.expect(manager.store.is_stale("NFL", elapsed / 2), "failed refresh left the games looking fresh")
+
+
+def time_sync(h):
+    import rtc
+    h.script("time", "ok")
+    synced, elapsed = h.sync_rtc()
+    h.expect(synced, "clock sync failed against a healthy time API")
+    offset = time.mktime(rtc.RTC().datetime) - h.mock.clock
+    h.expect(abs(offset) <= 2, f"RTC {offset:+.0f}s from the served time")
+    h.expect(elapsed < SLACK, f"healthy clock sync took {elapsed:.1f}s")
+
+
+def time_fallback(h):
+    import boot
+    h.script("time", "503x2,ok")
+    synced, elapsed = h.sync_rtc()
+    h.expect(synced and h.hits("time") == 3, "no fallback to the second time source")
+    ceiling = 2 * boot.TIME_SYNC_DELAY + SLACK
+    h.expect(elapsed <= ceiling, f"fallback took {elapsed:.1f}s, ceiling {ceiling:.0f}s")
+
+
+def time_stalls(h):
+    """A hang and a dripping body each cost at most one TIME_SYNC_TIMEOUT."""
+    import boot
+    h.script("time", "hang:60,drip:5,ok")
+    synced, elapsed = h.sync_rtc()
+    h.expect(synced, "clock sync didn't recover after a hang and a drip")
+    ceiling = 2 * (boot.TIME_SYNC_TIMEOUT + boot.TIME_SYNC_DELAY) + SLACK
+    h.expect(elapsed <= ceiling, f"clock sync took {elapsed:.1f}s, ceiling {ceiling:.0f}s")
+
+
+def time_down(h):
+    import boot
+    h.script("time", "500x2,htmlx2")
+    synced, elapsed = h.sync_rtc()
+    h.expect(not synced, "clock sync claimed success with every source failing")
+    ceiling = 4 * boot.TIME_SYNC_DELAY + SLACK
+    h.expect(elapsed <= ceiling, f"failed clock sync took {elapsed:.1f}s, ceiling {ceiling:.0f}s")
+
+
+def time_oversize(h):
+    h.script("time", "oversize:100000,ok")
+    synced, _ = h.sync_rtc()
+    h.expect(synced and h.hits("time") == 2, "clock sync didn't recover after an oversize answer")
+
+
+SCENARIOS = [
+    ("healthy", healthy),
+    ("latency", latency),
+    ("transient-5xx", transient_5xx),
+    ("outage-breaker", outage_breaker),
+    ("client-error", client_error),
+    ("rate-limited", rate_limited),
+    ("hang", hang),
+    ("slow-drip", slow_drip),
+    ("truncated", truncated),
+    ("html-page", html_page),
+    ("oversize", oversize),
+    ("reset", reset),
+    ("refresh-outage", refresh_outage),
+    ("time-sync", time_sync),
+    ("time-fallback", time_fallback),
+    ("time-stalls", time_stalls),
+    ("time-down", time_down),
+    ("time-oversize", time_oversize),
+]
+
+
+def configure(mock):
+    """Board settings for the runs; must happen before config is first imported."""
+    if "config" in sys.modules:
+        raise RuntimeError("configure() must run before config is imported")
+    os.environ["API_BACKEND"] = "json"
+    os.environ["API_URL"] = f"{mock.url}/api"
+    os.environ.setdefault("API_KEY", "resilience")
+    for key in ("API_CAPTURE", "FANOUT_PUBLISH", "RENDER_MODE", "TIMEZONE"):
+        os.environ.pop(key, None)
+    emulator.install()
+    import boot
+    boot.TIME_SYNC_TIMEOUT = TIME_SYNC_TIMEOUT
+
+
+def run(pattern="", verbose=False):
+    """Run matching scenarios against a fresh mock server. Returns the number that failed."""
+    mock = MockAPI(script=FaultScript(), clock=int(time.time())).start()
+    configure(mock)
+    from log import LOG
+    failed = 0
+    stdout = sys.stdout
+    devnull = None if verbose else open(os.devnull, "w")
+    try:
+        for name, scenario in SCENARIOS:
+            if pattern and pattern not in name:
+                continue
+            mock.script.reset()
+            harness = Harness(mock)
+            started = time.monotonic()
+            try:
+                if devnull is not None:
+                    sys.stdout = devnull
+                scenario(harness)
+            except Exception as e:
+                harness.failures.append(f"raised {type(e).__name__}: {e}")
+            finally:
+                LOG.flush()
+                sys.stdout = stdout
+            elapsed = time.monotonic() - started
+            if harness.failures:
+                failed += 1
+                print(f"FAIL {name} ({elapsed:.1f}s)")
+                for message in harness.failures:
+                    print(f"     {message}")
+            else:
+                print(f"ok   {name} ({elapsed:.1f}s)")
+    finally:
+        sys.stdout = stdout
+        if devnull is not None:
+            devnull.close()
+        mock.stop()
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", dest="pattern", default="", help="only scenarios whose name contains this")
+    parser.add_argument("--verbose", action="store_true", help="show the client's serial output")
+    parser.add_argument("--list", action="store_true", help="list scenario names and exit")
+    args = parser.parse_args()
+    if args.list:
+        for name, _ in SCENARIOS:
+            print(name)
+        return
+    failed = run(args.pattern, args.verbose)
+    print(f"{failed} scenario(s) failed" if failed else "All scenarios passed")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
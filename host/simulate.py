@@ -0,0 +1,113 @@
+"""
+Run the board's main.py on a computer: the headless emulator (host/emulator)
+stands in for the matrix, buttons, RTC and WiFi, and the computer's network
+carries the real API traffic. settings.toml is loaded into the environment the
+way CircuitPython exposes it to os.getenv (variables already set win).
+
+    python -m host.simulate --show            # print each new frame as text
+    python -m host.simulate --seconds 60      # stop after a minute
+
+With --keys, typing u or d (then Enter) presses BUTTON_UP / BUTTON_DOWN.
+"""
+import argparse
+import _thread
+import os
+import runpy
+import sys
+import threading
+import time
+from host import emulator
+
+PRESS_SECONDS = 0.25  # longer than the main loop's 0.1s sleep, so a press is always seen
+
+
+def load_settings(path="settings.toml"):
+    """Copy settings.toml's top-level values into os.environ. Returns the number loaded."""
+    try:
+        import tomllib
+    except ImportError:
+        print("settings.toml not loaded (needs Python 3.11+); export the values instead")
+        return 0
+    try:
+        with open(path, "rb") as f:
+            settings = tomllib.load(f)
+    except OSError:
+        return 0
+    loaded = 0
+    for key, value in settings.items():
+        if isinstance(value, dict) or key in os.environ:
+            continue
+        os.environ[key] = str(value).lower() if isinstance(value, bool) else str(value)
+        loaded += 1
+    return loaded
+
+
+def press(pin):
+    """Hold a button down long enough for one debounced press."""
+    pin.level = False
+    time.sleep(PRESS_SECONDS)
+    pin.level = True
+
+
+def _watch(interval):
+    from adafruit_matrixportal import matrix
+    from host.renderer import to_text
+    shown = None
+    while True:
+        time.sleep(interval)
+        display = matrix.current
+        if display is None:
+            continue
+        try:
+            pixels = display.framebuffer()
+        except Exception as e:  # the main loop may be mid-way through rebuilding the scene
+            print(f"Frame skipped: {e}")
+            continue
+        if pixels != shown:
+            shown = pixels
+            print(to_text(pixels, display.width))
+            print()
+
+
+def _keys():
+    import board
+    pins = {"u": board.BUTTON_UP, "d": board.BUTTON_DOWN}
+    for line in sys.stdin:
+        pin = pins.get(line.strip().lower()[:1])
+        if pin is not None:
+            press(pin)
+
+
+def _stop_after(seconds):
+    time.sleep(seconds)
+    _thread.interrupt_main()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--show", action="store_true", help="print the matrix as text whenever it changes")
+    parser.add_argument("--interval", type=float, default=0.5, help="seconds between --show checks")
+    parser.add_argument("--keys", action="store_true", help="read u/d button presses from stdin")
+    parser.add_argument("--seconds", type=float, default=0, help="stop after this long (0 = run until Ctrl-C)")
+    parser.add_argument("--settings", default="settings.toml", help="settings file to load into the environment")
+    args = parser.parse_args()
+
+    print(f"Loaded {load_settings(args.settings)} settings from {args.settings}")
+    emulator.install()
+    threads = []
+    if args.show:
+        threads.append((_watch, (args.interval,)))
+    if args.keys:
+        threads.append((_keys, ()))
+    if args.seconds > 0:
+        threads.append((_stop_after, (args.seconds,)))
+    for target, target_args in threads:
+        threading.Thread(target=target, args=target_args, daemon=True).start()
+    try:
+        runpy.run_path("main.py", run_name="__main__")
+    except KeyboardInterrupt:
+        print("Stopped")
+
+
+if __name__ == "__main__":
+    main()
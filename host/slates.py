@@ -0,0 +1,79 @@
+"""
+Synthetic game slates in the sports API's raw JSON shape (what process_games
+takes), for host-side benchmarks and test servers. Games are spread over all
+four sports and every raw status the processor handles, with dates placed so
+the time-window filter keeps them all.
+"""
+import random
+import time
+import score_frame
+
+TEAMS = {
+    "NFL": ["BUF", "MIA", "NE", "NYJ", "BAL", "CIN", "CLE", "PIT", "DAL", "NYG", "PHI", "WAS", "GB", "KC", "SF", "SEA"],
+    "NBA": ["BOS", "BKN", "NYK", "PHI", "TOR", "CHI", "CLE", "MIL", "DEN", "GSW", "LAL", "LAC", "PHX", "DAL", "MIA", "OKC"],
+    "NHL": ["BOS", "BUF", "DET", "FLA", "MTL", "TOR", "NYR", "PIT", "EDM", "VAN", "COL", "DAL", "VGK", "CHI", "SJ", "LA"],
+    "MLB": ["NYY", "BOS", "TOR", "BAL", "TB", "HOU", "TEX", "SEA", "ATL", "NYM", "PHI", "LAD", "SD", "SF", "CHC", "STL"],
+}
+# Raw API statuses, covering every branch of normalize_and_infer_status ("" is inferred from the data)
+RAW_STATUSES = [
+    "Scheduled", "Pre-Game", "In Progress", "Halftime", "End of Period", "Final",
+    "Postponed", "Suspended", "Cancelled", "Rain Delay", "Forfeit", "",
+]
+PRE_GAME = ("Scheduled", "Pre-Game", "Postponed", "Cancelled")
+HOUR = 60 * 60
+
+
+def _date(epoch):
+    t = time.localtime(epoch)
+    return f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}T{t.tm_hour:02d}:{t.tm_min:02d}"
+
+
+def raw_game(sport, status, rng, now=None):
+    """One raw API game dict for sport with the given raw status."""
+    now = time.time() if now is None else now
+    away, home = rng.sample(TEAMS[sport], 2)
+    started = status not in PRE_GAME
+    if status == "Final":
+        start = now - 3 * HOUR
+    elif started:
+        start = now - HOUR
+    else:
+        start = now + rng.randint(1, 30) * HOUR
+    game = {
+        "status": status,
+        "home_abbreviation": home,
+        "away_abbreviation": away,
+        "home_score": rng.randint(0, 40) if started else 0,
+        "away_score": rng.randint(0, 40) if started else 0,
+        "date": _date(start),
+        "venue": f"{home} Stadium",
+        "home_record": f"{rng.randint(0, 60)}-{rng.randint(0, 60)}",
+        "away_record": f"{rng.randint(0, 60)}-{rng.randint(0, 60)}",
+    }
+    if sport == "MLB":
+        game["inning"] = str(rng.randint(1, 9))
+        game["inning_half"] = rng.choice(("top", "bottom"))
+        game["count"] = {"balls": rng.randint(0, 3), "strikes": rng.randint(0, 2), "outs": rng.randint(0, 2)}
+        game["bases"] = {"first": rng.random() < 0.5, "second": rng.random() < 0.3, "third": rng.random() < 0.2}
+        game["last_play"] = "Single to left"
+    elif sport == "NHL":
+        game["game_period"] = str(rng.randint(1, 3))
+        game["time_remaining"] = f"{rng.randint(0, 19)}:{rng.randint(0, 59):02d}"
+    else:
+        game["quarter"] = str(rng.randint(1, 4))
+        game["time_remaining"] = f"{rng.randint(0, 14)}:{rng.randint(0, 59):02d}"
+        if sport == "NFL":
+            game["down_distance"] = f"{rng.randint(1, 4)}&{rng.randint(1, 10)}"
+            game["possession"] = rng.choice((home, away))
+    return game
+
+
+def raw_slate(count, seed=0, now=None):
+    """{sport: [raw game]} with count games in total, round-robin over sports and statuses."""
+    rng = random.Random(seed)
+    slate = {sport: [] for sport in score_frame.SPORTS}
+    for i in range(count):
+        sport = score_frame.SPORTS[i % len(score_frame.SPORTS)]
+        status = RAW_STATUSES[(i // len(score_frame.SPORTS)) % len(RAW_STATUSES)]
+        slate[sport].append(raw_game(sport, status, rng, now))
+    return slate
@@ -0,0 +1,250 @@
+"""
+Soak test: the unchanged main.py (fetch -> process_games -> layout -> render,
+on the emulator) over a synthetic multi-day slate on the replay virtual clock
+(host/replay.py), sampling tracemalloc as it goes. Reports:
+
+  - traced heap after a collection, sampled every --sample-every virtual seconds,
+    with heap.GrowthTracker flagging steady growth over a day's worth of samples
+    (so a slate's daily rise and fall isn't mistaken for a leak; the board's
+    HEAP_SAMPLE_INTERVAL uses the same tracker on gc.mem_alloc)
+  - the lines in board modules whose retained memory grew most between the first
+    and last sample (what a leak looks like)
+  - bytes allocated per display cycle by each function in display_manager,
+    display_utils, game_display_builder and games_processor (inclusive of what they
+    call; tracemalloc high-water over each call, as in host/bench.py)
+
+    python -m host.soak --days 3 --games 15      # three 15-game-per-sport days
+    python -m host.soak --days 7 --json soak.json
+
+Tracing starts at the first sample, after the replay capture is loaded, so only
+what the loop allocates is counted. Expect roughly 10 minutes per simulated day.
+Exits 1 when growth is flagged. CPython's heap isn't the board's: compare
+trends and call sites, not byte counts; on the device read HEAP_SAMPLE_INTERVAL
+output for gc.mem_free, gc.mem_alloc and the largest free block.
+"""
+import argparse
+import gc
+import inspect
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from host import replay
+
+SITE_MODULES = ("display_manager", "display_utils", "game_display_builder", "games_processor")
+DEFAULT_SAMPLE_EVERY = 1800  # virtual seconds between heap samples
+WARMUP_SAMPLES = 2  # samples skipped before growth tracking (caches, glyph tables, first slates)
+TOP = 12
+TRACE_FRAMES = 1
+
+
+class SiteProfiler:
+    """Wraps functions to accumulate calls and tracemalloc high-water bytes per call site."""
+
+    def __init__(self):
+        self.sites = {}  # "module.func" -> [calls, bytes]
+        self._stack = []  # [traced bytes at entry, highest peak seen inside] per active call
+        self._patched = []
+
+    def _wrap(self, name, fn):
+        sites = self.sites
+        stack = self._stack
+
+        def wrapper(*args, **kwargs):
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1][1] = max(stack[-1][1], peak)
+            frame = [current, current]
+            stack.append(frame)
+            tracemalloc.reset_peak()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                stack.pop()
+                high = max(tracemalloc.get_traced_memory()[1], frame[1])
+                if stack:
+                    stack[-1][1] = max(stack[-1][1], high)
+                site = sites.get(name)
+                if site is None:
+                    site = sites[name] = [0, 0]
+                site[0] += 1
+                site[1] += high - frame[0]
+        wrapper.__wrapped__ = fn
+        return wrapper
+
+    def install(self, module_names=SITE_MODULES):
+        """Wrap every plain function and method defined in the modules (and re-point imports of them)."""
+        originals = {}
+        for module_name in module_names:
+            module = sys.modules[module_name]
+            for attr, value in list(vars(module).items()):
+                if inspect.isfunction(value) and value.__module__ == module_name:
+                    wrapped = self._wrap(f"{module_name}.{attr}", value)
+                    originals[value] = wrapped
+                    self._patch(module, attr, value, wrapped)
+                elif inspect.isclass(value) and value.__module__ == module_name:
+                    for name, member in list(vars(value).items()):
+                        if inspect.isfunction(member) and not inspect.iscoroutinefunction(member):
+                            self._patch(value, name, member, self._wrap(f"{module_name}.{attr}.{name}", member))
+        # `from display_utils import f` bound the originals elsewhere too
+        for module in list(sys.modules.values()):
+            if module is None or getattr(module, "__name__", "") in module_names:
+                continue
+            if not os.path.abspath(getattr(module, "__file__", None) or "/").startswith(_repo_root()):
+                continue
+            for attr, value in list(vars(module).items()):
+                if inspect.isfunction(value) and value in originals:
+                    self._patch(module, attr, value, originals[value])
+
+    def _patch(self, owner, attr, original, replacement):
+        setattr(owner, attr, replacement)
+        self._patched.append((owner, attr, original))
+
+    def uninstall(self):
+        for owner, attr, original in reversed(self._patched):
+            setattr(owner, attr, original)
+        self._patched = []
+
+    def top(self, cycles, count=TOP):
+        """[(site, calls per cycle, bytes per call, bytes per cycle)] by bytes per cycle."""
+        rows = []
+        for name, (calls, allocated) in self.sites.items():
+            rows.append((name, calls / max(1, cycles), allocated / max(1, calls), allocated / max(1, cycles)))
+        rows.sort(key=lambda r: r[3], reverse=True)
+        return rows[:count]
+
+
+def _repo_root():
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _board_file(filename):
+    """True for board modules (the repo, not host/ or the emulator)."""
+    root = _repo_root()
+    return filename.startswith(root) and not filename.startswith(os.path.join(root, "host"))
+
+
+def retained_growth(first, last, count=TOP):
+    """[(file:line, bytes, blocks)] of the largest retained growth in board modules between snapshots."""
+    rows = []
+    for stat in last.compare_to(first, "lineno"):
+        frame = stat.traceback[0]
+        if stat.size_diff > 0 and _board_file(frame.filename):
+            rows.append((f"{os.path.relpath(frame.filename, _repo_root())}:{frame.lineno}", stat.size_diff, stat.count_diff))
+    rows.sort(key=lambda r: r[1], reverse=True)
+    return rows[:count]
+
+
+def soak(path, sample_every=DEFAULT_SAMPLE_EVERY, verbose=False):
+    """Replay path under tracemalloc (after replay.configure). Returns the report dict."""
+    from heap import GrowthTracker
+    from metrics import METRICS
+    import display_manager  # noqa: F401  (load the profiled modules before main.py binds their names)
+    import game_display_builder  # noqa: F401
+
+    tracker = GrowthTracker(window=max(1, int(86400 / sample_every)))
+    samples = []
+    snapshots = []
+    flagged = []
+    profiler = SiteProfiler()
+    traced_from = {"cycles": 0}
+
+    def sample(clock):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACE_FRAMES)
+            profiler.install()
+            traced_from["cycles"] = METRICS.counters.get("display.cycles", 0)
+            return
+        gc.collect()
+        traced = tracemalloc.get_traced_memory()[0]
+        cycles = METRICS.counters.get("display.cycles", 0)
+        samples.append({"t": clock.epoch - clock.start, "traced": traced, "cycles": cycles})
+        if len(samples) <= WARMUP_SAMPLES:
+            if len(samples) == WARMUP_SAMPLES:
+                snapshots.append(tracemalloc.take_snapshot())
+            return
+        if tracker.add(traced):
+            flagged.append(clock.epoch - clock.start)
+        sys.stderr.write(f"  day {(clock.epoch - clock.start) / 86400:5.2f}: {traced / 1024:8.1f} KB traced, "
+                         f"{cycles} display cycles{'  GROWING' if tracker.growing() else ''}\n")
+
+    try:
+        metrics = replay.run(path, verbose=verbose, progress=sample, every=sample_every)
+        if snapshots:
+            snapshots.append(tracemalloc.take_snapshot())
+    finally:
+        profiler.uninstall()
+        tracemalloc.stop()
+
+    cycles = metrics["counters"].get("display.cycles", 0) - traced_from["cycles"]
+    tracked = [s["traced"] for s in samples[WARMUP_SAMPLES:]]
+    return {
+        "samples": samples,
+        "growth_flagged_at_s": flagged,
+        "traced_start": tracked[0] if tracked else None,
+        "traced_end": tracked[-1] if tracked else None,
+        "traced_peak": max(tracked) if tracked else None,
+        "retained_growth": retained_growth(*snapshots) if len(snapshots) == 2 else [],
+        "sites": profiler.top(cycles),
+        "display_cycles": cycles,
+    }
+
+
+def print_report(report):
+    start, end = report["traced_start"], report["traced_end"]
+    if start is not None:
+        print(f"Traced heap after warm-up: {start / 1024:.1f} KB -> {end / 1024:.1f} KB "
+              f"(peak {report['traced_peak'] / 1024:.1f} KB, {len(report['samples'])} samples)")
+    if report["growth_flagged_at_s"]:
+        print(f"STEADY GROWTH flagged in {len(report['growth_flagged_at_s'])} sample(s), "
+              f"first at day {report['growth_flagged_at_s'][0] / 86400:.2f}")
+    else:
+        print("No steady heap growth")
+    if report["retained_growth"]:
+        print("Retained growth by line (board modules, first -> last sample):")
+        for where, size, blocks in report["retained_growth"]:
+            print(f"  {size:>9} B {blocks:>6} blocks  {where}")
+    print(f"Allocation per display cycle ({report['display_cycles']} cycles, inclusive of callees):")
+    for name, calls, per_call, per_cycle in report["sites"]:
+        print(f"  {per_cycle:>9.0f} B/cycle {calls:>6.1f} calls/cycle {per_call:>8.0f} B/call  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=float, default=3, help="length of the synthetic slate")
+    parser.add_argument("--games", type=int, default=15, help="games per sport per day")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--capture", help="soak on this capture instead of a synthetic slate")
+    parser.add_argument("--sample-every", type=float, default=DEFAULT_SAMPLE_EVERY, help="virtual seconds between samples")
+    parser.add_argument("--verbose", action="store_true", help="show main.py's serial output")
+    parser.add_argument("--json", help="also write the report here")
+    args = parser.parse_args()
+
+    path = args.capture
+    if path is None:
+        handle, path = tempfile.mkstemp(prefix="soak-", suffix=".jsonl")
+        os.close(handle)
+    replay.configure(path)
+    try:
+        if args.capture is None:
+            records = replay.synthetic_day(path, args.days * 24, games_per_sport=args.games, seed=args.seed)
+            print(f"Synthetic slate: {args.days:g} days, {args.games} games per sport per day, {records} records")
+        started = time.perf_counter()
+        report = soak(path, args.sample_every, args.verbose)
+        print(f"Soak took {time.perf_counter() - started:.0f}s wall")
+    finally:
+        if args.capture is None:
+            os.remove(path)
+    print_report(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.json}")
+    if report["growth_flagged_at_s"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""
+Status endpoint checks: the board's StatusServer (status_server.py) on the
+emulator's socketpool, polled the way main.py's task polls it, answering for a
+real DisplayManager and SportsAPI primed from host/mockapi.py. Clients here
+misbehave on purpose (silent, dripping, oversize, resetting) and each scenario
+checks what the display loop relies on: every poll() returns at once, a stuck
+client is dropped after the budget, and the next one is still served.
+
+    python -m host.status_check              # every scenario; exit 1 on any failure
+    python -m host.status_check -k slow      # only scenarios whose name contains "slow"
+    python -m host.status_check --serve 8080 # keep serving a primed board: curl localhost:8080/status
+
+Standard library only.
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from host import emulator
+from host.mockapi import FaultScript, MockAPI
+
+BUDGET_MS = 500  # STATUS_BUDGET_MS for these runs, so stuck clients cost half a second
+POLL_SECONDS = 0.005  # between poll() calls in the driver thread
+POLL_LIMIT_MS = 25  # slowest acceptable poll() step (the status document is built inside one)
+ANSWER_LIMIT = 1.0  # seconds for a well-behaved client to get its answer
+
+
+class Driver:
+    """Polls a StatusServer from its own thread, like the board's task, timing every step."""
+
+    def __init__(self, server):
+        self.server = server
+        self.slowest_ms = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            started = time.perf_counter()
+            self.server.poll()
+            self.slowest_ms = max(self.slowest_ms, (time.perf_counter() - started) * 1000)
+            time.sleep(POLL_SECONDS)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+
+class Harness:
+    def __init__(self, port):
+        self.port = port
+        self.failures = []
+
+    def expect(self, ok, message):
+        if not ok:
+            self.failures.append(message)
+        return ok
+
+    def connect(self):
+        sock = socket.create_connection(("127.0.0.1", self.port), timeout=5)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+
+    def request(self, raw, sock=None):
+        """(status code, body bytes, seconds) for a raw request; code None if the server hung up."""
+        started = time.monotonic()
+        sock = sock or self.connect()
+        try:
+            sock.sendall(raw)
+            return (*self.read(sock), time.monotonic() - started)
+        finally:
+            sock.close()
+
+    def read(self, sock):
+        data = b""
+        try:
+            while True:
+                chunk = sock.recv(4096)
+                if not chunk:
+                    break
+                data += chunk
+        except (ConnectionResetError, socket.timeout):
+            pass
+        if not data:
+            return None, b""
+        head, _, body = data.partition(b"\r\n\r\n")
+        return int(head.split(b" ")[1]), body
+
+    def get(self, path="/status"):
+        return self.request(f"GET {path} HTTP/1.1\r\nHost: board\r\n\r\n".encode())
+
+
+def status(h):
+    code, body, elapsed = h.get()
+    if not h.expect(code == 200, f"GET /status answered {code}"):
+        return
+    doc = json.loads(body)
+    for key in ("uptime_s", "sport", "mode", "games", "sports", "errors", "bucket_edges_ms"):
+        h.expect(key in doc, f"status has no {key!r}")
+    nfl = doc.get("sports", {}).get("NFL", {})
+    h.expect(nfl.get("games", 0) > 0, "no NFL games in the status")
+    h.expect(nfl.get("age_s") is not None, "no NFL cache age")
+    h.expect(nfl.get("breaker") == "closed", f"NFL breaker {nfl.get('breaker')!r}")
+    h.expect(nfl.get("fetch_ms", {}).get("count", 0) > 0, "no NFL fetch latency histogram")
+    h.expect(elapsed < ANSWER_LIMIT, f"answer took {elapsed:.2f}s")
+
+
+def routes(h):
+    code, _, _ = h.get("/")
+    h.expect(code == 200, f"GET / answered {code}")
+    code, _, _ = h.get("/nope")
+    h.expect(code == 404, f"GET /nope answered {code}")
+    code, _, _ = h.request(b"POST /status HTTP/1.1\r\nContent-Length: 0\r\n\r\n")
+    h.expect(code == 405, f"POST answered {code}")
+
+
+def oversize(h):
+    code, _, _ = h.request(b"GET /status HTTP/1.1\r\nX-Pad: " + b"x" * 2048 + b"\r\n\r\n")
+    h.expect(code == 431, f"2 KB of headers answered {code}")
+    code, _, _ = h.get()
+    h.expect(code == 200, f"next request after an oversize one answered {code}")
+
+
+def silent(h):
+    """A client that connects and says nothing is dropped after the budget; the one behind it is served."""
+    stuck = h.connect()
+    time.sleep(0.05)
+    code, _, elapsed = h.get()
+    stuck_code, _ = h.read(stuck)
+    stuck.close()
+    h.expect(code == 200, f"client queued behind a silent one got {code}")
+    h.expect(stuck_code is None, f"silent client got an answer ({stuck_code})")
+    h.expect(elapsed < BUDGET_MS / 1000 + ANSWER_LIMIT, f"queued client waited {elapsed:.2f}s")
+
+
+def slow(h):
+    """A request dripped in within the budget is answered; one dripped past it is dropped."""
+    raw = b"GET /status HTTP/1.1\r\nHost: board\r\n\r\n"
+    sock = h.connect()
+    for i in range(0, len(raw), 8):
+        sock.sendall(raw[i:i + 8])
+        time.sleep(BUDGET_MS / 1000 / 20)
+    code, _ = h.read(sock)
+    sock.close()
+    h.expect(code == 200, f"request dripped within the budget answered {code}")
+
+    sock = h.connect()
+    try:
+        for i in range(0, len(raw), 4):
+            sock.sendall(raw[i:i + 4])
+            time.sleep(BUDGET_MS / 1000 / 4)
+    except (BrokenPipeError, ConnectionResetError):
+        pass
+    code, _ = h.read(sock)
+    sock.close()
+    h.expect(code is None, f"request dripped past the budget answered {code}")
+
+
+def reset(h):
+    sock = h.connect()
+    sock.sendall(b"GET /sta")
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, b"\x01\x00\x00\x00\x00\x00\x00\x00")
+    sock.close()  # RST instead of FIN
+    time.sleep(0.05)
+    code, _, _ = h.get()
+    h.expect(code == 200, f"request after a reset client answered {code}")
+
+
+def burst(h):
+    answers = []
+
+    def client():
+        answers.append(h.get()[0])
+    threads = [threading.Thread(target=client) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    h.expect(answers.count(200) == len(threads), f"8 concurrent clients got {sorted(answers, key=str)}")
+
+
+SCENARIOS = [
+    ("status", status),
+    ("routes", routes),
+    ("oversize-request", oversize),
+    ("silent-client", silent),
+    ("slow-client", slow),
+    ("reset-client", reset),
+    ("burst", burst),
+]
+
+
+def prime(mock):
+    """A DisplayManager and SportsAPI holding one fetch of every sport from the mock API."""
+    from api import SportsAPI
+    from display_manager import DisplayManager
+    api = SportsAPI("status", backend="json")
+    api.base_url = f"{mock.url}/api"
+    display_manager = DisplayManager(emulator.FramebufferDisplay(64, 32), api)
+    display_manager.current_sport = "SPORTS"
+    asyncio.run(display_manager.update_games())
+    return display_manager, api
+
+
+def start(port=0):
+    """(server, display_manager, api, mock) with the server bound; port 0 picks a free one."""
+    mock = MockAPI(script=FaultScript()).start()
+    os.environ.setdefault("API_KEY", "status")
+    emulator.install()
+    import socketpool
+    import wifi
+    from status_server import StatusServer, board_status
+    display_manager, api = prime(mock)
+    server = StatusServer(socketpool.SocketPool(wifi.radio), lambda: board_status(display_manager, api),
+                          port, BUDGET_MS, host="127.0.0.1")
+    server.poll()  # binds
+    return server, display_manager, api, mock
+
+
+def run(pattern="", verbose=False):
+    stdout = sys.stdout
+    devnull = None if verbose else open(os.devnull, "w")
+    if devnull is not None:
+        sys.stdout = devnull
+    try:
+        server, _, _, mock = start()
+        port = server._listener.getsockname()[1]
+        driver = Driver(server).start()
+    finally:
+        sys.stdout = stdout
+    failed = 0
+    try:
+        for name, scenario in SCENARIOS:
+            if pattern and pattern not in name:
+                continue
+            h = Harness(port)
+            started = time.monotonic()
+            try:
+                scenario(h)
+            except Exception as e:
+                h.failures.append(f"raised {type(e).__name__}: {e}")
+            if h.failures:
+                failed += 1
+                print(f"FAIL {name} ({time.monotonic() - started:.1f}s)")
+                for message in h.failures:
+                    print(f"     {message}")
+            else:
+                print(f"ok   {name} ({time.monotonic() - started:.1f}s)")
+    finally:
+        driver.stop()
+        server.close()
+        mock.stop()
+        if devnull is not None:
+            devnull.close()
+    from metrics import METRICS
+    counters = {k: v for k, v in METRICS.counters.items() if k.startswith("status.")}
+    print(f"Slowest poll() step: {driver.slowest_ms:.1f} ms (limit {POLL_LIMIT_MS} ms); {counters}")
+    if driver.slowest_ms > POLL_LIMIT_MS:
+        print("FAIL poll() blocked the loop")
+        failed += 1
+    return failed
+
+
+def serve(port):
+    server, _, _, mock = start(port)
+    print(f"Serving a primed board's status on http://127.0.0.1:{port}/status (Ctrl-C to stop)")
+    try:
+        asyncio.run(server.run(0.05))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        mock.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", dest="pattern", default="", help="only scenarios whose name contains this")
+    parser.add_argument("--verbose", action="store_true", help="show the board code's serial output")
+    parser.add_argument("--serve", type=int, metavar="PORT", help="serve instead of running the checks")
+    args = parser.parse_args()
+    if args.serve:
+        serve(args.serve)
+        return
+    failed = run(args.pattern, args.verbose)
+    print(f"{failed} check(s) failed" if failed else "All checks passed")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
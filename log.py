@@ -0,0 +1,103 @@
+"""
+Leveled logging for the hot paths. A message below LOG_LEVEL returns before any
+formatting, so pass arguments instead of building an f-string:
+
+    LOG.debug("Showing game: %s vs %s", home, away)
+
+Kept messages go into a preallocated ring of LOG_BUFFER lines and reach serial in
+batches, one print per flush: when LOG_FLUSH_LINES lines are waiting, at once for
+warnings and errors, and at the main loop's idle point (LOG.flush()). The ring
+still holds the most recent lines after they are printed, so LOG.dump() can replay
+what led up to a crash.
+"""
+from config import LOG_LEVEL, LOG_BUFFER, LOG_FLUSH_LINES
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+LEVELS = {"debug": DEBUG, "info": INFO, "warning": WARNING, "error": ERROR}
+
+
+class Logger:
+    """Level filter, lazy %-formatting and a fixed ring of recent lines."""
+
+    def __init__(self, level=INFO, capacity=64, flush_lines=16, write=print):
+        self.level = level
+        self.capacity = max(1, capacity)
+        self._flush_setting = flush_lines
+        self.flush_lines = max(1, min(flush_lines, self.capacity))  # never overwrite unprinted lines
+        self.write = write
+        self._lines = [None] * self.capacity
+        self._count = 0  # lines logged since boot
+        self._held = 0  # lines in the ring
+        self._flushed = 0  # _count at the last flush
+
+    def enabled(self, level):
+        """True if messages at level are kept (guard loops that only exist to log)."""
+        return level >= self.level
+
+    def debug(self, message, *args):
+        if DEBUG >= self.level:
+            self._add(DEBUG, message, args)
+
+    def info(self, message, *args):
+        if INFO >= self.level:
+            self._add(INFO, message, args)
+
+    def warning(self, message, *args):
+        if WARNING >= self.level:
+            self._add(WARNING, message, args)
+
+    def error(self, message, *args):
+        if ERROR >= self.level:
+            self._add(ERROR, message, args)
+
+    def _add(self, level, message, args):
+        if args:
+            try:
+                message = message % args
+            except (TypeError, ValueError):
+                message = f"{message} {args}"
+        self._lines[self._count % self.capacity] = message
+        self._count += 1
+        self._held = min(self._held + 1, self.capacity)
+        if level >= WARNING or self._count - self._flushed >= self.flush_lines:
+            self.flush()
+
+    def _recent(self, n):
+        """The last n lines, oldest first."""
+        return [self._lines[i % self.capacity] for i in range(self._count - n, self._count)]
+
+    def flush(self):
+        """Print the lines logged since the last flush in one write."""
+        waiting = self._count - self._flushed
+        if not waiting:
+            return
+        self._flushed = self._count
+        self.write("\n".join(self._recent(waiting)))
+
+    def resize(self, capacity):
+        """Change the ring to capacity lines, keeping the most recent (the memory governor shrinks it)."""
+        self.flush()
+        capacity = max(1, capacity)
+        lines = [None] * capacity
+        self._held = min(self._held, capacity)
+        for i in range(self._count - self._held, self._count):
+            lines[i % capacity] = self._lines[i % self.capacity]
+        self._lines = lines
+        self.capacity = capacity
+        self.flush_lines = max(1, min(self._flush_setting, capacity))
+
+    def dump(self, reason="recent log"):
+        """Print everything still in the ring (up to LOG_BUFFER lines), e.g. after a crash."""
+        self.flush()
+        kept = self._held
+        self.write(f"--- {reason}: last {kept} of {self._count} lines ---")
+        if kept:
+            self.write("\n".join(self._recent(kept)))
+        self.write("--- end of log ---")
+
+
+# Process-wide logger
+LOG = Logger(LEVELS.get(LOG_LEVEL.lower(), INFO), LOG_BUFFER, LOG_FLUSH_LINES)
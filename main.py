@@ -13,20 +13,40 @@ from boot import connect_wifi, sync_rtc, check_wifi_reconnect
 from config import (
     DISPLAY_WIDTH,
     DISPLAY_HEIGHT,
+    BIT_DEPTH,
     DEBOUNCE_TIME,
-    DISPLAY_INTERVAL,
-    REFRESH_INTERVAL_LIVE,
+    FETCH_SETTLE,
     REFRESH_INTERVAL_IDLE,
     MAX_CONSECUTIVE_ERRORS,
     WIFI_CHECK_INTERVAL,
-    ACTIVE_STATUSES,
+    HEAP_SAMPLE_INTERVAL,
+    TRACE_ENABLED,
+    TRACE_DUMP_INTERVAL,
+    METRICS_LOG_INTERVAL,
+    METRICS_LOG_PATH,
+    METRICS_LOG_SLOTS,
+    METRICS_LOG_BATCH,
+    STATUS_PORT,
+    STATUS_BUDGET_MS,
+    STATUS_MAX_BYTES,
+    STATUS_POLL_INTERVAL,
+    MEMORY_LOW_FREE,
+    MEMORY_CRITICAL_FREE,
+    MEMORY_GAME_CAP,
+    MEMORY_CHECK_INTERVAL,
 )
 from display_manager import DisplayManager
 from buttons import ButtonController
+from heap import HeapMonitor
+from memory_governor import MemoryGovernor, note_error
+from metrics_log import MetricsLog
+from tracing import TRACER, span
+from log import LOG
+from status_server import StatusServer, board_status
 from utils import WHITE
 
 # Initialize the Matrix
-matrix = Matrix(width=DISPLAY_WIDTH, height=DISPLAY_HEIGHT, bit_depth=6)
+matrix = Matrix(width=DISPLAY_WIDTH, height=DISPLAY_HEIGHT, bit_depth=BIT_DEPTH)
 display = matrix.display
 
 
@@ -62,7 +82,9 @@ button_up.pull = digitalio.Pull.UP
 button_down = digitalio.DigitalInOut(board.BUTTON_DOWN)
 button_down.direction = digitalio.Direction.INPUT
 button_down.pull = digitalio.Pull.UP
-button_controller = ButtonController(button_up, button_down, debounce_seconds=DEBOUNCE_TIME)
+button_controller = ButtonController(
+    button_up, button_down, debounce_seconds=DEBOUNCE_TIME, fetch_settle_seconds=FETCH_SETTLE
+)
 
 # Boot: WiFi and RTC (progress shown on matrix + serial)
 if connect_wifi(on_progress=_on_boot_progress):
@@ -77,28 +99,30 @@ _show_boot_message("Load", "Scores")
 # Initialize API and Display Manager
 api = SportsAPI(os.getenv("API_KEY"))
 display_manager = DisplayManager(display, api)
-
-
-def _refresh_interval_for_games(games):
-    """Return refresh interval (seconds) based on whether any game is live."""
-    has_live = any(g.get("status") in ACTIVE_STATUSES for g in games) if games else False
-    return REFRESH_INTERVAL_LIVE if has_live else REFRESH_INTERVAL_IDLE
+status_server = None
+if STATUS_PORT:
+    status_server = StatusServer(
+        api.pool, lambda: board_status(display_manager, api), STATUS_PORT, STATUS_BUDGET_MS, STATUS_MAX_BYTES
+    )
 
 
 async def _do_fetch_phase():
     """Run fetch phase; returns (success, new_interval). On error returns (False, None)."""
     try:
-        await display_manager.update_games()
-        return (True, _refresh_interval_for_games(display_manager.games))
+        with span("fetch"):
+            await display_manager.update_games()
+        return (True, display_manager.refresh_interval())
     except Exception as e:
         print(f"Error updating games: {e}")
+        note_error(e)
         return (False, None)
 
 
 async def _do_display_phase():
     """Run display phase. Returns True on success. On error may show Display Issue and sleep."""
     try:
-        await display_manager.display_current_game()
+        with span("display"):
+            await display_manager.display_current_game()
         return True
     except (OSError, RuntimeError) as e:
         print(f"Display error: {e}")
@@ -114,6 +138,8 @@ async def _do_display_phase():
 async def main():
     """Main program loop"""
     try:
+        if status_server is not None:
+            asyncio.create_task(status_server.run(STATUS_POLL_INTERVAL))
         display_manager.display_static_text("Starting")
         await asyncio.sleep(0.5)
         try:
@@ -127,7 +153,14 @@ async def main():
         refresh_interval = REFRESH_INTERVAL_IDLE
         error_count = 0
         last_wifi_check = 0
-        
+        last_heap_sample = 0
+        heap_monitor = HeapMonitor() if HEAP_SAMPLE_INTERVAL else None
+        last_trace_dump = time.monotonic()
+        last_metrics_record = time.monotonic()
+        last_memory_check = 0
+        memory_governor = MemoryGovernor(display_manager, MEMORY_LOW_FREE, MEMORY_CRITICAL_FREE, MEMORY_GAME_CAP)
+        metrics_log = MetricsLog(METRICS_LOG_PATH, METRICS_LOG_SLOTS, METRICS_LOG_BATCH) if METRICS_LOG_INTERVAL else None
+
         while True:
             try:
                 current_time = time.monotonic()
@@ -147,24 +180,36 @@ async def main():
                 # Phase 1b: periodic WiFi check when connected
                 if current_time - last_wifi_check >= WIFI_CHECK_INTERVAL:
                     try:
-                        check_wifi_reconnect()
+                        with span("wifi_check"):
+                            check_wifi_reconnect()
                         last_wifi_check = current_time
                     except OSError as e:
                         print(f"WiFi check failed: {e}")
 
                 # Phase 2: buttons (may trigger fetch and reset timers)
                 try:
-                    fetch_data = await button_controller.check(display_manager)
+                    with span("buttons"):
+                        fetch_data = await button_controller.check(display_manager)
                 except OSError as e:
                     print(f"Error reading buttons: {e}")
                     fetch_data = False
                 
-                # If fetch_data is True, reset our timers to force immediate display
+                # A press already drew the new view (or its switch message); start its dwell now.
+                # Any refetch runs in the background and was requested only for stale data.
                 if fetch_data:
                     last_update = current_time
-                    last_display_time = 0  # Force immediate display
+                    last_display_time = current_time
                     continue
                 
+                # Phase 2b: fleet fan-out (hub answers resyncs; a receiver applies pushed games now)
+                try:
+                    with span("service"):
+                        serviced = api.service()
+                    if serviced:
+                        display_manager.request_update()
+                except OSError as e:
+                    print(f"Fan-out error: {e}")
+
                 # Phase 3: refresh games on interval
                 if current_time - last_update >= refresh_interval:
                     ok, new_interval = await _do_fetch_phase()
@@ -184,14 +229,14 @@ async def main():
                             last_update = current_time
                     continue
 
-                # Phase 4: advance display (hardware boundary)
-                if current_time - last_display_time >= DISPLAY_INTERVAL:
+                # Phase 4: advance display (hardware boundary); dwell set by the rotation scheduler
+                if display_manager.needs_display or current_time - last_display_time >= display_manager.current_dwell:
                     if await _do_display_phase():
                         last_display_time = current_time
                         error_count = 0
                     else:
                         error_count += 1
-                        current_games = display_manager.get_filtered_games()
+                        # The rotation already moved past the failing game
                         if error_count >= MAX_CONSECUTIVE_ERRORS:
                             try:
                                 display_manager.display_static_text("Display\nIssue")
@@ -199,18 +244,39 @@ async def main():
                                 pass
                             await asyncio.sleep(10)
                             error_count = 0
-                        else:
-                            n = len(current_games) if current_games else 1
-                            display_manager.current_game_index = (display_manager.current_game_index + 1) % n
                         last_display_time = current_time
                 
-                # Small delay to avoid consuming too much CPU
+                # Keep live clocks ticking between rotations and polls
+                with span("tick"):
+                    display_manager.tick()
+
+                # Safe point between rotations: collect, shed or restore before the next render
+                if memory_governor.enabled and current_time - last_memory_check >= MEMORY_CHECK_INTERVAL:
+                    last_memory_check = current_time
+                    memory_governor.check()
+
+                if heap_monitor is not None and current_time - last_heap_sample >= HEAP_SAMPLE_INTERVAL:
+                    last_heap_sample = current_time
+                    heap_monitor.sample()
+
+                if TRACE_ENABLED and TRACE_DUMP_INTERVAL and current_time - last_trace_dump >= TRACE_DUMP_INTERVAL:
+                    last_trace_dump = current_time
+                    TRACER.dump()
+
+                if metrics_log is not None and current_time - last_metrics_record >= METRICS_LOG_INTERVAL:
+                    last_metrics_record = current_time
+                    metrics_log.record()
+
+                # Small delay to avoid consuming too much CPU; buffered log lines go out here
+                LOG.flush()
                 await asyncio.sleep(0.1)
                 
             except Exception as e:
                 print(f"Critical: {e}")
+                note_error(e)
                 import traceback
                 print(traceback.format_exc())
+                LOG.dump("log before the error")
                 error_count += 1
                 if error_count >= MAX_CONSECUTIVE_ERRORS:
                     try:
@@ -226,8 +292,13 @@ async def main():
         
     except Exception as e:
         print(f"Error in main: {e}")
+        LOG.dump("log before the error")
         display_manager.display_static_text("Error!")
         await asyncio.sleep(5)
 
-# Start the async event loop
-asyncio.run(main())
\ No newline at end of file
+# Start the async event loop; anything that escapes it (or Ctrl-C) prints the recent log first
+try:
+    asyncio.run(main())
+except BaseException:
+    LOG.dump("log at exit")
+    raise
\ No newline at end of file
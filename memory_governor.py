@@ -0,0 +1,136 @@
+"""
+Memory-pressure governor: at the main loop's safe point (after the display phase
+and the clock tick, never mid-render) it reads gc.mem_free(), collects when free
+heap is under MEMORY_LOW_FREE and, while it stays short, steps the board down so
+it keeps rendering instead of failing with MemoryError:
+
+  1 lean    drop the pre-rendered frame bundles and blitter (and the SPORTS view, once)
+  2 capped  keep at most MEMORY_GAME_CAP games per sport, live games first
+  3 quiet   log level WARNING with a short ring; tracing off and its histograms dropped
+
+Stage thresholds run from MEMORY_LOW_FREE down to MEMORY_CRITICAL_FREE. A
+MemoryError swallowed by a recovery handler (counted with note_error()) goes
+straight to the last stage at the next check. A stage is undone, one at a time,
+after free heap has stayed RECOVER_MARGIN bytes above its threshold for
+RECOVER_CHECKS checks in a row. Every step is logged and shows up in METRICS
+(memory.stage, memory.collections, memory.escalations, memory.recoveries).
+gc has no mem_free on CPython, so the governor stays off on the host unless it
+is given a read function.
+"""
+import gc
+from log import LOG, WARNING
+from metrics import METRICS
+from tracing import TRACER
+
+NORMAL = 0
+LEAN = 1
+CAPPED = 2
+QUIET = 3
+STAGE_NAMES = ("normal", "lean", "capped", "quiet")
+RECOVER_MARGIN = 8192  # bytes above a stage's threshold before it may be undone
+RECOVER_CHECKS = 3  # consecutive checks with that much room
+QUIET_LOG_LINES = 8  # LOG ring size while quiet
+
+
+def note_error(e):
+    """Count e if it is a MemoryError; for handlers that log and carry on rather than re-raise."""
+    if isinstance(e, MemoryError):
+        METRICS.incr("memory.errors")
+
+
+class MemoryGovernor:
+    """Collects at safe points and sheds memory in stages as free heap falls; restores as it recovers."""
+
+    def __init__(self, display_manager, low_free=32768, critical_free=12288, game_cap=8, read_free=None,
+                 collect=gc.collect):
+        if read_free is None:
+            read_free = getattr(gc, "mem_free", None)
+        self.display_manager = display_manager
+        self.game_cap = game_cap
+        self.read_free = read_free
+        self.collect = collect
+        self.enabled = read_free is not None and low_free > 0
+        # Free heap below thresholds[i] calls for stage i + 1
+        self.thresholds = (low_free, (low_free + critical_free) // 2, critical_free)
+        self.stage = NORMAL
+        self.free = None  # bytes free at the last check
+        self._calm = 0  # consecutive checks with room to step down
+        self._errors = 0  # memory.errors already acted on
+        self._log_capacity = None  # LOG settings saved while quiet
+        self._log_level = None
+        self._trace_enabled = None
+
+    def _stage_for(self, free):
+        return sum(1 for threshold in self.thresholds if free < threshold)
+
+    def check(self):
+        """One safe-point check: collect if short, then step up (or, slowly, down). Returns the stage."""
+        if not self.enabled:
+            return self.stage
+        free = self.read_free()
+        if free < self.thresholds[0]:
+            self.collect()
+            METRICS.incr("memory.collections")
+            free = self.read_free()
+        self.free = free
+        METRICS.gauge("memory.free", free)
+
+        errors = METRICS.counters.get("memory.errors", 0)
+        if errors > self._errors:
+            self._errors = errors
+            self._raise(QUIET, "MemoryError caught")
+        elif self._stage_for(free) > self.stage:
+            self._raise(self._stage_for(free), f"{free} bytes free")
+        elif self.stage and free >= self.thresholds[self.stage - 1] + RECOVER_MARGIN:
+            self._calm += 1
+            if self._calm >= RECOVER_CHECKS:
+                self._lower(free)
+        else:
+            self._calm = 0
+        return self.stage
+
+    def _raise(self, target, reason):
+        self._calm = 0
+        if target <= self.stage:
+            return
+        for stage in range(self.stage + 1, target + 1):
+            self._enter(stage)
+            self.stage = stage
+            METRICS.incr("memory.escalations")
+            LOG.warning("Memory low (%s): stage %d, %s", reason, stage, STAGE_NAMES[stage])
+        METRICS.gauge("memory.stage", self.stage)
+        self.collect()
+        METRICS.incr("memory.collections")
+
+    def _lower(self, free):
+        self._calm = 0
+        stage = self.stage
+        self._leave(stage)
+        self.stage = stage - 1
+        METRICS.incr("memory.recoveries")
+        METRICS.gauge("memory.stage", self.stage)
+        LOG.warning("Memory recovered (%d bytes free): %s undone, stage %d", free, STAGE_NAMES[stage], self.stage)
+
+    def _enter(self, stage):
+        if stage == LEAN:
+            self.display_manager.set_lean(True)
+        elif stage == CAPPED:
+            self.display_manager.set_game_cap(self.game_cap)
+        elif stage == QUIET:
+            self._log_level = LOG.level
+            self._log_capacity = LOG.capacity
+            LOG.level = max(LOG.level, WARNING)
+            LOG.resize(min(LOG.capacity, QUIET_LOG_LINES))
+            self._trace_enabled = TRACER.enabled
+            TRACER.enabled = False
+            TRACER.reset()
+
+    def _leave(self, stage):
+        if stage == LEAN:
+            self.display_manager.set_lean(False)
+        elif stage == CAPPED:
+            self.display_manager.set_game_cap(None)
+        elif stage == QUIET:
+            LOG.level = self._log_level
+            LOG.resize(self._log_capacity)
+            TRACER.enabled = self._trace_enabled
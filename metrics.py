@@ -0,0 +1,128 @@
+"""
+In-memory counters, gauges, timings and latency histograms for the running board.
+Cheap enough to update from the main loop; read via snapshot() or dump().
+"""
+
+
+class Timing:
+    """Running count / total / min / max / last for one measured quantity."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.last = None
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        self.last = value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def as_dict(self):
+        mean = self.total / self.count if self.count else None
+        return {"count": self.count, "mean": mean, "min": self.min, "max": self.max, "last": self.last}
+
+
+BUCKET_EDGES_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000)  # last bucket is open
+
+
+class Histogram:
+    """Counts per duration bucket plus count / total / max (ms); percentiles to bucket precision."""
+
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKET_EDGES_MS) + 1)
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def add(self, ms):
+        i = 0
+        while i < len(BUCKET_EDGES_MS) and ms > BUCKET_EDGES_MS[i]:
+            i += 1
+        self.buckets[i] += 1
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def percentile(self, p):
+        """Upper bucket edge at or below which p percent of samples fall (never above max)."""
+        if not self.count:
+            return None
+        rank = (self.count * p + 99) // 100
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                return min(BUCKET_EDGES_MS[i], self.max) if i < len(BUCKET_EDGES_MS) else self.max
+        return self.max
+
+    def as_dict(self):
+        p50, p95 = self.percentile(50), self.percentile(95)
+        return {
+            "count": self.count,
+            "p50_ms": None if p50 is None else round(p50),
+            "p95_ms": None if p95 is None else round(p95),
+            "max_ms": round(self.max),
+            "mean_ms": round(self.total / self.count) if self.count else None,
+            "buckets": list(self.buckets),
+        }
+
+
+class Metrics:
+    """Named counters (monotonic), gauges (last value), timings (aggregated) and latency histograms."""
+
+    def __init__(self):
+        self.counters = {}
+        self.gauges = {}
+        self.timings = {}
+        self.histograms = {}
+
+    def incr(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def gauge(self, name, value):
+        self.gauges[name] = value
+
+    def observe(self, name, value):
+        timing = self.timings.get(name)
+        if timing is None:
+            timing = self.timings[name] = Timing()
+        timing.add(value)
+
+    def histogram(self, name, ms):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        histogram.add(ms)
+
+    def snapshot(self):
+        """Plain dict of everything recorded so far (JSON-serializable)."""
+        return {
+            "counters": dict(self.counters),
+            "gauges": dict(self.gauges),
+            "timings": {name: t.as_dict() for name, t in self.timings.items()},
+            "histograms": {name: h.as_dict() for name, h in self.histograms.items()},
+        }
+
+    def dump(self):
+        """Print all metrics to serial, one per line."""
+        for name in sorted(self.counters):
+            print(f"metric {name}={self.counters[name]}")
+        for name in sorted(self.gauges):
+            print(f"metric {name}={self.gauges[name]}")
+        for name in sorted(self.timings):
+            t = self.timings[name].as_dict()
+            print(f"metric {name} n={t['count']} mean={t['mean']} min={t['min']} max={t['max']}")
+        for name in sorted(self.histograms):
+            h = self.histograms[name].as_dict()
+            print(f"metric {name} n={h['count']} p50_ms={h['p50_ms']} p95_ms={h['p95_ms']} max_ms={h['max_ms']}")
+
+
+# Process-wide registry
+METRICS = Metrics()
@@ -0,0 +1,245 @@
+"""
+Persistent metrics on the SD card: every METRICS_LOG_INTERVAL seconds one fixed-size
+binary record of what happened since the previous one (fetch latency per sport,
+bytes received, cache hits, errors by cause, free heap, render time, WiFi
+reconnects) goes into a ring of METRICS_LOG_SLOTS records at METRICS_LOG_PATH, so
+a week of behavior survives reboots. Records wait in RAM and are written
+METRICS_LOG_BATCH at a time (one open and one write per run of slots) to spare the
+card; a reset loses at most one unwritten batch.
+
+File layout (little-endian):
+  header, HEADER_SIZE bytes: MAGIC, version (H), record size (H), slot count (I),
+      layout length (H), then the layout ("seq:I,t:I,...") padded with zeros
+  slots: slot count x record size; an unused slot is all zeros
+Every record starts with a sequence number, so the next slot is found by scanning
+at boot, and a batch cut short by power loss leaves the other records readable.
+python -m host.metrics_report prints time series and summaries from a copy of the file.
+"""
+import gc
+import struct
+import time
+from games_processor import get_rtc_now
+from metrics import METRICS
+
+MAGIC = b"SMML"
+VERSION = 1
+HEADER_SIZE = 512
+HEADER_FORMAT = "<4sHHIH"
+LOG_SPORTS = ("NFL", "NBA", "NHL", "MLB")
+ERROR_FIELDS = ("timeout", "dns", "connection", "http_4xx", "http_5xx", "parse", "too_large", "other")
+SCAN_CHUNK = 32  # records read at a time when looking for the newest slot
+
+# (field, struct code); counts are per interval, *_ms are means over the interval (0 = none)
+LAYOUT = (
+    (("seq", "I"), ("t", "I"), ("uptime_s", "I"), ("interval_s", "H"))
+    + tuple((f"fetch_ms.{sport}", "H") for sport in LOG_SPORTS)
+    + (("fetches", "H"), ("bytes_rx", "I"), ("cache_hits", "H"))
+    + tuple((f"err.{cause}", "H") for cause in ERROR_FIELDS)
+    + (("heap_free", "I"), ("render_ms", "H"), ("renders", "H"), ("wifi_reconnects", "H"))
+)
+_LIMITS = {"H": 0xFFFF, "I": 0xFFFFFFFF}
+
+
+def layout_string(layout=LAYOUT):
+    return ",".join(f"{name}:{code}" for name, code in layout)
+
+
+def parse_layout(text):
+    """'seq:I,t:I' -> ((name, code), ...)."""
+    return tuple(tuple(item.split(":")) for item in text.split(",") if item)
+
+
+def record_format(layout):
+    return "<" + "".join(code for _, code in layout)
+
+
+def error_field(cause):
+    """Record field for an api.errors.<cause> counter."""
+    if cause.startswith("http_"):
+        return "err.http_5xx" if cause[5:6] == "5" else "err.http_4xx"
+    if cause == "decode":
+        return "err.parse"
+    if cause in ERROR_FIELDS:
+        return f"err.{cause}"
+    return "err.other"
+
+
+def read_header(f):
+    """(record size, slots, layout) from an open log file, or None if it isn't one."""
+    f.seek(0)
+    head = f.read(HEADER_SIZE)
+    if len(head) < HEADER_SIZE:
+        return None
+    magic, version, size, slots, length = struct.unpack_from(HEADER_FORMAT, head)
+    if magic != MAGIC or version != VERSION:
+        return None
+    start = struct.calcsize(HEADER_FORMAT)
+    layout = parse_layout(head[start:start + length].decode())
+    if struct.calcsize(record_format(layout)) != size:
+        return None
+    return size, slots, layout
+
+
+def read_records(path):
+    """(layout, [record dicts] oldest first) from a log file; raises ValueError if it isn't one."""
+    with open(path, "rb") as f:
+        header = read_header(f)
+        if header is None:
+            raise ValueError(f"{path}: not a metrics log")
+        size, slots, layout = header
+        fmt = record_format(layout)
+        names = [name for name, _ in layout]
+        records = []
+        f.seek(HEADER_SIZE)
+        for _ in range(slots):
+            data = f.read(size)
+            if len(data) < size:
+                break
+            values = struct.unpack(fmt, data)
+            if values[0]:
+                records.append(dict(zip(names, values)))
+    records.sort(key=lambda r: r["seq"])
+    return layout, records
+
+
+class MetricsLog:
+    """Turns METRICS into one record per interval and writes them to the ring in batches."""
+
+    def __init__(self, path, slots=2016, batch=6, metrics=METRICS):
+        self.path = path
+        self.slots = slots
+        self.batch = max(1, batch)
+        self.metrics = metrics
+        self.layout = LAYOUT
+        self.format = record_format(LAYOUT)
+        self.size = struct.calcsize(self.format)
+        self.enabled = True
+        self.pending = []  # packed records not yet on the card
+        self.seq = None  # last sequence number used; None until the file is opened
+        self.next_slot = 0
+        self._last = {}  # counter / timing totals at the previous record
+        self._last_uptime = time.monotonic()
+
+    def _open(self):
+        """Find the newest record in an existing log, or create a fresh one."""
+        try:
+            with open(self.path, "rb") as f:
+                header = read_header(f)
+                if header == (self.size, self.slots, self.layout):
+                    self._scan(f)
+                    return
+            print(f"Metrics log {self.path}: different layout, starting a new one")
+        except OSError:
+            pass
+        self._create()
+
+    def _scan(self, f):
+        best_seq, best_slot = 0, -1
+        f.seek(HEADER_SIZE)
+        slot = 0
+        while slot < self.slots:
+            data = f.read(self.size * min(SCAN_CHUNK, self.slots - slot))
+            if not data:
+                break
+            for offset in range(0, len(data) - self.size + 1, self.size):
+                seq = struct.unpack_from("<I", data, offset)[0]
+                if seq > best_seq:
+                    best_seq, best_slot = seq, slot
+                slot += 1
+        self.seq = best_seq
+        self.next_slot = (best_slot + 1) % self.slots
+
+    def _create(self):
+        layout = layout_string(self.layout).encode()
+        header = struct.pack(HEADER_FORMAT, MAGIC, VERSION, self.size, self.slots, len(layout)) + layout
+        empty = bytes(self.size * SCAN_CHUNK)
+        with open(self.path, "wb") as f:
+            f.write(header + bytes(HEADER_SIZE - len(header)))
+            for slot in range(0, self.slots, SCAN_CHUNK):
+                f.write(empty[:self.size * min(SCAN_CHUNK, self.slots - slot)])
+        self.seq = 0
+        self.next_slot = 0
+        print(f"Metrics log {self.path}: {self.slots} records of {self.size} bytes")
+
+    def _delta(self, name, now):
+        previous = self._last.get(name, 0)
+        self._last[name] = now
+        return now - previous
+
+    def _mean_ms(self, name):
+        """Mean of timing name since the previous record (0 if nothing was observed)."""
+        timing = self.metrics.timings.get(name)
+        if timing is None:
+            return 0, 0
+        count = self._delta(name + "#n", timing.count)
+        total = self._delta(name + "#total", timing.total)
+        return (round(total / count) if count else 0), count
+
+    def build(self):
+        """Values for a record covering the time since the previous one (seq filled in by record())."""
+        counters = self.metrics.counters
+        uptime = time.monotonic()
+        values = {
+            "t": get_rtc_now() or 0,
+            "uptime_s": int(uptime),
+            "interval_s": int(uptime - self._last_uptime),
+        }
+        self._last_uptime = uptime
+        fetches = 0
+        for sport in LOG_SPORTS:
+            values[f"fetch_ms.{sport}"], count = self._mean_ms(f"api.air_ms.{sport}")
+            fetches += count
+        values["fetches"] = fetches
+        values["bytes_rx"] = self._delta("api.bytes_received", counters.get("api.bytes_received", 0))
+        values["cache_hits"] = self._delta("api.cache_hits", counters.get("api.cache_hits", 0))
+        for name in list(counters):
+            if name.startswith("api.errors."):
+                field = error_field(name[len("api.errors."):])
+                values[field] = values.get(field, 0) + self._delta(name, counters[name])
+        if hasattr(gc, "mem_free"):
+            gc.collect()
+            values["heap_free"] = gc.mem_free()
+        values["render_ms"], _ = self._mean_ms("display.render_ms")
+        values["renders"] = self._delta("display.renders", counters.get("display.renders", 0))
+        values["wifi_reconnects"] = self._delta("wifi.reconnects", counters.get("wifi.reconnects", 0))
+        return values
+
+    def record(self):
+        """Take one record; writes the batch to the card once it is full."""
+        if not self.enabled:
+            return
+        values = self.build()
+        try:
+            if self.seq is None:
+                self._open()
+        except OSError as e:
+            self.enabled = False
+            print(f"Metrics log disabled ({self.path}): {e}")
+            return
+        self.seq += 1
+        values["seq"] = self.seq
+        packed = []
+        for name, code in self.layout:
+            value = int(values.get(name, 0))
+            packed.append(min(max(value, 0), _LIMITS[code]))
+        self.pending.append(struct.pack(self.format, *packed))
+        if len(self.pending) >= self.batch:
+            self.flush()
+
+    def flush(self):
+        """Write pending records into the ring (one seek + write per contiguous run of slots)."""
+        if not self.pending or not self.enabled:
+            return
+        try:
+            with open(self.path, "r+b") as f:
+                while self.pending:
+                    run = min(len(self.pending), self.slots - self.next_slot)
+                    f.seek(HEADER_SIZE + self.next_slot * self.size)
+                    f.write(b"".join(self.pending[:run]))
+                    self.pending = self.pending[run:]
+                    self.next_slot = (self.next_slot + run) % self.slots
+            self.metrics.incr("metrics_log.flushes")
+        except OSError as e:
+            self.enabled = False
+            self.pending = []
+            print(f"Metrics log disabled ({self.path}): {e}")
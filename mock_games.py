@@ -0,0 +1,150 @@
+"""
+Mock game data shared by the display tests (comprehensive_display_test.py on the
+board, host/golden.py on a computer). Games are in process_games output shape;
+raw_mock_games() gives the same games in the sports API's raw shape (perf_test.py).
+Dates are fixed; scheduled games on MOCK_DATE count as "today" only when the
+RTC is on that date (the golden harness pins it there).
+"""
+
+MOCK_DATE = "2025-10-19"
+MOCK_FUTURE_DATE = "2025-10-22"
+
+
+def _game(sport, away, home, away_score, home_score, status, **fields):
+    game = {
+        "sport": sport,
+        "away_team": away,
+        "home_team": home,
+        "away_score": away_score,
+        "home_score": home_score,
+        "status": status,
+        "period": "",
+        "clock": "",
+        "stoppage": False,
+        "date": f"{MOCK_DATE}T19:05",
+        "venue": "",
+        "home_record": "",
+        "away_record": "",
+        "last_play": "",
+        "down_distance": "",
+        "possession": "",
+        "count": {},
+        "bases": {},
+    }
+    game.update(fields)
+    return game
+
+
+MOCK_GAMES_BY_SPORT = {
+    "MLB": [
+        _game("MLB", "BOS", "NYY", 2, 3, "In Progress", period="T7",
+              count={"balls": 3, "strikes": 2, "outs": 1}, bases={"first": True, "third": True}),
+        _game("MLB", "LAD", "SF", 4, 4, "In Progress", period="B9",
+              count={"balls": 0, "strikes": 1, "outs": 2}, bases={"first": True, "second": True, "third": True}),
+        _game("MLB", "HOU", "TEX", 5, 1, "Final", home_record="88-74", away_record="90-72"),
+        _game("MLB", "SEA", "TB", 0, 0, "Scheduled", date=f"{MOCK_DATE}T19:05",
+              home_record="80-82", away_record="85-77"),
+        _game("MLB", "CHC", "STL", 0, 0, "Scheduled", date=f"{MOCK_FUTURE_DATE}T13:20"),
+        _game("MLB", "ATL", "NYM", 3, 2, "Rain Delay", period="T6"),
+        _game("MLB", "PHI", "MIA", 0, 0, "Postponed", home_record="62-100", away_record="95-67"),
+    ],
+    "NFL": [
+        _game("NFL", "BUF", "KC", 17, 21, "In Progress", period="3Q", clock="8:42",
+              down_distance="3rd & 7 on KC 35", possession="BUF"),
+        _game("NFL", "DAL", "PHI", 10, 7, "In Progress", period="2Q", clock="0:00"),
+        _game("NFL", "SF", "SEA", 24, 24, "In Progress", period="4Q", clock="1:12",
+              last_play="Timeout #2 by SEA"),
+        _game("NFL", "GB", "CHI", 31, 17, "Final", home_record="5-2", away_record="6-1"),
+        _game("NFL", "NE", "NYJ", 0, 0, "Scheduled", date=f"{MOCK_DATE}T13:00"),
+        _game("NFL", "MIA", "BAL", 0, 0, "Scheduled", date=f"{MOCK_FUTURE_DATE}T20:15",
+              home_record="4-3", away_record="2-5"),
+    ],
+    "NBA": [
+        _game("NBA", "LAL", "BOS", 98, 102, "In Progress", period="4Q", clock="2:31"),
+        _game("NBA", "GSW", "DEN", 55, 60, "In Progress", period="2Q", clock="0:00", stoppage=True),
+        _game("NBA", "MIL", "NYK", 112, 108, "Final", home_record="12-8", away_record="15-5"),
+        _game("NBA", "PHX", "OKC", 0, 0, "Scheduled", date=f"{MOCK_DATE}T20:00"),
+        _game("NBA", "MIA", "TOR", 44, 40, "Suspended", period="2Q"),
+    ],
+    "NHL": [
+        _game("NHL", "TOR", "MTL", 2, 1, "In Progress", period="2", clock="12:45"),
+        _game("NHL", "EDM", "VGK", 3, 3, "In Progress", period="OT", clock="3:10"),
+        _game("NHL", "NYR", "PIT", 4, 2, "Final", home_record="10-8", away_record="14-4"),
+        _game("NHL", "COL", "DAL", 0, 0, "Scheduled", date=f"{MOCK_FUTURE_DATE}T19:30"),
+        _game("NHL", "VAN", "CHI", 0, 0, "Cancelled"),
+    ],
+}
+
+# Raw status strings the status test shows one by one (label, then a game with that status)
+STATUS_TEST_LABELS = [
+    "Postponed",
+    "Delayed",
+    "Suspended",
+    "Cancelled",
+    "Rain Delay",
+    "Weather Delay",
+    "Unknown",
+    "Final",
+    "Scheduled",
+    "In Progress",
+]
+
+# Unusual inputs: zero and three-digit scores, long or odd team names, missing records
+EDGE_CASE_GAMES = [
+    _game("NBA", "AAA", "BBB", 0, 0, "In Progress", period="1Q", clock="15:00",
+          home_record="0-0", away_record="0-0"),
+    _game("NBA", "CCC", "DDD", 198, 200, "In Progress", period="4Q", clock="00:01",
+          home_record="50-0", away_record="49-1"),
+    _game("NHL", "VERYLONG", "LONGNAME", 3, 5, "Final", period="F", clock="0:00",
+          home_record="45-35", away_record="42-38"),
+    _game("NFL", "EEE", "FFF", 8, 10, "In Progress", period="2Q", clock="12:30"),
+    _game("NFL", "EEE", "FFF", 0, 0, "Scheduled", date="", home_record="0-0", away_record="0-0"),
+    _game("MLB", "TM&", "TM#", 3, 5, "Final", home_record="45-35", away_record="42-38"),
+]
+
+
+def create_status_mock_game(status):
+    """An MLB game (BOS at NYY, 2-3, records set) with the given raw status."""
+    return _game(
+        "MLB", "BOS", "NYY", 2, 3, status, period="T5",
+        count={"balls": 1, "strikes": 1, "outs": 0}, bases={"second": True},
+        home_record="92-70", away_record="81-81",
+    )
+
+
+def raw_mock_games(sport, day=None):
+    """MOCK_GAMES_BY_SPORT[sport] as raw API dicts (process_games input), dated on day ("YYYY-MM-DD") if given."""
+    raw = []
+    for game in MOCK_GAMES_BY_SPORT.get(sport, []):
+        date = game["date"]
+        if day and date:
+            date = day + date[10:]
+        entry = {
+            "status": game["status"],
+            "home_abbreviation": game["home_team"],
+            "away_abbreviation": game["away_team"],
+            "home_score": game["home_score"],
+            "away_score": game["away_score"],
+            "date": date,
+            "venue": game["venue"],
+            "home_record": game["home_record"],
+            "away_record": game["away_record"],
+            "last_play": game["last_play"],
+            "down_distance": game["down_distance"],
+            "possession": game["possession"],
+            "count": game["count"],
+            "bases": game["bases"],
+        }
+        period = game["period"]
+        if sport == "MLB":
+            if period[:1] in ("T", "B"):
+                entry["inning_half"] = "top" if period[0] == "T" else "bottom"
+                entry["inning"] = period[1:]
+        elif sport == "NHL":
+            entry["game_period"] = period
+        else:
+            entry["quarter"] = period
+        if game["clock"]:
+            entry["time_remaining"] = game["clock"]
+        raw.append(entry)
+    return raw
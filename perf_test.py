@@ -0,0 +1,150 @@
+"""
+On-device performance test (run_tests mode "perf"): times the hot paths on canned
+data (mock_games.py) over many iterations and prints one machine-readable line
+per measurement, so numbers from a real Matrix Portal can be collected off serial:
+
+    perf begin iterations=100 bit_depth=6
+    perf create_game_text n=100 mean_us=812 p95_us=950 max_us=1210 alloc_mean=1432 alloc_max=2100
+    perf refresh bit_depth=6 frames=100 fps=58.1 frame_us=17200
+    perf end
+
+alloc_* are bytes from gc.mem_alloc() around each call with the collector paused
+("na" where the runtime has no gc.mem_alloc, e.g. CPython). "refresh" times
+display.refresh() with auto-refresh off: how fast a changed frame reaches the
+panel driver at the configured bit depth (BIT_DEPTH).
+"""
+import asyncio
+import gc
+import time
+from config import BIT_DEPTH
+from games_processor import process_games
+from mock_games import MOCK_GAMES_BY_SPORT, raw_mock_games
+
+PERF_ITERATIONS = 100
+REFRESH_FRAMES = 100
+
+
+def _now_us():
+    return time.monotonic_ns() // 1000
+
+
+def _alloc():
+    return gc.mem_alloc() if hasattr(gc, "mem_alloc") else None
+
+
+def _today():
+    t = time.localtime()
+    return f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+
+
+class _Samples:
+    """Per-call times (us) and allocations (bytes) for one measurement."""
+
+    def __init__(self, name):
+        self.name = name
+        self.times = []
+        self.allocs = []
+
+    def line(self):
+        times = sorted(self.times)
+        n = len(times)
+        if not n:
+            return f"perf {self.name} n=0"
+        p95 = times[min(n - 1, (n * 95) // 100)]
+        out = f"perf {self.name} n={n} mean_us={sum(times) // n} p95_us={p95} max_us={times[-1]}"
+        if self.allocs:
+            out += f" alloc_mean={sum(self.allocs) // len(self.allocs)} alloc_max={max(self.allocs)}"
+        else:
+            out += " alloc_mean=na alloc_max=na"
+        return out
+
+
+def _measure(samples, fn, arg):
+    """One timed call of fn(arg) with the collector paused."""
+    gc.collect()
+    gc.disable()
+    try:
+        before = _alloc()
+        started = _now_us()
+        fn(arg)
+        samples.times.append(_now_us() - started)
+        if before is not None:
+            samples.allocs.append(_alloc() - before)
+    finally:
+        gc.enable()
+
+
+class _CannedAPI:
+    """Stands in for SportsAPI during update_games: canned raw games through process_games."""
+
+    def __init__(self, day):
+        self.day = day
+
+    async def get_games(self, sport, deadline=None):
+        return process_games(raw_mock_games(sport, self.day), sport)
+
+    def data_time(self, sport):
+        return None
+
+
+def _refresh_rate(display, frames=REFRESH_FRAMES):
+    """perf line for back-to-back display.refresh() calls (auto-refresh paused)."""
+    auto = getattr(display, "auto_refresh", True)
+    display.auto_refresh = False
+    try:
+        started = _now_us()
+        for _ in range(frames):
+            display.refresh(minimum_frames_per_second=0)
+        elapsed = max(1, _now_us() - started)
+    finally:
+        display.auto_refresh = auto
+    return f"perf refresh bit_depth={BIT_DEPTH} frames={frames} fps={frames * 1000000 / elapsed:.1f} frame_us={elapsed // frames}"
+
+
+async def run_perf_test(display_manager, iterations=PERF_ITERATIONS):
+    """Time ingest, layout, render and a full update on canned data; print perf lines."""
+    print(f"perf begin iterations={iterations} bit_depth={BIT_DEPTH}")
+    day = _today()
+    raw = [(sport, raw_mock_games(sport, day)) for sport in MOCK_GAMES_BY_SPORT]
+    games = []
+    for sport_games in MOCK_GAMES_BY_SPORT.values():
+        games.extend(sport_games)
+
+    ingest = _Samples("process_games")
+    layout = _Samples("create_game_text")
+    render = _Samples("display_scoreboard")
+    for i in range(iterations):
+        sport, raw_games = raw[i % len(raw)]
+        _measure(ingest, lambda r: process_games(r, sport), raw_games)
+        game = games[i % len(games)]
+        display_manager.current_sport = game["sport"]
+        _measure(layout, display_manager.create_game_text, game)
+        _measure(render, display_manager.display_scoreboard, display_manager.create_game_text(game))
+        if i % 10 == 9:
+            await asyncio.sleep(0)
+    for samples in (ingest, layout, render):
+        print(samples.line())
+
+    update = _Samples("update_games")
+    api = display_manager.api
+    display_manager.api = _CannedAPI(day)
+    try:
+        for i in range(iterations):
+            display_manager.current_sport = raw[i % len(raw)][0]
+            gc.collect()
+            gc.disable()
+            try:
+                before = _alloc()
+                started = _now_us()
+                await display_manager.update_games()
+                update.times.append(_now_us() - started)
+                if before is not None:
+                    update.allocs.append(_alloc() - before)
+            finally:
+                gc.enable()
+    finally:
+        display_manager.api = api
+    print(update.line())
+
+    print(_refresh_rate(display_manager.display))
+    print("perf end")
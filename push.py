@@ -0,0 +1,224 @@
+"""
+Push transport: one long-lived Server-Sent Events connection to the relay
+(host/relay.py, or the companion aggregator's /events) that streams score
+frames (score_frame.py, base64 in each event) the moment games change.
+
+  GET /events?since=NFL.3,NBA.7     resume: the relay replays missed deltas or sends snapshots
+  event: frame / data: <base64>     one frame, applied to a FrameState
+  event: ping / data: NFL.3,NBA.8   keep-alive with the relay's seqs; being behind means a lost frame
+
+Reads are non-blocking from the main loop (poll). A dropped or silent stream is
+closed and reconnected with backoff; while it is down SportsAPI falls back to polling.
+Plain HTTP only (the relay is on the LAN).
+"""
+import errno
+import time
+from binascii import a2b_base64
+from frame_state import FrameState, APPLIED, GAP, BAD, parse_cursor
+from metrics import METRICS
+from config import STREAM_IDLE_TIMEOUT
+
+CONNECT_TIMEOUT = 3    # seconds; connect runs on the main loop, keep it short
+RECONNECT_MIN = 2      # seconds before the first reconnect attempt
+RECONNECT_MAX = 60     # backoff ceiling
+READ_SIZE = 512
+MAX_PENDING = 8192     # drop the stream if a single event grows past this
+
+
+class SSEParser:
+    """Incremental text/event-stream parser: feed bytes, get (event, id, data) tuples."""
+
+    def __init__(self):
+        self._line = b""
+        self._event = ""
+        self._id = ""
+        self._data = []
+
+    @property
+    def pending(self):
+        return len(self._line) + sum(len(d) for d in self._data)
+
+    def feed(self, chunk):
+        events = []
+        lines = (self._line + chunk).split(b"\n")
+        self._line = lines.pop()
+        for raw in lines:
+            line = raw.rstrip(b"\r").decode("utf-8")
+            if not line:
+                if self._data:
+                    events.append((self._event or "message", self._id, "\n".join(self._data)))
+                self._event = ""
+                self._data = []
+                continue
+            if line.startswith(":"):
+                continue
+            field, _, value = line.partition(":")
+            if value.startswith(" "):
+                value = value[1:]
+            if field == "event":
+                self._event = value
+            elif field == "data":
+                self._data.append(value)
+            elif field == "id":
+                self._id = value
+        return events
+
+
+def _split_url(url):
+    """'http://host:port/prefix' -> (host, port, '/prefix')."""
+    if url.startswith("http://"):
+        url = url[7:]
+    host, _, path = url.partition("/")
+    name, _, port = host.partition(":")
+    return name, int(port) if port else 80, ("/" + path).rstrip("/")
+
+
+class PushStream:
+    """SSE client kept alive from the main loop; state holds the streamed games per sport."""
+
+    def __init__(self, pool, url, idle_timeout=STREAM_IDLE_TIMEOUT):
+        self._pool = pool
+        self.host, self.port, self.path = _split_url(url)
+        self.idle_timeout = idle_timeout
+        self.state = FrameState()
+        self._sock = None
+        self._parser = None
+        self._headers = b""
+        self._streaming = False
+        self._last_data = 0.0
+        self._next_attempt = 0.0
+        self._backoff = RECONNECT_MIN
+        self._buf = bytearray(READ_SIZE)
+
+    @property
+    def live(self):
+        """True while the stream is open and has sent something (data or ping) recently."""
+        return self._streaming and time.monotonic() - self._last_data < self.idle_timeout
+
+    def poll(self, now=None):
+        """Connect if due, read whatever has arrived. Returns the set of sports whose games changed."""
+        if now is None:
+            now = time.monotonic()
+        changed = set()
+        if self._sock is None:
+            if now < self._next_attempt:
+                return changed
+            self._connect(now)
+            if self._sock is None:
+                return changed
+        while self._sock is not None:
+            try:
+                size = self._sock.recv_into(self._buf)
+            except OSError as e:
+                if getattr(e, "errno", None) in (errno.EAGAIN, errno.ETIMEDOUT):
+                    break
+                self._drop(now, f"read failed: {e}")
+                break
+            if size == 0:
+                self._drop(now, "closed by relay")
+                break
+            self._last_data = now
+            self._receive(bytes(self._buf[:size]), now, changed)
+        if self._sock is not None and now - self._last_data >= self.idle_timeout:
+            self._drop(now, "no data or ping")
+        return changed
+
+    def _connect(self, now):
+        path = f"{self.path}/events"
+        cursor = self.state.cursor()
+        if cursor:
+            path += f"?since={cursor}"
+        sock = None
+        try:
+            addr = self._pool.getaddrinfo(self.host, self.port)[0][-1]
+            sock = self._pool.socket(self._pool.AF_INET, self._pool.SOCK_STREAM)
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(addr)
+            request = (
+                f"GET {path} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n"
+                "Accept: text/event-stream\r\nCache-Control: no-cache\r\n\r\n"
+            )
+            sock.send(request.encode("utf-8"))
+            sock.setblocking(False)
+        except OSError as e:
+            if sock is not None:
+                sock.close()
+            self._schedule_reconnect(now)
+            print(f"Push stream connect failed: {e}; retry in {self._next_attempt - now:.0f}s")
+            return
+        METRICS.incr("push.connects")
+        self._sock = sock
+        self._parser = SSEParser()
+        self._headers = b""
+        self._streaming = False
+        self._last_data = now
+
+    def _receive(self, data, now, changed):
+        if not self._streaming:
+            self._headers += data
+            end = self._headers.find(b"\r\n\r\n")
+            if end < 0:
+                if len(self._headers) > MAX_PENDING:
+                    self._drop(now, "bad response")
+                return
+            status_line = self._headers.split(b"\r\n", 1)[0]
+            if b" 200" not in status_line:
+                self._drop(now, f"relay answered {status_line.decode('utf-8')}")
+                return
+            data = self._headers[end + 4:]
+            self._headers = b""
+            self._streaming = True
+            self._backoff = RECONNECT_MIN
+            print(f"Push stream connected to {self.host}:{self.port}")
+        for event, _, payload in self._parser.feed(data):
+            if event == "ping":
+                for sport, seq in parse_cursor(payload).items():
+                    if self.state.seq(sport) != seq:
+                        METRICS.incr("push.gaps")
+                        self._drop(now, f"{sport} out of step with relay ({self.state.seq(sport)} vs {seq})", retry_now=True)
+                        return
+                continue
+            if event != "frame":
+                continue
+            try:
+                frame = a2b_base64(payload)
+            except ValueError:
+                METRICS.incr("push.bad_frames")
+                continue
+            sport, result = self.state.apply(frame)
+            METRICS.incr("push.frames")
+            if result == APPLIED:
+                changed.add(sport)
+            elif result == BAD:
+                METRICS.incr("push.bad_frames")
+            elif result == GAP:
+                # Reconnect at once; the cursor makes the relay fill the gap
+                METRICS.incr("push.gaps")
+                self._drop(now, f"{sport} gap after seq {self.state.seq(sport)}", retry_now=True)
+                return
+        if self._parser.pending > MAX_PENDING:
+            self._drop(now, "event too large")
+
+    def _schedule_reconnect(self, now):
+        self._next_attempt = now + self._backoff
+        self._backoff = min(self._backoff * 2, RECONNECT_MAX)
+
+    def _drop(self, now, reason, retry_now=False):
+        print(f"Push stream dropped: {reason}")
+        METRICS.incr("push.drops")
+        try:
+            self._sock.close()
+        except OSError:
+            pass
+        self._sock = None
+        self._streaming = False
+        if retry_now:
+            self._next_attempt = now
+        else:
+            self._schedule_reconnect(now)
+
+    def close(self):
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        self._streaming = False
@@ -0,0 +1,242 @@
+"""
+Pre-rendered scoreboard frames: the host lays out each game with the board's
+own code (host/renderer.py) and ships finished indexed images; the board only
+blits them (RENDER_MODE = "host").
+
+Image (version 1): width u8, height u8, colors u8, colors x RGB888, then
+run-length pairs (run 1-255, palette index) over the pixels in row-major order.
+Bundle (version 2): header magic "SMP", version u8, sport u8, count u16, then per
+game away 4s, home 4s, date 16s (NUL-padded, matched like game_key), content
+version u32 (content_version of the game the image shows), length u16, image.
+The board only blits an image whose content version matches its own data for
+the game, so a bundle rendered from an older fetch never shows an older score.
+"""
+import struct
+import displayio
+from config import DISPLAY_WIDTH, DISPLAY_HEIGHT
+from games_processor import game_key
+from metrics import METRICS
+from log import LOG
+import score_frame
+
+try:
+    import bitmaptools
+except ImportError:
+    bitmaptools = None
+
+MAGIC = b"SMP"
+VERSION = 2
+MAX_COLORS = 16  # board bitmap is 4 bits per pixel
+BUNDLE_HEADER = "<3sBBH"
+ENTRY_HEADER = "<4s4s16sIH"
+DATE_WIDTH = 16
+# Fields a frame shows that change during play, hashed as text cut to these widths (score_frame's
+# field widths, so the frame backend's truncated copies hash the same as the host's)
+CONTENT_FIELDS = (("status", 12), ("home_score", 6), ("away_score", 6), ("period", 4), ("clock", 6),
+                  ("down_distance", 12), ("possession", 4))
+
+
+def _quantize(pixels):
+    """(palette, indices): up to MAX_COLORS colors by frequency, the rest mapped to the nearest."""
+    counts = {}
+    for color in pixels:
+        counts[color] = counts.get(color, 0) + 1
+    palette = sorted(counts, key=lambda c: (-counts[c], c))[:MAX_COLORS]
+    lookup = {color: i for i, color in enumerate(palette)}
+    for color in counts:
+        if color not in lookup:
+            r, g, b = color >> 16, (color >> 8) & 0xFF, color & 0xFF
+            lookup[color] = min(range(len(palette)), key=lambda i: (
+                (r - (palette[i] >> 16)) ** 2 + (g - ((palette[i] >> 8) & 0xFF)) ** 2 + (b - (palette[i] & 0xFF)) ** 2
+            ))
+    return palette, [lookup[c] for c in pixels]
+
+
+def encode_image(pixels, width=DISPLAY_WIDTH, height=DISPLAY_HEIGHT):
+    """Encode row-major 0xRRGGBB pixels as a palette + run-length image."""
+    palette, indices = _quantize(pixels)
+    out = bytearray((width, height, len(palette)))
+    for color in palette:
+        out += bytes((color >> 16, (color >> 8) & 0xFF, color & 0xFF))
+    run_value = indices[0]
+    run = 0
+    for value in indices:
+        if value == run_value and run < 255:
+            run += 1
+        else:
+            out += bytes((run, run_value))
+            run_value = value
+            run = 1
+    out += bytes((run, run_value))
+    return bytes(out)
+
+
+def _key_fields(game):
+    return (
+        score_frame.pad_text(game.get("away_team", ""), 4),
+        score_frame.pad_text(game.get("home_team", ""), 4),
+        score_frame.pad_text(game.get("date", ""), DATE_WIDTH),
+    )
+
+
+def content_version(game):
+    """32-bit FNV-1a hash of the score, status, clock and situation a game's frame shows."""
+    count = game.get("count") or {}
+    bases = game.get("bases") or {}
+    data = b"".join(score_frame.pad_text(game.get(name), width) for name, width in CONTENT_FIELDS)
+    data += bytes((
+        count.get("balls") or 0, count.get("strikes") or 0, count.get("outs") or 0,
+        bool(bases.get("first")), bool(bases.get("second")), bool(bases.get("third")),
+    ))
+    value = 0x811C9DC5
+    for byte in data:
+        value = ((value ^ byte) * 0x01000193) & 0xFFFFFFFF
+    return value
+
+
+def encode_bundle(sport, images):
+    """Bundle [(game, image bytes)] for one sport."""
+    parts = [struct.pack(BUNDLE_HEADER, MAGIC, VERSION, score_frame.SPORTS.index(sport), len(images))]
+    for game, image in images:
+        away, home, date = _key_fields(game)
+        parts.append(struct.pack(ENTRY_HEADER, away, home, date, content_version(game), len(image)))
+        parts.append(image)
+    return b"".join(parts)
+
+
+def decode_bundle(data):
+    """(sport, {(sport, away, home, date): (content version, image memoryview)}). Raises ValueError if malformed."""
+    if len(data) < struct.calcsize(BUNDLE_HEADER):
+        raise ValueError("short bundle")
+    magic, version, sport_code, count = struct.unpack_from(BUNDLE_HEADER, data, 0)
+    if magic != MAGIC or version != VERSION or sport_code >= len(score_frame.SPORTS):
+        raise ValueError("bad bundle header")
+    sport = score_frame.SPORTS[sport_code]
+    view = memoryview(data)
+    offset = struct.calcsize(BUNDLE_HEADER)
+    entry_size = struct.calcsize(ENTRY_HEADER)
+    images = {}
+    for _ in range(count):
+        if offset + entry_size > len(data):
+            raise ValueError("truncated bundle")
+        away, home, date, content, length = struct.unpack_from(ENTRY_HEADER, data, offset)
+        offset += entry_size
+        if offset + length > len(data):
+            raise ValueError("truncated bundle")
+        key = (sport, score_frame.unpad_text(away), score_frame.unpad_text(home), score_frame.unpad_text(date))
+        images[key] = (content, view[offset:offset + length])
+        offset += length
+    return sport, images
+
+
+def image_key(game):
+    """Bundle key for a game: game_key with the date cut to the bundle's field width."""
+    sport, away, home, date = game_key(game)
+    return (sport, away, home, str(date or "")[:DATE_WIDTH])
+
+
+class FrameBlitter:
+    """One full-screen TileGrid whose bitmap and palette are overwritten by each image."""
+
+    def __init__(self, width=DISPLAY_WIDTH, height=DISPLAY_HEIGHT):
+        self.width = width
+        self.height = height
+        self.bitmap = displayio.Bitmap(width, height, MAX_COLORS)
+        self.palette = displayio.Palette(MAX_COLORS)
+        self.group = displayio.Group()
+        self.group.append(displayio.TileGrid(self.bitmap, pixel_shader=self.palette))
+        self._shown = None
+
+    def blit(self, image):
+        """Draw an encoded image. Returns False if it doesn't fit this display."""
+        image = bytes(image)
+        if len(image) < 3 or image[0] != self.width or image[1] != self.height or image[2] > MAX_COLORS:
+            return False
+        if self._shown is not None and self._shown == image:
+            return True
+        colors = image[2]
+        for i in range(colors):
+            j = 3 + i * 3
+            self.palette[i] = (image[j] << 16) | (image[j + 1] << 8) | image[j + 2]
+        bitmap = self.bitmap
+        width = self.width
+        pos = 0
+        end = self.width * self.height
+        i = 3 + colors * 3
+        while i + 1 < len(image) and pos < end:
+            run = image[i]
+            value = image[i + 1]
+            i += 2
+            while run > 0 and pos < end:
+                x = pos % width
+                y = pos // width
+                span = min(run, width - x)
+                if bitmaptools is not None:
+                    bitmaptools.fill_region(bitmap, x, y, x + span, y + 1, value)
+                else:
+                    for dx in range(span):
+                        bitmap[x + dx, y] = value
+                pos += span
+                run -= span
+        self._shown = image
+        METRICS.incr("render.blits")
+        return True
+
+
+class RemoteFrames:
+    """Fetches per-sport image bundles from the host and looks up a game's image."""
+
+    def __init__(self, session, url, timeout=5):
+        self.session = session
+        self.url = url
+        self.timeout = timeout
+        self._bundles = {}  # sport -> (ETag, {key: (content version, image)})
+
+    def fetch(self, sport, timeout=None):
+        """
+        Refresh sport's bundle (304 keeps the current one). timeout caps the request
+        (a refresh deadline's remaining time) below the default. Returns True on success.
+        """
+        previous = self._bundles.get(sport)
+        headers = {"If-None-Match": previous[0]} if previous else None
+        timeout = self.timeout if timeout is None else min(timeout, self.timeout)
+        try:
+            response = self.session.get(f"{self.url}/{sport.lower()}.img", headers=headers, timeout=timeout)
+        except Exception as e:
+            METRICS.incr("render.fetch_errors")
+            LOG.warning("Frame bundle fetch failed: %s", e)
+            return False
+        try:
+            if response.status_code == 304 and previous:
+                return True
+            if response.status_code != 200:
+                LOG.warning("Frame bundle error: %s", response.status_code)
+                return False
+            data = response.content
+            _, images = decode_bundle(data)
+            self._bundles[sport] = (response.headers.get("etag", ""), images)
+            METRICS.incr("render.bundle_bytes", len(data))
+            return True
+        except (ValueError, OSError) as e:
+            METRICS.incr("render.fetch_errors")
+            LOG.warning("Bad frame bundle: %s", e)
+            return False
+        finally:
+            response.close()
+
+    def clear(self):
+        """Drop every bundle (the next fetch downloads them again)."""
+        self._bundles = {}
+
+    def image_for(self, game):
+        """Encoded image for game from its sport's bundle, or None if there is none for its current data."""
+        bundle = self._bundles.get(game.get("sport"))
+        if bundle is None:
+            return None
+        entry = bundle[1].get(image_key(game))
+        if entry is None:
+            return None
+        if entry[0] != content_version(game):
+            METRICS.incr("render.stale_images")
+            return None
+        return entry[1]
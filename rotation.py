@@ -0,0 +1,142 @@
+"""
+Rotation scheduler: decides which game to show next and for how long.
+Games are weighted by state (live > close final > final > scheduled, with a
+bonus for close live games) and interleaved with smooth weighted round-robin.
+Weights and dwell times shrink so one full cycle fits within the active
+refresh interval; every game is still shown at least once per cycle.
+"""
+from config import ACTIVE_STATUSES, DISPLAY_INTERVAL, MIN_DWELL
+from games_processor import game_key
+
+WEIGHT_LIVE = 4
+WEIGHT_CLOSE_BONUS = 2  # Added to live games within the sport's close margin
+WEIGHT_CLOSE_FINAL = 3
+WEIGHT_FINAL = 2
+WEIGHT_SCHEDULED = 1
+
+# Dwell multiplier per show (relative to DISPLAY_INTERVAL) for games with nothing changing
+STATIC_DWELL_FACTOR = 0.7
+
+# Score margin that counts as a close game, per sport
+CLOSE_MARGIN = {"NFL": 8, "NBA": 6, "NHL": 1, "MLB": 1}
+
+
+def _margin(game):
+    try:
+        return abs(int(game.get("home_score", 0)) - int(game.get("away_score", 0)))
+    except (ValueError, TypeError):
+        return None
+
+
+def game_weight(game):
+    """Relative airtime for a game based on its status and score margin."""
+    status = game.get("status")
+    margin = _margin(game)
+    close = margin is not None and margin <= CLOSE_MARGIN.get(game.get("sport"), 1)
+    if status in ACTIVE_STATUSES:
+        return WEIGHT_LIVE + (WEIGHT_CLOSE_BONUS if close else 0)
+    if status == "Final":
+        return WEIGHT_CLOSE_FINAL if close else WEIGHT_FINAL
+    return WEIGHT_SCHEDULED
+
+
+def game_dwell(game, base_dwell):
+    """Seconds to show a game per appearance before any budget scaling."""
+    if game.get("status") in ACTIVE_STATUSES:
+        return base_dwell
+    return max(MIN_DWELL, base_dwell * STATIC_DWELL_FACTOR)
+
+
+def build_cycle(games, budget, base_dwell=DISPLAY_INTERVAL, min_dwell=MIN_DWELL):
+    """
+    Return one rotation cycle as a list of (index into games, dwell seconds).
+    Fits the cycle into budget seconds by first flattening weights toward 1 and
+    then shortening dwells down to min_dwell. If even one min_dwell show per
+    game exceeds the budget the cycle runs long rather than dropping games.
+    """
+    if not games:
+        return []
+    weights = [game_weight(g) for g in games]
+    dwells = [game_dwell(g, base_dwell) for g in games]
+
+    def cycle_time():
+        return sum(w * d for w, d in zip(weights, dwells))
+
+    # Flatten weights one step at a time, highest first, until the cycle fits
+    while cycle_time() > budget and max(weights) > 1:
+        top = max(weights)
+        weights = [w - 1 if w == top else w for w in weights]
+
+    # Then shorten dwells proportionally
+    total = cycle_time()
+    if total > budget:
+        scale = budget / total
+        dwells = [max(min_dwell, d * scale) for d in dwells]
+
+    # Smooth weighted round-robin: spreads repeated shows of a game across the cycle
+    current = [0] * len(games)
+    weight_sum = sum(weights)
+    cycle = []
+    for _ in range(weight_sum):
+        for i, w in enumerate(weights):
+            current[i] += w
+        best = 0
+        for i in range(1, len(current)):
+            if current[i] > current[best]:
+                best = i
+        current[best] -= weight_sum
+        cycle.append((best, dwells[best]))
+    return cycle
+
+
+class RotationScheduler:
+    """Walks the weighted cycle; rebuilt lazily after fetches and mode changes."""
+
+    def __init__(self, base_dwell=DISPLAY_INTERVAL, min_dwell=MIN_DWELL):
+        self.base_dwell = base_dwell
+        self.min_dwell = min_dwell
+        self._cycle = []
+        self._position = 0
+        self._valid = False
+        self._budget = None
+        self._last_key = None
+
+    def invalidate(self):
+        """Game data changed; rebuild the cycle on the next pick."""
+        self._valid = False
+
+    def reset(self):
+        """Start the next cycle from the top (sport or mode switched)."""
+        self._valid = False
+        self._position = 0
+        self._last_key = None
+
+    def next(self, games, budget):
+        """Return (index into games, dwell seconds) for the next game to show, or (None, 0)."""
+        if not games:
+            return None, 0
+        if not self._valid or budget != self._budget or not self._cycle:
+            self._rebuild(games, budget)
+        if self._position >= len(self._cycle):
+            self._position = 0
+        index, dwell = self._cycle[self._position]
+        self._position += 1
+        if index >= len(games):
+            # Filtered list shrank since the cycle was built
+            self._rebuild(games, budget)
+            index, dwell = self._cycle[0]
+            self._position = 1
+        self._last_key = game_key(games[index])
+        return index, dwell
+
+    def _rebuild(self, games, budget):
+        self._cycle = build_cycle(games, budget, self.base_dwell, self.min_dwell)
+        self._budget = budget
+        self._valid = True
+        # Resume after the last game shown instead of restarting the cycle
+        self._position = 0
+        if self._last_key is not None:
+            for pos, (index, _) in enumerate(self._cycle):
+                if game_key(games[index]) == self._last_key:
+                    self._position = pos + 1
+                    break
@@ -1,9 +1,10 @@
 """
 Unified test runner. Single entry point for all display tests.
-Modes: quick | comprehensive | status
+Modes: quick | comprehensive | status | perf
 """
 import asyncio
 from comprehensive_display_test import run_comprehensive_display_test, run_status_tests
+from perf_test import run_perf_test
 
 
 async def run_display_tests(display_manager, mode="quick"):
@@ -12,6 +13,7 @@ async def run_display_tests(display_manager, mode="quick"):
     - quick: one game per sport, short run
     - comprehensive: all sports, statuses, edge cases, modes, transitions
     - status: status-label only (Rain Delay, Postponed, etc.)
+    - perf: timings and allocations of the hot paths on canned data, as "perf ..." serial lines
     """
     if mode == "status":
         await run_status_tests(display_manager)
@@ -19,4 +21,7 @@ async def run_display_tests(display_manager, mode="quick"):
     if mode in ("quick", "comprehensive"):
         await run_comprehensive_display_test(display_manager, mode)
         return
-    print(f"Unknown test mode: {mode}. Use 'quick', 'comprehensive', or 'status'")
+    if mode == "perf":
+        await run_perf_test(display_manager)
+        return
+    print(f"Unknown test mode: {mode}. Use 'quick', 'comprehensive', 'status' or 'perf'")
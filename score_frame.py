@@ -0,0 +1,197 @@
+"""
+Compact binary score frame: one sport's processed games as fixed-width records.
+Produced by the companion aggregator (host/aggregator.py), decoded on the board
+by SportsAPI's "frame" backend with no JSON parsing.
+
+Layout (little-endian), version 1:
+  header  magic "SMF", version u8, sport u8, flags u8, seq u32, teams u8, records u16
+  teams   4-byte NUL-padded abbreviations (records refer to them by index)
+  records RECORD_FORMAT each, in display order
+Strings in records are NUL-padded to their fixed width and truncated to fit.
+"""
+import struct
+
+MAGIC = b"SMF"
+VERSION = 1
+
+SPORTS = ("NFL", "NBA", "NHL", "MLB")
+STATUSES = ("Final", "Scheduled", "In Progress", "Postponed", "Suspended", "Cancelled", "Delayed", "Unknown")
+
+FLAG_DELTA = 0x01  # Frame holds only changed records (see fanout.py); otherwise a full snapshot
+FLAG_CONT = 0x02   # With FLAG_DELTA: continuation of a snapshot split across datagrams (same seq)
+
+HEADER_FORMAT = "<3sBBBIBH"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+TEAM_WIDTH = 4
+# home id, away id, home score, away score, status, flags, count,
+# period, clock, date, down & distance, home record, away record
+RECORD_FORMAT = "<BBHHBHB4s6s16s12s8s8s"
+RECORD_SIZE = struct.calcsize(RECORD_FORMAT)
+
+# Record flag bits
+F_STOPPAGE = 0x0001
+F_TIMEOUT = 0x0002
+F_POSS_HOME = 0x0004
+F_POSS_AWAY = 0x0008
+F_FIRST = 0x0010
+F_SECOND = 0x0020
+F_THIRD = 0x0040
+F_HAS_COUNT = 0x0080
+F_HAS_BASES = 0x0100
+
+
+def pad_text(text, width):
+    data = str(text or "").encode("utf-8")[:width]
+    return data + b"\0" * (width - len(data))
+
+
+def unpad_text(data):
+    end = data.find(b"\0")
+    if end >= 0:
+        data = data[:end]
+    return data.decode("utf-8")
+
+
+def _int(value, limit=0xFFFF):
+    try:
+        return max(0, min(limit, int(value)))
+    except (ValueError, TypeError):
+        return 0
+
+
+def pack_record(game, team_ids):
+    """Pack one processed game dict into RECORD_SIZE bytes."""
+    flags = 0
+    if game.get("stoppage"):
+        flags |= F_STOPPAGE
+    if "timeout" in str(game.get("last_play", "")).lower():
+        flags |= F_TIMEOUT
+    possession = game.get("possession", "")
+    if possession and possession == game.get("home_team"):
+        flags |= F_POSS_HOME
+    elif possession and possession == game.get("away_team"):
+        flags |= F_POSS_AWAY
+    bases = game.get("bases") or {}
+    if bases:
+        flags |= F_HAS_BASES
+        if bases.get("first"):
+            flags |= F_FIRST
+        if bases.get("second"):
+            flags |= F_SECOND
+        if bases.get("third"):
+            flags |= F_THIRD
+    count = game.get("count") or {}
+    packed_count = 0
+    if count:
+        flags |= F_HAS_COUNT
+        packed_count = (
+            _int(count.get("balls", 0), 7)
+            | (_int(count.get("strikes", 0), 3) << 3)
+            | (_int(count.get("outs", 0), 3) << 5)
+        )
+    status = game.get("status", "Unknown")
+    status_code = STATUSES.index(status) if status in STATUSES else STATUSES.index("Unknown")
+    return struct.pack(
+        RECORD_FORMAT,
+        team_ids[game.get("home_team", "")],
+        team_ids[game.get("away_team", "")],
+        _int(game.get("home_score", 0)),
+        _int(game.get("away_score", 0)),
+        status_code,
+        flags,
+        packed_count,
+        pad_text(game.get("period", ""), 4),
+        pad_text(game.get("clock", ""), 6),
+        pad_text(game.get("date", ""), 16),
+        pad_text(game.get("down_distance", ""), 12),
+        pad_text(game.get("home_record", ""), 8),
+        pad_text(game.get("away_record", ""), 8),
+    )
+
+
+def team_table(games):
+    """Interned team list and {abbr: index} for a set of games."""
+    teams = []
+    ids = {}
+    for game in games:
+        for key in ("home_team", "away_team"):
+            abbr = game.get(key, "")
+            if abbr not in ids:
+                ids[abbr] = len(teams)
+                teams.append(abbr)
+    if len(teams) > 255:
+        raise ValueError("too many teams for one frame")
+    return teams, ids
+
+
+def encode(sport, seq, games, flags=0):
+    """Encode processed games for one sport into a frame (bytes)."""
+    teams, ids = team_table(games)
+    parts = [struct.pack(HEADER_FORMAT, MAGIC, VERSION, SPORTS.index(sport), flags, seq & 0xFFFFFFFF, len(teams), len(games))]
+    for abbr in teams:
+        parts.append(pad_text(abbr, TEAM_WIDTH))
+    for game in games:
+        parts.append(pack_record(game, ids))
+    return b"".join(parts)
+
+
+def decode_header(frame):
+    """Return (sport, seq, flags) without decoding records. Raises ValueError if malformed."""
+    if len(frame) < HEADER_SIZE:
+        raise ValueError("short frame")
+    magic, version, sport_code, flags, seq, _, _ = struct.unpack_from(HEADER_FORMAT, frame, 0)
+    if magic != MAGIC or version != VERSION or sport_code >= len(SPORTS):
+        raise ValueError("bad frame header")
+    return SPORTS[sport_code], seq, flags
+
+
+def decode(frame):
+    """Decode a frame into (sport, seq, flags, games) with games shaped like process_games output."""
+    sport, seq, flags = decode_header(frame)
+    _, _, _, _, _, team_count, record_count = struct.unpack_from(HEADER_FORMAT, frame, 0)
+    offset = HEADER_SIZE
+    if len(frame) < offset + team_count * TEAM_WIDTH + record_count * RECORD_SIZE:
+        raise ValueError("truncated frame")
+    teams = []
+    for _ in range(team_count):
+        teams.append(unpad_text(frame[offset:offset + TEAM_WIDTH]))
+        offset += TEAM_WIDTH
+    games = []
+    for _ in range(record_count):
+        (home_id, away_id, home_score, away_score, status_code, rflags, packed_count,
+         period, clock, date, down_distance, home_record, away_record) = struct.unpack_from(RECORD_FORMAT, frame, offset)
+        offset += RECORD_SIZE
+        home_team = teams[home_id]
+        away_team = teams[away_id]
+        possession = ""
+        if rflags & F_POSS_HOME:
+            possession = home_team
+        elif rflags & F_POSS_AWAY:
+            possession = away_team
+        count = {}
+        if rflags & F_HAS_COUNT:
+            count = {"balls": packed_count & 0x07, "strikes": (packed_count >> 3) & 0x03, "outs": (packed_count >> 5) & 0x03}
+        bases = {}
+        if rflags & F_HAS_BASES:
+            bases = {"first": bool(rflags & F_FIRST), "second": bool(rflags & F_SECOND), "third": bool(rflags & F_THIRD)}
+        games.append({
+            "sport": sport,
+            "home_team": home_team,
+            "away_team": away_team,
+            "home_score": home_score,
+            "away_score": away_score,
+            "status": STATUSES[status_code] if status_code < len(STATUSES) else "Unknown",
+            "period": unpad_text(period),
+            "clock": unpad_text(clock),
+            "stoppage": bool(rflags & F_STOPPAGE),
+            "date": unpad_text(date),
+            "venue": "",
+            "home_record": unpad_text(home_record),
+            "away_record": unpad_text(away_record),
+            "last_play": "timeout" if rflags & F_TIMEOUT else "",
+            "down_distance": unpad_text(down_distance),
+            "possession": possession,
+            "count": count,
+            "bases": bases,
+        })
+    return sport, seq, flags, games
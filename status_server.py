@@ -0,0 +1,228 @@
+"""
+Optional HTTP status endpoint (STATUS_PORT): GET /status answers one JSON document
+with the board's health, so a fleet can be checked without USB:
+
+    curl http://<board-ip>:8080/status
+
+It reports the sport and mode, games per sport and their age, fetch latency
+histograms and circuit breakers per sport, error counters, free heap and
+uptime. The server is a task that wakes every STATUS_POLL_INTERVAL seconds and
+takes one non-blocking step: accept, read or send. It never waits on a socket,
+so a slow or silent client cannot hold up rendering. One connection is served
+at a time. Each one gets STATUS_BUDGET_MS from accept to the last byte sent,
+then it is dropped. The request goes into a preallocated buffer; an oversize
+request gets 431, and a status document over STATUS_MAX_BYTES shrinks to the
+essentials.
+"""
+import asyncio
+import errno
+import gc
+import json
+import time
+from adafruit_ticks import ticks_ms, ticks_diff
+from metrics import METRICS, BUCKET_EDGES_MS
+from game_store import STORE_SPORTS
+
+REQUEST_BUFFER = 512  # bytes; request line plus headers (curl and browsers send well under this)
+LISTEN_BACKLOG = 2
+ESSENTIALS = ("uptime_s", "sport", "mode", "games", "heap_free", "truncated")  # kept when the document is over budget
+_WOULD_BLOCK = (errno.EAGAIN, errno.ETIMEDOUT)
+_REASONS = {200: "OK", 404: "Not Found", 405: "Method Not Allowed", 431: "Request Header Fields Too Large"}
+
+
+def board_status(display_manager, api, sports=STORE_SPORTS):
+    """The status document: view, per-sport games / age / latency / breaker, counters, heap, uptime."""
+    metrics = METRICS
+    breakers = api.breaker_states()
+    per_sport = {}
+    for sport in sports:
+        age = display_manager.store.age(sport)
+        entry = {
+            "games": len(display_manager.store.view(sport)),
+            "age_s": None if age is None else int(age),
+            "breaker": breakers.get(sport, {}).get("state", "closed"),
+        }
+        breaker = breakers.get(sport)
+        if breaker and breaker["last_cause"]:
+            entry["last_cause"] = breaker["last_cause"]
+            entry["retry_after_s"] = int(breaker["retry_after"])
+        histogram = metrics.histograms.get(f"api.air_ms.{sport}")
+        if histogram is not None:
+            entry["fetch_ms"] = histogram.as_dict()
+        per_sport[sport] = entry
+    counters = metrics.counters
+    status = {
+        "uptime_s": int(time.monotonic()),
+        "sport": display_manager.current_sport,
+        "mode": "all" if display_manager.show_all_games else "live",
+        "games": len(display_manager.games),
+        "sports": per_sport,
+        "bucket_edges_ms": BUCKET_EDGES_MS,
+        "errors": {name[len("api.errors."):]: n for name, n in counters.items() if name.startswith("api.errors.")},
+        "cache_hits": counters.get("api.cache_hits", 0),
+        "bytes_received": counters.get("api.bytes_received", 0),
+        "display_cycles": counters.get("display.cycles", 0),
+        "wifi_reconnects": counters.get("wifi.reconnects", 0),
+        "memory_stage": metrics.gauges.get("memory.stage", 0),
+    }
+    if hasattr(gc, "mem_free"):
+        status["heap_free"] = gc.mem_free()
+        status["heap_alloc"] = gc.mem_alloc()
+    return status
+
+
+class StatusServer:
+    """Non-blocking single-connection HTTP server for status(); drive it with poll() or run()."""
+
+    def __init__(self, pool, status, port=8080, budget_ms=2000, max_bytes=4096, host="0.0.0.0"):
+        self.pool = pool
+        self.status = status  # () -> JSON-serializable dict
+        self.port = port
+        self.host = host
+        self.budget_ms = budget_ms
+        self.max_bytes = max_bytes
+        self.enabled = True
+        self._listener = None
+        self._request = bytearray(REQUEST_BUFFER)
+        self._conn = None
+        self._started = 0
+        self._received = 0
+        self._out = None  # response bytes once the request is complete
+        self._sent = 0
+
+    def _listen(self):
+        sock = self.pool.socket(self.pool.AF_INET, self.pool.SOCK_STREAM)
+        reuse = getattr(self.pool, "SO_REUSEADDR", None)
+        if reuse is not None:
+            try:
+                sock.setsockopt(self.pool.SOL_SOCKET, reuse, 1)
+            except (OSError, AttributeError):
+                pass
+        sock.bind((self.host, self.port))
+        sock.listen(LISTEN_BACKLOG)
+        sock.setblocking(False)
+        self._listener = sock
+        print(f"Status server on port {self.port}")
+
+    def poll(self):
+        """One non-blocking step: accept a connection, read its request or send the answer."""
+        if not self.enabled:
+            return
+        try:
+            if self._listener is None:
+                self._listen()
+            if self._conn is None:
+                self._accept()
+                if self._conn is None:
+                    return
+            if ticks_diff(ticks_ms(), self._started) > self.budget_ms:
+                METRICS.incr("status.timeouts")
+                self._close()
+                return
+            if self._out is None:
+                self._read()
+            if self._out is not None:
+                self._write()
+        except OSError as e:
+            if getattr(e, "errno", None) in _WOULD_BLOCK:
+                return
+            if self._listener is None:
+                self.enabled = False
+                print(f"Status server disabled: {e}")
+                return
+            METRICS.incr("status.errors")
+            self._close()
+
+    async def run(self, interval):
+        """Poll forever, yielding to the main loop between steps."""
+        while self.enabled:
+            self.poll()
+            await asyncio.sleep(interval)
+
+    def _accept(self):
+        try:
+            conn, _ = self._listener.accept()
+        except OSError as e:
+            if getattr(e, "errno", None) in _WOULD_BLOCK:
+                return
+            raise
+        conn.setblocking(False)
+        self._conn = conn
+        self._started = ticks_ms()
+        self._received = 0
+        self._out = None
+        self._sent = 0
+
+    def _read(self):
+        if self._received >= len(self._request):
+            self._respond(431, {"error": "request too large"})
+            return
+        n = self._conn.recv_into(memoryview(self._request)[self._received:])
+        if not n:
+            self._close()  # client went away before finishing the request
+            return
+        self._received += n
+        head = bytes(memoryview(self._request)[:self._received])
+        if b"\r\n\r\n" not in head:
+            if self._received >= len(self._request):
+                self._respond(431, {"error": "request too large"})
+            return
+        parts = head.split(b"\r\n", 1)[0].split(b" ")
+        method = parts[0] if parts else b""
+        path = parts[1].split(b"?", 1)[0] if len(parts) > 1 else b""
+        if method != b"GET":
+            self._respond(405, {"error": "GET only"})
+        elif path not in (b"/", b"/status"):
+            self._respond(404, {"error": "try /status"})
+        else:
+            self._respond(200, None)
+
+    def _respond(self, code, payload):
+        if payload is None:
+            body = self._status_body()
+        else:
+            body = json.dumps(payload).encode()
+        head = (f"HTTP/1.1 {code} {_REASONS[code]}\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\nCache-Control: no-store\r\nConnection: close\r\n\r\n")
+        self._out = head.encode() + body
+        self._sent = 0
+
+    def _status_body(self):
+        """The status JSON; over max_bytes it drops the per-sport details rather than grow."""
+        try:
+            status = self.status()
+        except Exception as e:
+            METRICS.incr("status.errors")
+            return json.dumps({"error": str(e)}).encode()
+        body = json.dumps(status).encode()
+        if len(body) > self.max_bytes:
+            METRICS.incr("status.truncated")
+            for sport in status.get("sports", {}).values():
+                sport.pop("fetch_ms", None)
+            status["truncated"] = True
+            body = json.dumps(status).encode()
+        if len(body) > self.max_bytes:
+            body = json.dumps({key: status.get(key) for key in ESSENTIALS}).encode()
+        return body
+
+    def _write(self):
+        sent = self._conn.send(memoryview(self._out)[self._sent:])
+        self._sent += sent or 0
+        if self._sent >= len(self._out):
+            METRICS.incr("status.requests")
+            self._close()
+
+    def _close(self):
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except OSError:
+                pass
+        self._conn = None
+        self._out = None
+
+    def close(self):
+        self._close()
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
@@ -0,0 +1,128 @@
+"""
+Tracing spans for the main loop: `with span("fetch"):` times a phase in
+adafruit_ticks milliseconds, spans opened inside it are recorded as children
+("refresh/get_games.NFL/process_games"), and every name keeps a fixed-bucket
+histogram (metrics.Histogram) since boot. TRACER.dump() prints one line per span:
+
+    trace refresh/get_games.NFL n=6 p50_ms=500 p95_ms=1202 max_ms=1202 mean_ms=369
+
+p50/p95 are the upper edge of the bucket the percentile falls in (capped at max),
+so they are coarse but cost no per-sample storage. With TRACE_ENABLED off, span()
+hands back one shared no-op and traced() leaves functions unwrapped.
+Nesting is tracked per asyncio task, so a background fetch and the display
+phase don't adopt each other's spans.
+"""
+import asyncio
+from adafruit_ticks import ticks_ms, ticks_diff
+from config import TRACE_ENABLED
+from metrics import Histogram
+
+
+class _NoSpan:
+    """What span() returns while tracing is off."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+class _Span:
+    def __init__(self, tracer, name):
+        self.tracer = tracer
+        self.name = name
+        self.path = name
+        self.started = 0
+        self.stack = None
+
+    def __enter__(self):
+        self.stack = stack = self.tracer._stack()
+        if stack:
+            self.path = stack[-1].path + "/" + self.name
+        stack.append(self)
+        self.started = ticks_ms()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = ticks_diff(ticks_ms(), self.started)
+        if self in self.stack:
+            self.stack.remove(self)
+        self.tracer.record(self.path, elapsed)
+        if not self.stack:
+            self.tracer._drop_stack()
+        return False
+
+
+def _current_task():
+    try:
+        return asyncio.current_task()
+    except (AttributeError, RuntimeError):  # no running loop (boot, tests)
+        return None
+
+
+class Tracer:
+    """Span histograms since boot, keyed by nested span path."""
+
+    def __init__(self, enabled=TRACE_ENABLED):
+        self.enabled = enabled
+        self.histograms = {}
+        self._stacks = {}  # asyncio task (or None) -> open spans, innermost last
+
+    def span(self, name, detail=None):
+        """Context manager timing name ("get_games", "NFL" -> "get_games.NFL")."""
+        if not self.enabled:
+            return _NO_SPAN
+        return _Span(self, name if detail is None else f"{name}.{detail}")
+
+    def traced(self, name):
+        """Decorator: run a (synchronous) function inside span(name); identity when tracing is off."""
+        def wrap(fn):
+            if not self.enabled:
+                return fn
+
+            def wrapper(*args, **kwargs):
+                if not self.enabled:  # switched off since import (memory governor)
+                    return fn(*args, **kwargs)
+                with _Span(self, name):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return wrap
+
+    def record(self, path, ms):
+        histogram = self.histograms.get(path)
+        if histogram is None:
+            histogram = self.histograms[path] = Histogram()
+        histogram.add(ms)
+
+    def _stack(self):
+        task = _current_task()
+        stack = self._stacks.get(task)
+        if stack is None:
+            stack = self._stacks[task] = []
+        return stack
+
+    def _drop_stack(self):
+        self._stacks.pop(_current_task(), None)
+
+    def snapshot(self):
+        """{path: {count, p50_ms, p95_ms, max_ms, mean_ms}} (JSON-serializable)."""
+        return {path: h.as_dict() for path, h in self.histograms.items()}
+
+    def dump(self):
+        """Print every span's histogram summary to serial, one per line."""
+        for path in sorted(self.histograms):
+            h = self.histograms[path].as_dict()
+            print(f"trace {path} n={h['count']} p50_ms={h['p50_ms']} p95_ms={h['p95_ms']} max_ms={h['max_ms']} mean_ms={h['mean_ms']}")
+
+    def reset(self):
+        self.histograms = {}
+
+
+# Process-wide tracer
+TRACER = Tracer()
+span = TRACER.span
+traced = TRACER.traced